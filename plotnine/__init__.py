@@ -6,6 +6,7 @@ from .geoms import *  # noqa: F401,F403,E261
 from .ggplot import (  # noqa: F401
     ggplot,
     ggsave,
+    render_plots,
     save_as_pdf_pages,  # noqa: F401
 )
 from .guides import *  # noqa: F401,F403,E261
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import typing
-from copy import copy
+from copy import copy, deepcopy
 
+import matplotlib.collections as mcoll
+import matplotlib.lines as mlines
+import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
+import matplotlib.text as mtext
 import pandas as pd
-from matplotlib.animation import ArtistAnimation
+from matplotlib.animation import ArtistAnimation, FuncAnimation
 
 from .exceptions import PlotnineError
+from .ggplot import plot_context
 
 if typing.TYPE_CHECKING:
-    from typing import Iterable
+    from concurrent.futures import Executor, Future
+    from typing import Any, Callable, Hashable, Iterable
 
     import matplotlib as mpl
 
@@ -103,7 +109,7 @@ class PlotnineAnimation(ArtistAnimation):
             'artists': []
         }
 
-        scale_limits = dict()
+        scale_limits: dict[str, Any] = {}
 
         def initialise_artist_offsets(n: int) -> None:
             """
@@ -143,64 +149,6 @@ class PlotnineAnimation(ArtistAnimation):
                     artist_offsets[name][i] += len(new_artists)
             return frame_artists
 
-        def set_scale_limits(
-            scales: list[p9.scales.scale.scale]
-        ) -> None:
-            """
-            Set limits of all the scales in the animation
-
-            Should be called before :func:`check_scale_limits`.
-
-            Parameters
-            ----------
-            scales : list[scales]
-                List of scales the have been used in building a
-                ggplot object.
-            """
-            for sc in scales:
-                ae = sc.aesthetics[0]
-                scale_limits[ae] = sc.limits
-
-        def check_scale_limits(
-            scales: list[p9.scales.scale.scale],
-            frame_no: int
-        ) -> None:
-            """
-            Check limits of the scales of a plot in the animation
-
-            Raises a PlotnineError if any of the scales has limits
-            that do not match those of the first plot/frame.
-
-            Should be called after :func:`set_scale_limits`.
-
-            Parameters
-            ----------
-            scales : list[scales]
-                List of scales the have been used in building a
-                ggplot object.
-
-            frame_no : int
-                Frame number
-            """
-            if len(scale_limits) != len(scales):
-                raise PlotnineError(
-                    "All plots must have the same number of scales "
-                    "as the first plot of the animation."
-                )
-
-            for sc in scales:
-                ae = sc.aesthetics[0]
-                if ae not in scale_limits:
-                    raise PlotnineError(
-                        f"The plot for frame {frame_no} does not "
-                        f"have a scale for the {ae} aesthetic."
-                    )
-                if sc.limits != scale_limits[ae]:
-                    raise PlotnineError(
-                        f"The {ae} scale of plot for frame {frame_no} has "
-                        "different limits from those of the first frame."
-                    )
-
         figure: mpl.figure.Figure | None = None
         axs = []
         artists = []
@@ -216,11 +164,11 @@ class PlotnineAnimation(ArtistAnimation):
                 axs = figure.get_axes()
                 initialise_artist_offsets(len(axs))
                 scales = p._build_objs.scales
-                set_scale_limits(scales)
+                scale_limits = _scale_limits(scales)
             else:
                 p = copy(p)
                 plot = p._draw_using_figure(figure, axs)
-                check_scale_limits(plot.scales, frame_no)
+                _check_scale_limits(scale_limits, plot.scales, frame_no)
             artists.append(get_frame_artists(axs))
 
         if figure is None:
@@ -230,3 +178,342 @@ class PlotnineAnimation(ArtistAnimation):
         # Prevent Jupyter from plotting any static figure
         plt.close(figure)
         return figure, artists
+
+
+class PlotnineFuncAnimation(FuncAnimation):
+    """
+    Animation that makes the frames from ggplot objects as they are drawn
+
+    Parameters
+    ----------
+    plot_frame : callable
+        Function ``plot_frame(frame) -> ggplot`` that creates the
+        plot for a frame.
+    frames : int | iterable
+        The frames of the animation, each is passed to ``plot_frame``.
+        If an integer, the frames are ``range(frames)``.
+    interval : number, optional
+       Delay between frames in milliseconds. Defaults to 200.
+    repeat_delay : number, optional
+        If the animation in repeated, adds a delay in milliseconds
+        before repeating the animation. Defaults to `None`.
+    repeat : bool, optional
+        Controls whether the animation should repeat when the sequence
+        of frames is completed. Defaults to `True`.
+    executor : concurrent.futures.Executor, optional
+        Executor used to build the plots of the upcoming frames while
+        the current frame is drawn (and saved). The built plots are
+        returned to the animation as they are, so the executor should
+        be a :class:`~concurrent.futures.ThreadPoolExecutor`. The
+        statistics of each plot can be computed in other processes
+        with the ``executor`` option, see :mod:`plotnine.options`.
+    prebuild : int, optional
+        Number of upcoming frames to build with the ``executor``.
+        Defaults to 2.
+
+    Notes
+    -----
+    Only the plot of the first frame is drawn in full. For the rest
+    of the frames, the layers are drawn onto the axes of the first
+    frame, and the artists of the layers of the previous frame are
+    updated in place with the data (offsets, paths, colors, ...) of
+    the new frame. If the layers of the two frames do not create the
+    same kinds of artists, the artists of the previous frame are
+    replaced.
+
+    The plots and the artists of the frames are not kept, so the
+    memory used does not grow with the number of frames. Saving
+    the animation with :meth:`~matplotlib.animation.Animation.save`
+    makes and writes the frames one at a time.
+
+    The axes, legends, titles and strips of the first frame are used
+    for all the frames. So, in addition to the notes of
+    :class:`PlotnineAnimation`, the plots should have the same
+    legends, titles and facet labels.
+    """
+
+    def __init__(
+        self,
+        plot_frame: Callable[[Hashable], p9.ggplot],
+        frames: int | Iterable[Hashable],
+        interval: int = 200,
+        repeat_delay: int | None = None,
+        repeat: bool = True,
+        executor: Executor | None = None,
+        prebuild: int = 2
+    ) -> None:
+        if isinstance(frames, int):
+            frames = range(frames)
+        frames = list(frames)
+        if not frames:
+            raise PlotnineError("The animation must have a frame.")
+
+        self._plot_frame = plot_frame
+        self._frames = frames
+        self._executor = executor
+        self._prebuild = prebuild
+        self._futures: dict[Hashable, Future] = {}
+
+        # The first frame creates the figure, axes, legends, ...
+        plot = plot_frame(frames[0])
+        figure = plot.draw()
+        # Prevent Jupyter from plotting any static figure
+        plt.close(figure)
+        self._axs = figure.get_axes()
+        self._scale_limits = _scale_limits(plot._build_objs.scales)
+        self._artists = [_layer_artists(figure, ax) for ax in self._axs]
+        self._frame = frames[0]
+
+        FuncAnimation.__init__(
+            self,
+            figure,
+            self._draw_plot_frame,
+            frames=frames,
+            interval=interval,
+            repeat_delay=repeat_delay,
+            repeat=repeat,
+        )
+
+    def _draw_plot_frame(self, frame: Hashable) -> list[mpl.artist.Artist]:
+        """
+        Draw the layers of the plot for the frame
+
+        Returns
+        -------
+        out : list
+            Artists of the layers of the frame.
+        """
+        if frame != self._frame:
+            plot = self._get_built_plot(frame)
+            _check_scale_limits(self._scale_limits, plot.scales, frame)
+            with plot_context(plot):
+                artists = _draw_layers(plot, self._fig, self._axs)
+            self._artists = [
+                _update_artists(old, new)
+                for old, new in zip(self._artists, artists)
+            ]
+            self._frame = frame
+
+        return [a for lst in self._artists for a in lst]
+
+    def _get_built_plot(self, frame: Hashable) -> p9.ggplot:
+        """
+        Return the built plot for the frame
+
+        The plots of the upcoming frames are submitted to the
+        executor, so that they are built while this frame is drawn.
+        """
+        future = self._futures.pop(frame, None)
+        if self._executor is not None and self._prebuild > 0:
+            try:
+                i = self._frames.index(frame)
+            except ValueError:
+                upcoming = []
+            else:
+                upcoming = self._frames[i+1:i+1+self._prebuild]
+
+            for f in upcoming:
+                if f not in self._futures and f != frame:
+                    self._futures[f] = self._executor.submit(
+                        _build_plot, self._plot_frame, f
+                    )
+
+        if future is None:
+            return _build_plot(self._plot_frame, frame)
+        return future.result()
+
+
+def _scale_limits(scales: list[p9.scales.scale.scale]) -> dict[str, Any]:
+    """
+    Return the limits of all the scales in the animation
+
+    Parameters
+    ----------
+    scales : list[scales]
+        List of scales the have been used in building the
+        ggplot object of the first frame.
+    """
+    return {sc.aesthetics[0]: sc.limits for sc in scales}
+
+
+def _check_scale_limits(
+    scale_limits: dict[str, Any],
+    scales: list[p9.scales.scale.scale],
+    frame_no: Hashable
+) -> None:
+    """
+    Check limits of the scales of a plot in the animation
+
+    Raises a PlotnineError if any of the scales has limits
+    that do not match those of the first plot/frame.
+
+    Parameters
+    ----------
+    scale_limits : dict
+        Limits of the scales of the first frame.
+        See :func:`_scale_limits`.
+    scales : list[scales]
+        List of scales the have been used in building a
+        ggplot object.
+    frame_no : int
+        Frame number
+    """
+    if len(scale_limits) != len(scales):
+        raise PlotnineError(
+            "All plots must have the same number of scales "
+            "as the first plot of the animation."
+        )
+
+    for sc in scales:
+        ae = sc.aesthetics[0]
+        if ae not in scale_limits:
+            raise PlotnineError(
+                f"The plot for frame {frame_no} does not "
+                f"have a scale for the {ae} aesthetic."
+            )
+        if sc.limits != scale_limits[ae]:
+            raise PlotnineError(
+                f"The {ae} scale of plot for frame {frame_no} has "
+                "different limits from those of the first frame."
+            )
+
+
+def _build_plot(
+    plot_frame: Callable[[Hashable], p9.ggplot],
+    frame: Hashable
+) -> p9.ggplot:
+    """
+    Create and build the plot for a frame
+    """
+    plot = deepcopy(plot_frame(frame))
+    with plot_context(plot):
+        plot._build()
+    return plot
+
+
+def _draw_layers(
+    plot: p9.ggplot,
+    figure: mpl.figure.Figure,
+    axs: list[mpl.axes.Axes]
+) -> list[list[mpl.artist.Artist]]:
+    """
+    Draw the layers of a built plot onto the axes
+
+    Returns
+    -------
+    out : list
+        For each axes, the artists created by the layers.
+    """
+    existing = [{id(a) for a in ax.get_children()} for ax in axs]
+    plot.figure = figure
+    plot.axs = axs
+    plot._setup_parameters()
+    plot._draw_layers()
+    return [
+        [a for a in ax.get_children() if id(a) not in ids]
+        for ax, ids in zip(axs, existing)
+    ]
+
+
+def _layer_artists(
+    figure: mpl.figure.Figure,
+    ax: mpl.axes.Axes
+) -> list[mpl.artist.Artist]:
+    """
+    Return the artists of an axes drawn by the layers of a plot
+
+    These are all the artists added to the axes, except those
+    that are themed e.g. the strips.
+    """
+    themed = {
+        id(a)
+        for value in figure._themeable.values()  # type: ignore
+        for a in (value if isinstance(value, list) else [value])
+    }
+    return [
+        a
+        for name in ('collections', 'patches', 'lines', 'texts',
+                     'images', 'artists')
+        for a in getattr(ax, name)
+        if id(a) not in themed
+    ]
+
+
+def _update_artists(
+    old: list[mpl.artist.Artist],
+    new: list[mpl.artist.Artist]
+) -> list[mpl.artist.Artist]:
+    """
+    Update the old artists with the new ones
+
+    If the old & new artists are of the same kinds, the old artists
+    are updated and the new ones removed. Otherwise, the old artists
+    are removed.
+
+    Returns
+    -------
+    out : list
+        The artists that remain on the axes.
+    """
+    if (len(old) == len(new)
+            and all(_can_update(a, b) for a, b in zip(old, new))):
+        for a, b in zip(old, new):
+            _update_artist(a, b)
+            b.remove()
+        return old
+
+    for a in old:
+        a.remove()
+    return new
+
+
+def _can_update(old: mpl.artist.Artist, new: mpl.artist.Artist) -> bool:
+    """
+    Return True if the artist old can be updated with new
+    """
+    if type(old) is not type(new):
+        return False
+    elif isinstance(old, mtext.Text):
+        return old.get_bbox_patch() is None and new.get_bbox_patch() is None
+    return isinstance(old, (
+        mcoll.PathCollection,
+        mcoll.PolyCollection,
+        mcoll.LineCollection,
+        mlines.Line2D,
+        mpatches.PathPatch,
+        mpatches.Polygon
+    ))
+
+
+def _update_artist(old: mpl.artist.Artist, new: mpl.artist.Artist) -> None:
+    """
+    Set the data and properties of the artist new onto old
+    """
+    old.update_from(new)
+    old.set_zorder(new.get_zorder())
+    if isinstance(old, mcoll.Collection):
+        paths = new.get_paths()
+        if isinstance(old, mcoll.PathCollection):
+            old.set_paths(paths)
+        elif isinstance(old, mcoll.PolyCollection):
+            old.set_verts_and_codes(
+                [p.vertices for p in paths],
+                [p.codes for p in paths]
+            )
+        else:
+            old.set_segments([p.vertices for p in paths])
+
+        if isinstance(old, (mcoll.PathCollection, mcoll.PolyCollection)):
+            old.set_sizes(new.get_sizes())
+        old.set_offsets(new.get_offsets())
+        old.set_offset_transform(new.get_offset_transform())
+    elif isinstance(old, mlines.Line2D):
+        old.set_data(*new.get_data(orig=True))
+    elif isinstance(old, mtext.Text):
+        old.set_text(new.get_text())
+        old.set_position(new.get_unitless_position())
+    elif isinstance(old, mpatches.PathPatch):
+        old.set_path(new.get_path())
+    elif isinstance(old, mpatches.Polygon):
+        old.set_closed(new.get_closed())
+        old.set_xy(new.get_xy())
@@ -292,14 +292,14 @@ class facet:
                 x_vars = list(set(panel_scales_x[0].aesthetics) &
                               set(data.columns))
                 # the scale index for each data point
-                SCALE_X = _layout['SCALE_X'].iloc[match_id].tolist()
+                SCALE_X = _layout['SCALE_X'].to_numpy()[match_id]
                 panel_scales_x.train(data, x_vars, SCALE_X)
 
             if panel_scales_y:
                 y_vars = list(set(panel_scales_y[0].aesthetics) &
                               set(data.columns))
                 # the scale index for each data point
-                SCALE_Y = _layout['SCALE_Y'].iloc[match_id].tolist()
+                SCALE_Y = _layout['SCALE_Y'].to_numpy()[match_id]
                 panel_scales_y.train(data, y_vars, SCALE_Y)
 
         return self
@@ -135,13 +135,13 @@ class Layout:
             if self.panel_scales_x:
                 x_vars = list(set(self.panel_scales_x[0].aesthetics) &
                               set(data.columns))
-                SCALE_X = _layout['SCALE_X'].iloc[match_id].tolist()
+                SCALE_X = _layout['SCALE_X'].to_numpy()[match_id]
                 self.panel_scales_x.map(data, x_vars, SCALE_X)
 
             if self.panel_scales_y:
                 y_vars = list(set(self.panel_scales_y[0].aesthetics) &
                               set(data.columns))
-                SCALE_Y = _layout['SCALE_Y'].iloc[match_id].tolist()
+                SCALE_Y = _layout['SCALE_Y'].to_numpy()[match_id]
                 self.panel_scales_y.map(data, y_vars, SCALE_Y)
 
     def get_scales(self, i: int) -> pos_scales:
@@ -4,19 +4,25 @@ import typing
 from contextlib import suppress
 from typing import List
 
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.transforms import Bbox, IdentityTransform
+
 from ..iapi import strip_details, strip_label_details
+from ..options import get_option
 
 with suppress(ImportError):
     import matplotlib.patches as mpatch
     import matplotlib.text as mtext
 
 if typing.TYPE_CHECKING:
-    from typing import Literal
+    from typing import Any, Literal
 
     from plotnine.iapi import layout_details
     from plotnine.typing import (
         Axes,
         Facet,
+        Figure,
         Layout,
         Theme,
     )
@@ -203,26 +209,22 @@ class strip:
         )
         return info
 
-    def draw(self) -> None:
+    def draw(self, background: bool = True) -> None:
         """
         Create a background patch and put a label on it
+
+        Parameters
+        ----------
+        background : bool
+            Whether to create the background patch. If ``False``,
+            the background is drawn by a :class:`StripBackgrounds`
+            collection and the label is added to the figure so that
+            it is drawn on top of the collection.
         """
         themeable = self.figure._themeable  # type: ignore
         info = self.info
         ax = info.ax
 
-        rect = mpatch.FancyBboxPatch(
-            (info.box_x, info.box_y),
-            width=info.box_width,
-            height=info.box_height,
-            facecolor='lightgrey',
-            edgecolor='None',
-            transform=ax.transAxes,
-            zorder=2.2,  # > ax line & boundary
-            boxstyle='square, pad=0',
-            clip_on=False
-        )
-
         text = mtext.Text(
             info.x,  # type: ignore[arg-type]
             info.y,  # type: ignore[arg-type]
@@ -235,8 +237,22 @@ class strip:
             clip_on=False
         )
 
-        ax.add_artist(rect)
-        ax.add_artist(text)
+        if background:
+            rect = mpatch.FancyBboxPatch(
+                (info.box_x, info.box_y),
+                width=info.box_width,
+                height=info.box_height,
+                facecolor='lightgrey',
+                edgecolor='None',
+                transform=ax.transAxes,
+                zorder=2.2,  # > ax line & boundary
+                boxstyle='square, pad=0',
+                clip_on=False
+            )
+            ax.add_artist(rect)
+            ax.add_artist(text)
+        else:
+            self.figure.add_artist(text)
 
         for key in ('strip_text_x', 'strip_text_y',
                     'strip_background_x', 'strip_background_y'):
@@ -244,13 +260,96 @@ class strip:
                 themeable[key] = []
 
         if info.location == 'right':
-            themeable['strip_background_y'].append(rect)
+            if background:
+                themeable['strip_background_y'].append(rect)
             themeable['strip_text_y'].append(text)
         else:
-            themeable['strip_background_x'].append(rect)
+            if background:
+                themeable['strip_background_x'].append(rect)
             themeable['strip_text_x'].append(text)
 
 
+class StripBackgrounds(PolyCollection):
+    """
+    Backgrounds of strips drawn as one collection
+
+    The boxes are in the axes coordinates of the strips, and they
+    are transformed to figure (display) coordinates when they are
+    drawn. They follow the axes if the figure is resized or the
+    panels are moved.
+
+    Parameters
+    ----------
+    strips : list
+        Strips whose backgrounds make up the collection.
+    kwargs : dict
+        Properties of the collection.
+    """
+
+    # The position and size of the boxes are already computed from
+    # these properties of the background themeable
+    _geometry = ('x', 'y', 'width', 'height')
+
+    def __init__(self, strips: list[strip], **kwargs) -> None:
+        self._axs = [s.info.ax for s in strips]
+        self._boxes = np.array([
+            (s.info.box_x, s.info.box_y,
+             s.info.box_width, s.info.box_height)
+            for s in strips
+        ], dtype=float).reshape(-1, 4)
+        super().__init__([], transform=IdentityTransform(), **kwargs)
+
+    @classmethod
+    def can_set(cls, properties: dict[str, Any]) -> bool:
+        """
+        Return True if the properties can be set on the collection
+
+        The fancy parameters of a
+        :class:`~matplotlib.patches.FancyBboxPatch` e.g.
+        ``boxstyle``, cannot be set on a collection.
+        """
+        return all(
+            key in cls._geometry or hasattr(cls, f'set_{key}')
+            for key in properties
+        )
+
+    def set(self, **kwargs):
+        for key in self._geometry:
+            kwargs.pop(key, None)
+        return super().set(**kwargs)
+
+    def _extents(self) -> tuple[np.ndarray, ...]:
+        """
+        Return the corners of the boxes in display coordinates
+        """
+        bounds = np.array(
+            [ax.bbox.bounds for ax in self._axs],
+            dtype=float
+        ).reshape(-1, 4)
+        x0 = bounds[:, 0] + self._boxes[:, 0] * bounds[:, 2]
+        y0 = bounds[:, 1] + self._boxes[:, 1] * bounds[:, 3]
+        x1 = x0 + self._boxes[:, 2] * bounds[:, 2]
+        y1 = y0 + self._boxes[:, 3] * bounds[:, 3]
+        return x0, y0, x1, y1
+
+    def draw(self, renderer):
+        x0, y0, x1, y1 = self._extents()
+        verts = np.stack([
+            np.column_stack([x0, y0]),
+            np.column_stack([x1, y0]),
+            np.column_stack([x1, y1]),
+            np.column_stack([x0, y1]),
+        ], axis=1)
+        self.set_verts(verts)
+        super().draw(renderer)
+
+    def get_window_extent(self, renderer=None):
+        if not len(self._boxes):
+            return Bbox.null()
+        x0, y0, x1, y1 = self._extents()
+        return Bbox.from_extents(x0.min(), y0.min(), x1.max(), y1.max())
+
+
 class Strips(List[strip]):
     """
     List of strips for a plot
@@ -283,9 +382,53 @@ class Strips(List[strip]):
     def right_strips(self) -> Strips:
         return Strips([s for s in self if s.location == 'right'])
 
+    @property
+    def figure(self) -> Figure:
+        return self.facet.figure
+
     def draw(self) -> None:
-        for s in self:
-            s.draw()
+        """
+        Draw the strips
+
+        If the ``collect_strips`` option is set, the backgrounds of
+        the top strips and of the right strips are each drawn as
+        one collection, unless the theme gives them properties that
+        only a patch has.
+        """
+        if not get_option('collect_strips'):
+            for s in self:
+                s.draw()
+            return
+
+        themeable = self.figure._themeable  # type: ignore
+        resolved = self.theme.themeables.resolve()
+        for strips, name in ((self.top_strips, 'strip_background_x'),
+                             (self.right_strips, 'strip_background_y')):
+            if not strips:
+                continue
+
+            properties = {
+                key: value
+                for th in resolved if th.__class__.__name__ == name
+                for key, value in th.properties.items()
+            }
+            if not StripBackgrounds.can_set(properties):
+                for s in strips:
+                    s.draw()
+                continue
+
+            backgrounds = StripBackgrounds(
+                strips,
+                facecolor='lightgrey',
+                edgecolor='None',
+                # Below the panels, so that the backgrounds do not
+                # cover the spines and the contents of the panels
+                zorder=-1,
+            )
+            self.figure.add_artist(backgrounds)
+            for s in strips:
+                s.draw(background=False)
+            themeable[name].append(backgrounds)
 
     def generate(self) -> None:
         """
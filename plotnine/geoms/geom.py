@@ -10,6 +10,7 @@ from ..layer import layer
 from ..mapping.aes import is_valid_aesthetic, rename_aesthetics
 from ..mapping.evaluation import evaluate
 from ..positions.position import position
+from ..profiling import record
 from ..stats.stat import stat
 from ..utils import (
     Registry,
@@ -17,6 +18,7 @@ from ..utils import (
     data_mapping_as_kwargs,
     is_string,
     remove_missing,
+    split_by_column,
 )
 
 if typing.TYPE_CHECKING:
@@ -167,6 +169,21 @@ class geom(metaclass=Registry):
 
         return result
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle without the environment
+
+        The environment cannot be pickled and it is only
+        required in the process that builds the plot. This
+        makes it possible to compute the statistics in other
+        processes.
+
+        geoms should not override this method.
+        """
+        state = self.__dict__.copy()
+        state.pop('environment', None)
+        return state
+
     def setup_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Modify the data before drawing takes place
@@ -279,13 +296,16 @@ class geom(metaclass=Registry):
             includes the stacking order of the layer in
             the plot (*zorder*)
         """
-        for pid, pdata in data.groupby('PANEL'):
+        for pdata in split_by_column(data, 'PANEL'):
             if len(pdata) == 0:
                 continue
             ploc = pdata['PANEL'].iat[0] - 1
             panel_params = layout.panel_params[ploc]
             ax = layout.axs[ploc]
-            self.draw_panel(pdata, panel_params, coord, ax, **params)
+            with record('draw_panel', panel=ploc+1) as rec:
+                self.draw_panel(pdata, panel_params, coord, ax, **params)
+                if rec is not None:
+                    rec.rows = len(pdata)
 
     def draw_panel(
         self,
@@ -325,7 +345,7 @@ class geom(metaclass=Registry):
             Combined parameters for the geom and stat. Also
             includes the 'zorder'.
         """
-        for _, gdata in data.groupby('group'):
+        for gdata in split_by_column(data, 'group'):
             gdata.reset_index(inplace=True, drop=True)
             self.draw_group(gdata, panel_params, coord, ax, **params)
 
@@ -10,7 +10,7 @@ import numpy as np
 
 from ..doctools import document
 from ..exceptions import PlotnineWarning
-from ..utils import groupby_apply, resolution, to_rgba
+from ..utils import groupby_apply, resolution, rgba_array
 from .geom import geom
 
 if typing.TYPE_CHECKING:
@@ -162,8 +162,8 @@ class geom_dotplot(geom):
         **params: Any
     ) -> None:
         data = coord.transform(data, panel_params)
-        fill = to_rgba(data['fill'], data['alpha'])
-        color = to_rgba(data['color'], data['alpha'])
+        fill = rgba_array(data['fill'], data['alpha'])
+        color = rgba_array(data['color'], data['alpha'])
         ranges = coord.range(panel_params)
 
         # For perfect circles the width/height of the circle(ellipse)
@@ -17,7 +17,7 @@ else:
 
 from ..doctools import document
 from ..exceptions import PlotnineError
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, rgba_array
 from .geom import geom
 from .geom_point import geom_point
 from .geom_polygon import geom_polygon
@@ -128,7 +128,6 @@ class geom_map(geom):
 
         data.loc[data['color'].isnull(), 'color'] = 'none'
         data.loc[data['fill'].isnull(), 'fill'] = 'none'
-        data['fill'] = to_rgba(data['fill'], data['alpha'])
 
         geom_type = data.geometry.iloc[0].geom_type
         if geom_type in ('Polygon', 'MultiPolygon'):
@@ -137,7 +136,7 @@ class geom_map(geom):
             coll = PatchCollection(
                 patches,
                 edgecolor=data['color'],
-                facecolor=data['fill'],
+                facecolor=rgba_array(data['fill'], data['alpha']),
                 linestyle=data['linetype'],
                 linewidth=data['size'],
                 zorder=params['zorder'],
@@ -178,7 +177,7 @@ class geom_map(geom):
             geom_point.draw_group(data, panel_params, coord, ax, **params)
         elif geom_type in ('LineString', 'MultiLineString'):
             data['size'] *= SIZE_FACTOR
-            data['color'] = to_rgba(data['color'], data['alpha'])
+            color = rgba_array(data['color'], data['alpha'])
             segments = []
             for g in data['geometry']:
                 if g.geom_type == 'LineString':
@@ -188,7 +187,7 @@ class geom_map(geom):
 
             coll = LineCollection(
                 segments,
-                edgecolor=data['color'],
+                edgecolor=color,
                 linewidth=data['size'],
                 linestyle=data['linetype'],
                 zorder=params['zorder'],
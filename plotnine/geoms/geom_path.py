@@ -1,27 +1,31 @@
 from __future__ import annotations
 
 import typing
-from collections import Counter
 from contextlib import suppress
 from warnings import warn
 
+import matplotlib as mpl
 import matplotlib.collections as mcoll
 import matplotlib.lines as mlines
 import matplotlib.patches as mpatches
 import matplotlib.path as mpath
 import numpy as np
+import pandas as pd
 
 from ..doctools import document
 from ..exceptions import PlotnineWarning
-from ..utils import SIZE_FACTOR, make_line_segments, match, to_rgba
+from ..utils import (
+    SIZE_FACTOR,
+    group_slices,
+    match,
+    rgba_array,
+)
 from .geom import geom
 
 if typing.TYPE_CHECKING:
     from typing import Any, Literal, Sequence
 
-    import matplotlib as mpl
     import numpy.typing as npt
-    import pandas as pd
 
     import plotnine as p9
 
@@ -103,9 +107,8 @@ class geom_path(geom):
                  "group aesthetic?", PlotnineWarning)
 
         # drop lines with less than two points
-        c = Counter(data['group'])
-        counts = np.array([c[v] for v in data['group']])
-        data = data[counts >= 2]
+        counts = data.groupby('group')['group'].transform('size')
+        data = data[counts.to_numpy() >= 2]
 
         if len(data) < 2:
             return
@@ -123,7 +126,14 @@ class geom_path(geom):
         constant = len(df) == data['group'].nunique()
         params['constant'] = constant
 
-        if not constant:
+        # With constant parameters, all the paths are drawn together
+        # unless a subclass draws each group or there are arrows
+        # at the ends of each path.
+        each_group = constant and (
+            type(self).draw_group is not geom_path.draw_group or
+            params.get('arrow')
+        )
+        if not each_group:
             self.draw_group(data, panel_params, coord, ax, **params)
         else:
             for _, gdata in data.groupby('group'):
@@ -266,27 +276,25 @@ class arrow:
         last = self.ends in ('last', 'both')
 
         data = data.sort_values('group', kind='mergesort')
-        data['color'] = to_rgba(data['color'], data['alpha'])
+        data.reset_index(drop=True, inplace=True)
+        color = rgba_array(data['color'], data['alpha'])
 
         if self.type == 'open':
-            data['facecolor'] = 'none'
+            facecolor = np.zeros((len(data), 4))
         else:
-            data['facecolor'] = data['color']
+            facecolor = color
 
         if not constant:
             # Get segments/points (x1, y1) -> (x2, y2)
             # for which to calculate the arrow heads
-            idx1: list[int] = []
-            idx2: list[int] = []
-            for _, df in data.groupby('group'):
-                idx1.extend(df.index[:-1].to_list())
-                idx2.extend(df.index[1:].to_list())
+            idx1 = _segment_starts(data['group'])
+            idx2 = idx1 + 1
 
             d = dict(
                 zorder=params['zorder'],
                 rasterized=params['raster'],
-                edgecolor=data.loc[idx1, 'color'],
-                facecolor=data.loc[idx1, 'facecolor'],
+                edgecolor=color[idx1],
+                facecolor=facecolor[idx1],
                 linewidth=data.loc[idx1, 'size'],
                 linestyle=data.loc[idx1, 'linetype']
             )
@@ -311,8 +319,8 @@ class arrow:
             d = dict(
                 zorder=params['zorder'],
                 rasterized=params['raster'],
-                edgecolor=data['color'].iloc[0],
-                facecolor=data['facecolor'].iloc[0],
+                edgecolor=color[0],
+                facecolor=facecolor[0],
                 linewidth=data['size'].iloc[0],
                 linestyle=data['linetype'].iloc[0],
                 joinstyle='round',
@@ -435,35 +443,24 @@ def _draw_segments(
     Draw independent line segments between all the
     points
     """
-    color = to_rgba(data['color'], data['alpha'])
-    # All we do is line-up all the points in a group
-    # into segments, all in a single list.
-    # Along the way the other parameters are put in
-    # sequences accordingly
-    indices: list[int] = []  # for attributes of starting point of each segment
-    segments: list[float] = []
-    for _, df in data.groupby('group'):
-        idx = df.index
-        indices.extend(idx[:-1].to_list())  # One line from two points
-        x = data['x'].iloc[idx]
-        y = data['y'].iloc[idx]
-        segments.append(make_line_segments(x, y, ispath=True))
-
-    segments = np.vstack(segments)
-
-    if color is None:
-        edgecolor = color
-    else:
-        edgecolor = [color[i] for i in indices]
-
-    linewidth = data.loc[indices, 'size']
-    linestyle = data.loc[indices, 'linetype']
-
+    # Line-up all the points in a group into segments, the
+    # other parameters are those of the starting point of
+    # each segment.
+    data = data.iloc[np.argsort(data['group'].to_numpy(), kind='stable')]
+    idx = _segment_starts(data['group'])
+    x = data['x'].to_numpy()
+    y = data['y'].to_numpy()
+    segments = np.stack([
+        np.column_stack([x[idx], y[idx]]),
+        np.column_stack([x[idx+1], y[idx+1]])
+    ], axis=1)
+
+    color = rgba_array(data['color'], data['alpha'])
     coll = mcoll.LineCollection(
         segments,
-        edgecolor=edgecolor,
-        linewidth=linewidth,
-        linestyle=linestyle,
+        edgecolor=color[idx],
+        linewidth=data['size'].to_numpy()[idx],
+        linestyle=data['linetype'].to_numpy()[idx].tolist(),
         zorder=params['zorder'],
         rasterized=params['raster']
     )
@@ -476,28 +473,71 @@ def _draw_lines(
     **params: Any
 ) -> None:
     """
-    Draw a path with the same characteristics from the
+    Draw paths with the same characteristics from the
     first point to the last point
+
+    Each group is a path. A single path is drawn as a line
+    and many paths are drawn as collections of lines.
     """
-    color = to_rgba(data['color'].iloc[0], data['alpha'].iloc[0])
-    join_style = _get_joinstyle(data, params)
-    lines = mlines.Line2D(
-        data['x'],
-        data['y'],
-        color=color,
-        linewidth=data['size'].iloc[0],
-        linestyle=data['linetype'].iloc[0],
-        zorder=params['zorder'],
-        rasterized=params['raster'],
-        **join_style
-    )
-    ax.add_artist(lines)
+    codes, groups = pd.factorize(data['group'])
+    if len(groups) == 1:
+        color = rgba_array(data['color'].iloc[0], data['alpha'].iloc[0])[0]
+        join_style = _get_joinstyle(data['linetype'].iloc[0], params)
+        lines = mlines.Line2D(
+            data['x'],
+            data['y'],
+            color=color,
+            linewidth=data['size'].iloc[0],
+            linestyle=data['linetype'].iloc[0],
+            zorder=params['zorder'],
+            rasterized=params['raster'],
+            **join_style
+        )
+        ax.add_artist(lines)
+        return
+
+    order, starts, ends = group_slices(codes, len(groups))
+    xy = np.column_stack([data['x'].to_numpy(), data['y'].to_numpy()])
+    xy = xy[order]
+    first = data.iloc[order[starts]]
+    color = rgba_array(first['color'], first['alpha'])
+    linewidth = first['size'].to_numpy()
+    linetype = first['linetype'].to_numpy()
+
+    # The join & cap styles are properties of the collection,
+    # so paths that need different styles go into different
+    # collections
+    styles = [_get_collection_joinstyle(lt, params) for lt in linetype]
+    style_codes, unique_styles = pd.factorize(pd.Series(styles))
+    for i, (joinstyle, capstyle) in enumerate(unique_styles):
+        gidx = np.flatnonzero(style_codes == i)
+        coll = mcoll.LineCollection(
+            [xy[starts[j]:ends[j]] for j in gidx],
+            edgecolor=color[gidx],
+            linewidth=linewidth[gidx],
+            linestyle=linetype[gidx].tolist(),
+            joinstyle=joinstyle,
+            capstyle=capstyle,
+            zorder=params['zorder'],
+            rasterized=params['raster']
+        )
+        ax.add_collection(coll)
 
 
-def _get_joinstyle(
-    data: pd.DataFrame,
-    params: dict[str, Any]
-) -> dict[str, Any]:
+def _segment_starts(group: pd.Series) -> npt.NDArray[np.intp]:
+    """
+    Positions of the points that start the segments of paths
+
+    The points of each group must be together.
+    """
+    g = group.to_numpy()
+    return np.flatnonzero(g[:-1] == g[1:])
+
+
+def _normalise_joinstyle(params: dict[str, Any]) -> tuple[str, str]:
+    """
+    Return the matplotlib join & cap styles in the parameters
+    """
     with suppress(KeyError):
         if params['linejoin'] == 'mitre':
             params['linejoin'] = 'miter'
@@ -508,16 +548,44 @@ def _get_joinstyle(
 
     joinstyle = params.get('linejoin', 'miter')
     capstyle = params.get('lineend', 'butt')
+    return joinstyle, capstyle
+
+
+def _get_joinstyle(
+    linetype: Any,
+    params: dict[str, Any]
+) -> dict[str, Any]:
+    joinstyle, capstyle = _normalise_joinstyle(params)
     d = {}
-    if data['linetype'].iloc[0] == 'solid':
+    if linetype == 'solid':
         d['solid_joinstyle'] = joinstyle
         d['solid_capstyle'] = capstyle
-    elif data['linetype'].iloc[0] == 'dashed':
+    elif linetype == 'dashed':
         d['dash_joinstyle'] = joinstyle
         d['dash_capstyle'] = capstyle
     return d
 
 
+def _get_collection_joinstyle(
+    linetype: Any,
+    params: dict[str, Any]
+) -> tuple[str, str]:
+    """
+    Join & cap styles for a path in a collection of lines
+
+    They are the same as the styles that :func:`_get_joinstyle`
+    would set on a line.
+    """
+    if linetype in ('solid', 'dashed'):
+        return _normalise_joinstyle(params)
+
+    # The line defaults
+    rc = mpl.rcParams
+    if linetype in ('-', 'None', 'none', ' ', ''):
+        return rc['lines.solid_joinstyle'], rc['lines.solid_capstyle']
+    return rc['lines.dash_joinstyle'], rc['lines.dash_capstyle']
+
+
 def _axes_get_size_inches(ax: mpl.axes.Axes) -> tuple[float, float]:
     """
     Size of axes in inches
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import typing
 
+import matplotlib.image as mimage
 import matplotlib.lines as mlines
 import numpy as np
+import pandas as pd
 
+from ..coords import coord_cartesian
 from ..doctools import document
 from ..scales.scale_shape import FILLED_SHAPES
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, group_slices, rgba_array
 from .geom import geom
 
 if typing.TYPE_CHECKING:
@@ -15,7 +18,6 @@ if typing.TYPE_CHECKING:
 
     import matplotlib as mpl
     import matplotlib.patches
-    import pandas as pd
 
     import plotnine as p9
 
@@ -30,13 +32,21 @@ class geom_point(geom):
     Parameters
     ----------
     {common_parameters}
+    aggregate_threshold : int, optional (default: None)
+        If the number of points in a panel is larger than this,
+        the points are drawn as an image in which each pixel has
+        the composite color of the points that fall in it. The
+        pixels are about the size of the points, and the shapes
+        of the points are not drawn. Use it to draw millions of
+        points quickly and into small files. If :py:`None`, the
+        points are always drawn individually.
     """
     DEFAULT_AES = {'alpha': 1, 'color': 'black', 'fill': None,
                    'shape': 'o', 'size': 1.5, 'stroke': 0.5}
     REQUIRED_AES = {'x', 'y'}
     NON_MISSING_AES = {'color', 'shape', 'size'}
     DEFAULT_PARAMS = {'stat': 'identity', 'position': 'identity',
-                      'na_rm': False}
+                      'na_rm': False, 'aggregate_threshold': None}
 
     def draw_panel(
         self,
@@ -60,11 +70,23 @@ class geom_point(geom):
         **params: Any
     ) -> None:
         data = coord.transform(data, panel_params)
-        units = 'shape'
-        for _, udata in data.groupby(units, dropna=False):
-            udata.reset_index(inplace=True, drop=True)
-            geom_point.draw_unit(udata, panel_params, coord,
-                                 ax, **params)
+        threshold = params.get('aggregate_threshold')
+        if (threshold is not None and
+                len(data) > threshold and
+                isinstance(coord, coord_cartesian)):
+            geom_point.draw_aggregate(data, panel_params, coord, ax, **params)
+            return
+
+        # One collection of points per shape
+        codes, shapes = pd.factorize(data['shape'], sort=True)
+        if len(shapes) == 1:
+            geom_point.draw_unit(data, panel_params, coord, ax, **params)
+            return
+
+        order, starts, ends = group_slices(codes, len(shapes))
+        for start, end in zip(starts, ends):
+            udata = data.take(order[start:end])
+            geom_point.draw_unit(udata, panel_params, coord, ax, **params)
 
     @staticmethod
     def draw_unit(
@@ -81,34 +103,98 @@ class geom_point(geom):
         # be in points must scaled using sqrt(pi)
         size = ((data['size']+data['stroke'])**2)*np.pi
         stroke = data['stroke'] * SIZE_FACTOR
-        color = to_rgba(data['color'], data['alpha'])
-        shape = data.loc[0, 'shape']
+        color = rgba_array(data['color'], data['alpha'])
+        shape = data['shape'].iat[0]
 
         # It is common to forget that scatter points are
         # filled and slip-up by manually assigning to the
         # color instead of the fill. We forgive.
         if shape in FILLED_SHAPES:
-            if all(c is None for c in data['fill']):
+            if data['fill'].isnull().all():
                 fill = color
             else:
-                fill = to_rgba(data['fill'], data['alpha'])
+                fill = rgba_array(data['fill'], data['alpha'])
         else:
             # Assume unfilled
             fill = color
             color = None
 
         ax.scatter(
-            x=data['x'],
-            y=data['y'],
-            s=size,
+            x=data['x'].to_numpy(),
+            y=data['y'].to_numpy(),
+            s=size.to_numpy(),
             facecolor=fill,
             edgecolor=color,
-            linewidth=stroke,
+            linewidth=stroke.to_numpy(),
             marker=shape,
             zorder=params['zorder'],
             rasterized=params['raster']
         )
 
+    @staticmethod
+    def draw_aggregate(
+        data: pd.DataFrame,
+        panel_params: p9.iapi.panel_view,
+        coord: p9.coords.coord.coord,
+        ax: mpl.axes.Axes,
+        **params: Any
+    ) -> None:
+        """
+        Draw the points as an image of their composite colors
+
+        The image has cells about the size of the points. The
+        color of a cell is the mean of the colors of the points
+        in it, and the opacity is that of the points drawn on
+        top of each other.
+        """
+        # The visible color of a point
+        color = rgba_array(data['color'], data['alpha'])
+        filled = data['shape'].isin(FILLED_SHAPES).to_numpy()
+        filled &= data['fill'].notnull().to_numpy()
+        if filled.any():
+            fill = rgba_array(data['fill'], data['alpha'])
+            color[filled] = fill[filled]
+
+        # Size of the cells, the points are about this big
+        dpi = ax.figure.dpi
+        bbox = ax.get_window_extent()
+        diameter = np.median(data['size'] + data['stroke'])
+        diameter = diameter * np.sqrt(np.pi) * dpi / 72
+        ncol = max(int(bbox.width / diameter), 1)
+        nrow = max(int(bbox.height / diameter), 1)
+
+        xmin, xmax = panel_params.x.range
+        ymin, ymax = panel_params.y.range
+        col = (data['x'].to_numpy() - xmin) / (xmax - xmin) * ncol
+        row = (data['y'].to_numpy() - ymin) / (ymax - ymin) * nrow
+        inside = (col >= 0) & (col < ncol) & (row >= 0) & (row < nrow)
+        cell = (row[inside].astype(int) * ncol + col[inside].astype(int))
+        color = color[inside]
+
+        n = nrow * ncol
+        alpha = color[:, 3]
+        count = np.bincount(cell, minlength=n)
+        alpha_sum = np.bincount(cell, weights=alpha, minlength=n)
+        X = np.zeros((n, 4))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in range(3):
+                rgb_sum = np.bincount(
+                    cell, weights=color[:, i] * alpha, minlength=n)
+                X[:, i] = rgb_sum / alpha_sum
+            X[:, 3] = 1 - (1 - alpha_sum / count) ** count
+        X[alpha_sum == 0] = 0
+
+        im = mimage.AxesImage(
+            ax,
+            data=X.reshape(nrow, ncol, 4),
+            interpolation='nearest',
+            origin='lower',
+            extent=(xmin, xmax, ymin, ymax),
+            rasterized=True,
+            zorder=params['zorder']
+        )
+        ax.add_image(im)
+
     @staticmethod
     def draw_legend(
         data: pd.Series[Any],
@@ -7,7 +7,7 @@ from matplotlib.collections import PolyCollection
 from matplotlib.patches import Rectangle
 
 from ..doctools import document
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, rgba_array, to_rgba
 from .geom import geom
 
 if typing.TYPE_CHECKING:
@@ -69,23 +69,18 @@ class geom_polygon(geom):
 
         # Each group is a polygon with a single facecolor
         # with potentially an edgecolor for every edge.
-        verts = []
-        facecolor = []
-        edgecolor = []
-        linestyle = []
-        linewidth = []
-
         # Some stats may order the data in ways that prevent
         # objects from occluding other objects. We do not want
         # to undo that order.
         grouper = data.groupby('group', sort=False)
-        for group, df in grouper:
-            fill = to_rgba(df['fill'].iloc[0], df['alpha'].iloc[0])
-            verts.append(tuple(zip(df['x'], df['y'])))
-            facecolor.append('none' if fill is None else fill)
-            edgecolor.append(df['color'].iloc[0] or 'none')
-            linestyle.append(df['linetype'].iloc[0])
-            linewidth.append(df['size'].iloc[0])
+        verts = [tuple(zip(df['x'], df['y'])) for _, df in grouper]
+
+        # The first row of each group, in the same order
+        first = data.drop_duplicates('group')
+        facecolor = rgba_array(first['fill'], first['alpha'])
+        edgecolor = [c or 'none' for c in first['color']]
+        linestyle = first['linetype'].tolist()
+        linewidth = first['size'].tolist()
 
         col = PolyCollection(
             verts,
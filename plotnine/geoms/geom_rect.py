@@ -7,7 +7,7 @@ import pandas as pd
 from matplotlib.collections import PolyCollection
 
 from ..doctools import document
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, rgba_array
 from .geom import geom
 from .geom_polygon import geom_polygon
 
@@ -77,7 +77,7 @@ class geom_rect(geom):
             for (l, r, b, t) in limits
         ]
 
-        fill = to_rgba(data['fill'], data['alpha'])
+        fill = rgba_array(data['fill'], data['alpha'])
         color = data['color']
 
         # prevent unnecessary borders
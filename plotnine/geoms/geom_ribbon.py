@@ -6,7 +6,7 @@ from contextlib import suppress
 from ..coords import coord_flip
 from ..doctools import document
 from ..exceptions import PlotnineError
-from ..utils import SIZE_FACTOR, to_rgba
+from ..utils import SIZE_FACTOR, rgba_array
 from .geom import geom
 from .geom_path import geom_path
 from .geom_polygon import geom_polygon
@@ -108,16 +108,13 @@ class geom_ribbon(geom):
         **params: Any
     ) -> None:
         size = data['size'].iloc[0] * SIZE_FACTOR
-        fill = to_rgba(data['fill'], data['alpha'])
+        fill = rgba_array(data['fill'], data['alpha'])
 
         if data['color'].isnull().all():
             color: ColorsLike = 'none'
         else:
             color = data['color']
 
-        if fill is None:
-            fill = 'none'
-
         if isinstance(coord, coord_flip):
             fill_between = ax.fill_betweenx
             _x, _min, _max = data['y'], data['xmin'], data['xmax']
@@ -7,7 +7,7 @@ import numpy as np
 
 from ..coords import coord_flip
 from ..doctools import document
-from ..utils import SIZE_FACTOR, make_line_segments, to_rgba
+from ..utils import SIZE_FACTOR, make_line_segments, rgba_array
 from .geom import geom
 from .geom_path import geom_path
 
@@ -99,7 +99,7 @@ class geom_rug(geom):
                 y = np.repeat(data['y'].to_numpy(), 2)
                 rugs.extend(make_line_segments(x, y, ispath=False))
 
-        color = to_rgba(data['color'], data['alpha'])
+        color = rgba_array(data['color'], data['alpha'])
         coll = mcoll.LineCollection(
             rugs,
             edgecolor=color,
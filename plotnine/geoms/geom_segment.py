@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 
 from ..doctools import document
-from ..utils import SIZE_FACTOR, interleave, make_line_segments, to_rgba
+from ..utils import SIZE_FACTOR, interleave, make_line_segments, rgba_array
 from .geom import geom
 from .geom_path import geom_path
 
@@ -59,7 +59,7 @@ class geom_segment(geom):
     ) -> None:
         data = coord.transform(data, panel_params)
         data['size'] *= SIZE_FACTOR
-        color = to_rgba(data['color'], data['alpha'])
+        color = rgba_array(data['color'], data['alpha'])
 
         # start point -> end point, sequence of xy points
         # from which line segments are created
@@ -16,7 +16,7 @@ else:
 from ..doctools import document
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..positions import position_nudge
-from ..utils import order_as_data_mapping, to_rgba
+from ..utils import order_as_data_mapping, rgba_array
 from .geom import geom
 
 if typing.TYPE_CHECKING:
@@ -176,7 +176,7 @@ class geom_text(geom):
         data = coord.transform(data, panel_params)
 
         # Bind color and alpha
-        color = to_rgba(data['color'], data['alpha'])
+        color = rgba_array(data['color'], data['alpha'])
 
         # Create a dataframe for the plotting data required
         # by ax.text
@@ -184,7 +184,7 @@ class geom_text(geom):
         df['s'] = data['label']
         df['rotation'] = data['angle']
         df['linespacing'] = data['lineheight']
-        df['color'] = color
+        df['color'] = list(color)
         df['ha'] = data['ha']
         df['va'] = data['va']
         df['family'] = params['family']
@@ -197,10 +197,8 @@ class geom_text(geom):
         # 'boxstyle' indicates geom_label so we need an MPL bbox
         draw_label = 'boxstyle' in params
         if draw_label:
-            fill = to_rgba(data.pop('fill'), data['alpha'])
-            if isinstance(fill, tuple):
-                fill = [list(fill)] * len(data['x'])
-            df['facecolor'] = fill
+            fill = rgba_array(data.pop('fill'), data['alpha'])
+            df['facecolor'] = list(fill)
 
             if params['boxstyle'] in ('round', 'round4'):
                 boxstyle = '{},pad={},rounding_size={}'.format(
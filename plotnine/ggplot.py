@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import importlib
+import os
+import pickle
+import re
 import sys
+import threading
+import timeit
 import typing
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Sequence, Sized
+from concurrent.futures import Future, ProcessPoolExecutor
 from copy import deepcopy
+from io import BytesIO
 from itertools import chain
 from pathlib import Path
+from types import ModuleType
 from types import SimpleNamespace as NS
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 from warnings import warn
 
 import matplotlib as mpl
@@ -15,6 +25,7 @@ import matplotlib.figure
 import matplotlib.pyplot as plt
 import matplotlib.transforms as mtransforms
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.offsetbox import AnchoredOffsetbox
 from patsy.eval import EvalEnvironment
@@ -31,7 +42,9 @@ from .guides.guides import guides
 from .iapi import mpl_save_view
 from .layer import Layers
 from .mapping.aes import aes, make_labels
+from .mapping.evaluation import stage
 from .options import SUBPLOTS_ADJUST, get_option
+from .profiling import profile_plot, profile_report, profiler, record
 from .scales.scales import Scales
 from .themes.theme import theme, theme_get
 from .utils import (
@@ -43,6 +56,8 @@ from .utils import (
 )
 
 if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     import plotnine as p9
 
     from .typing import DataLike, PlotAddable
@@ -134,6 +149,49 @@ class ggplot:
 
         return result
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle with only the variables of the environment it uses
+
+        The environment is made up of whole namespaces, which cannot
+        be pickled. It is replaced with the variables whose names
+        appear in the expressions of the plot and are not columns
+        of the data. Modules are pickled by name, and variables that
+        cannot be pickled are left out. The figure is not pickled.
+        """
+        state = self.__dict__.copy()
+        state.pop('figure', None)
+        state.pop('axs', None)
+        namespace = self.environment.namespace
+        columns = _data_columns(self)
+        variables, modules = {}, {}
+        for name in _expression_names(self) - columns:
+            if name in namespace:
+                value = namespace[name]
+                if isinstance(value, ModuleType):
+                    modules[name] = value.__name__
+                    continue
+
+                # If the plot uses it, evaluating the expression
+                # fails when the plot is drawn.
+                try:
+                    pickle.dumps(value)
+                except Exception:
+                    continue
+                variables[name] = value
+        state['environment'] = (variables, modules, self.environment.flags)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Unpickle and recreate the environment
+        """
+        variables, modules, flags = state['environment']
+        for name, module in modules.items():
+            variables[name] = importlib.import_module(module)
+        state['environment'] = EvalEnvironment([variables], flags)
+        self.__dict__.update(state)
+
     def __iadd__(
         self,
         other: PlotAddable | list[PlotAddable] | None
@@ -186,7 +244,11 @@ class ggplot:
             raise TypeError(msg.format(type(other)))
         return self
 
-    def draw(self, show: bool = False) -> mpl.figure.Figure:
+    def draw(
+        self,
+        show: bool = False,
+        executor: Executor | None = None
+    ) -> mpl.figure.Figure:
         """
         Render the complete plot
 
@@ -194,6 +256,10 @@ class ggplot:
         ----------
         show : bool (default: False)
             Whether to show the plot.
+        executor : concurrent.futures.Executor, optional
+            Executor used to compute the statistics of the
+            panels in parallel. If ``None``, the ``executor``
+            option is used. See :mod:`plotnine.options`.
 
         Returns
         -------
@@ -210,29 +276,62 @@ class ggplot:
         # ggplot object. Do the copy here as we may/may not
         # assign a default theme
         self = deepcopy(self)
-        with plot_context(self, show=show):
-            self._build()
+        with profile_plot(), plot_context(self, show=show):
+            with record('build'):
+                self._build(executor)
 
             # setup
-            figure, axs = self._create_figure()
-            self._setup_parameters()
-            self.facet.strips.generate()  # type: ignore[attr-defined]
-            self._resize_panels()
+            with record('create_figure'):
+                figure, axs = self._create_figure(show)
+                self._setup_parameters()
+            with record('generate_strips'):
+                self.facet.strips.generate()  # type: ignore[attr-defined]
+            with record('resize_panels'):
+                self._resize_panels()
 
             # Drawing
-            self._draw_layers()
-            self._draw_labels()
-            self._draw_breaks_and_labels()
-            self._draw_legend()
-            self._draw_title()
-            self._draw_caption()
-            self._draw_watermarks()
+            with record('draw_layers'):
+                self._draw_layers()
+            with record('draw_labels'):
+                self._draw_labels()
+            with record('draw_breaks_and_labels'):
+                self._draw_breaks_and_labels()
+            with record('draw_legend'):
+                self._draw_legend()
+            with record('draw_title'):
+                self._draw_title()
+            with record('draw_caption'):
+                self._draw_caption()
+            with record('draw_watermarks'):
+                self._draw_watermarks()
 
             # Artist object theming
-            self.theme.apply(figure, axs)
+            with record('apply_theme'):
+                self.theme.apply(figure, axs)
 
         return self.figure
 
+    def profile(self, memory: bool = False) -> profile_report:
+        """
+        Draw the plot and measure the time spent in each stage
+
+        Parameters
+        ----------
+        memory : bool (default: False)
+            Whether to also measure the peak memory allocated
+            in each stage. This slows down the plotting.
+
+        Returns
+        -------
+        out : ~plotnine.profiling.profile_report
+            Measurements for the stages of the build, with a
+            breakdown for each layer and panel, and for the
+            drawing steps.
+        """
+        with profiler(memory=memory) as prof:
+            self.draw()
+        return prof.report
+
     def _draw_using_figure(self, figure, axs):
         """
         Draw onto already created figure and axes
@@ -262,10 +361,16 @@ class ggplot:
 
         return self
 
-    def _build(self):
+    def _build(self, executor: Executor | None = None):
         """
         Build ggplot for rendering.
 
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor, optional
+            Executor used to compute the statistics. If ``None``,
+            the ``executor`` option is used.
+
         Notes
         -----
         This method modifies the ggplot object. The caller is
@@ -288,7 +393,8 @@ class ggplot:
 
         # Initialise panels, add extra data for margins & missing
         # facetting variables, and add on a PANEL variable to data
-        layout.setup(layers, self)
+        with record('layout.setup'):
+            layout.setup(layers, self)
 
         # Compute aesthetics to produce data with generalised
         # variable names
@@ -302,11 +408,15 @@ class ggplot:
 
         # Map and train positions so that statistics have access
         # to ranges and all positions are numeric
-        layout.train_position(layers, scales)
-        layout.map_position(layers)
+        with record('layout.train_position'):
+            layout.train_position(layers, scales)
+        with record('layout.map_position'):
+            layout.map_position(layers)
 
         # Apply and map statistics
-        layers.compute_statistic(layout)
+        if executor is None:
+            executor = get_option('executor')
+        layers.compute_statistic(layout, executor)
         layers.map_statistic(self)
 
         # Prepare data in geoms
@@ -320,8 +430,10 @@ class ggplot:
         # ensures that facets have control over the range of
         # a plot.
         layout.reset_position_scales()
-        layout.train_position(layers, scales)
-        layout.map_position(layers)
+        with record('layout.train_position'):
+            layout.train_position(layers, scales)
+        with record('layout.map_position'):
+            layout.map_position(layers)
 
         # Train and map non-position scales
         npscales = scales.non_position_scales()
@@ -330,7 +442,8 @@ class ggplot:
             layers.map(npscales)
 
         # Train coordinate system
-        layout.setup_panel_params(self.coordinates)
+        with record('layout.setup_panel_params'):
+            layout.setup_panel_params(self.coordinates)
 
         # fill in the defaults
         layers.use_defaults()
@@ -339,7 +452,8 @@ class ggplot:
         layers.finish_statistics()
 
         # Allow layout to modify data before rendering
-        layout.finish_data(layers)
+        with record('layout.finish_data'):
+            layout.finish_data(layers)
 
     def _setup_parameters(self):
         """
@@ -352,15 +466,28 @@ class ggplot:
         # theme
         self.theme.figure = self.figure
 
-    def _create_figure(self):
+    def _create_figure(self, show=False):
         """
         Create Matplotlib figure and axes
+
+        Parameters
+        ----------
+        show : bool (default: False)
+            Whether the figure will be shown. Only a figure
+            that will be shown is created with (and managed by)
+            pyplot. Otherwise, the figure has an Agg canvas
+            and no state is shared with other figures.
         """
         # Good for development
         if get_option('close_all_figures'):
             plt.close('all')
 
-        figure = plt.figure()
+        if show:
+            figure = plt.figure()
+        else:
+            figure = mpl.figure.Figure()
+            FigureCanvasAgg(figure)
+
         axs = self.facet.make_axes(
             figure,
             self.layout.layout,
@@ -728,9 +855,10 @@ class ggplot:
 
         Parameters
         ----------
-        filename : str | pathlib.Path, optional
+        filename : str | pathlib.Path | file-like, optional
             File name to write the plot to. If not specified, a name
-            like “plotnine-save-<hash>.<format>” is used.
+            like “plotnine-save-<hash>.<format>” is used. For a
+            file-like object, the `format` should be given.
         format : str
             Image format to use, automatically extract from
             file name extension.
@@ -758,19 +886,53 @@ class ggplot:
         kwargs : dict
             Additional arguments to pass to matplotlib `savefig()`.
         """
-        sv = self.save_helper(
-            filename=filename,
-            format=format,
-            path=path,
-            width=width,
-            height=height,
-            units=units,
-            dpi=dpi,
-            limitsize=limitsize,
-            verbose=verbose,
-            **kwargs
-        )
-        sv.figure.savefig(**sv.kwargs)
+        with profile_plot():
+            sv = self.save_helper(
+                filename=filename,
+                format=format,
+                path=path,
+                width=width,
+                height=height,
+                units=units,
+                dpi=dpi,
+                limitsize=limitsize,
+                verbose=verbose,
+                **kwargs
+            )
+            with record('savefig'):
+                sv.figure.savefig(**sv.kwargs)
+            # Release the artists (and their data) now, instead of
+            # when the garbage collector breaks the reference cycles
+            sv.figure.clear()
+
+    def to_bytes(self, format: str = 'png', **kwargs: Any) -> bytes:
+        """
+        Render the plot to an image in memory
+
+        The figure is not created with pyplot and it is released
+        after it is saved, so plots can be rendered from the
+        threads of a server.
+
+        Parameters
+        ----------
+        format : str (default: 'png')
+            Image format. Any format supported by matplotlib
+            e.g. png, svg & pdf.
+        kwargs : dict
+            Other arguments of :meth:`ggplot.save` e.g. `width`,
+            `height`, `units`, `dpi` and the arguments of
+            matplotlib `savefig()`. `verbose` defaults to
+            ``False``.
+
+        Returns
+        -------
+        out : bytes
+            Contents of the image file
+        """
+        kwargs.setdefault('verbose', False)
+        buf = BytesIO()
+        self.save(buf, format=format, **kwargs)
+        return buf.getvalue()
 
 
 ggsave = ggplot.save
@@ -781,6 +943,8 @@ def save_as_pdf_pages(
     filename: str | None = None,
     path: str | None = None,
     verbose: bool = True,
+    executor: Executor | None = None,
+    prerender: int = 2,
     **kwargs: Any
 ) -> None:
     """
@@ -810,7 +974,15 @@ def save_as_pdf_pages(
         Path to save plot to (if you just want to set path and
         not filename).
     verbose : :py:class:`bool`
-        If ``True``, print the saving information.
+        If ``True``, print the saving information, including the
+        number of pages saved per second.
+    executor : :class:`concurrent.futures.Executor`, optional
+        Executor used to draw the upcoming plots while the current
+        page is written to the file. For a process pool, the plots
+        and figures are pickled.
+    prerender : :py:class:`int`
+        Maximum number of plots drawn ahead of the page being
+        written when there is an `executor`.
     kwargs : :py:class:`dict`
         Additional arguments to pass to
         :py:meth:`matplotlib.figure.Figure.savefig`.
@@ -863,12 +1035,270 @@ def save_as_pdf_pages(
     if verbose:
         warn(f'Filename: {filename}', PlotnineWarning)
 
+    start = timeit.default_timer()
+    n = 0
     with PdfPages(filename) as pdf:
-        # Re-add the first element to the iterator, if it was removed
-        for plot in plots:
-            fig = plot.draw()
+        for fig in _draw_plots(plots, executor, prerender):
             # Save as a page in the PDF file
             pdf.savefig(fig, **fig_kwargs)
+            # Release the page, the memory should not grow with
+            # the number of pages
+            fig.clear()
+            n += 1
+
+    if verbose:
+        duration = timeit.default_timer() - start
+        warn(
+            f'Saved {n} pages in {duration:.1f}s '
+            f'({n/duration:.1f} pages/s).',
+            PlotnineWarning
+        )
+
+
+def _draw_plots(
+    plots: Iterable[ggplot],
+    executor: Executor | None = None,
+    prerender: int = 2
+) -> Iterator[mpl.figure.Figure]:
+    """
+    Draw plots and yield the figures in order
+
+    With an executor, up to `prerender` plots are drawn ahead
+    of the figure that has been yielded.
+    """
+    if executor is None:
+        for plot in plots:
+            yield plot.draw()
+        return
+
+    pending: deque[Future[mpl.figure.Figure]] = deque()
+    for plot in plots:
+        pending.append(executor.submit(plot.draw))
+        if len(pending) > prerender:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def render_plots(
+    plots: Iterable[ggplot],
+    filenames: Iterable[str | Path] | None = None,
+    format: str | None = None,
+    max_workers: int | None = None,
+    max_tasks_per_child: int | None = 100,
+    **kwargs: Any
+) -> list[bytes] | None:
+    """
+    Render many :class:`ggplot` objects in parallel processes
+
+    Parameters
+    ----------
+    plots : collection or generator of :class:`ggplot`
+        Plot objects to render. They are pickled and sent to the
+        worker processes, a few at a time.
+    filenames : collection or generator of str | pathlib.Path, optional
+        File names to write the plots to, one for each plot. If not
+        given, the rendered images are returned.
+    format : str, optional
+        Image format. If not given, it is extracted from the file
+        names, and when there are no file names it is ``'png'``.
+    max_workers : int, optional
+        Number of worker processes. The default is the number of
+        processors on the machine.
+    max_tasks_per_child : int, optional (default: 100)
+        Number of plots a worker process renders before it is
+        replaced by a new one, which bounds the memory that a
+        worker can accumulate. If ``None``, the workers live as
+        long as the pool. It requires Python 3.11 or later, and
+        is ignored for older versions.
+    kwargs : dict
+        Other arguments of :meth:`ggplot.save` e.g. `width`,
+        `height`, `units`, `dpi` and the arguments of
+        matplotlib `savefig()`. `verbose` defaults to ``False``.
+
+    Returns
+    -------
+    out : list | None
+        Contents of the image files, in the order of the plots.
+        If there are `filenames`, ``None``.
+
+    Raises
+    ------
+    PlotnineError
+        If the number of `filenames` is not the number of plots.
+
+    Notes
+    -----
+    The worker processes import plotnine & matplotlib when they
+    start. If the start method of the processes is *spawn* (the
+    default on Windows and macOS, and when `max_tasks_per_child`
+    is used), the script that calls this function must guard its
+    entry point with ``if __name__ == '__main__':``.
+
+    Only the variables of the calling environment whose names
+    appear in the aesthetic mappings, facets and parameters of
+    the layers are sent with the plots.
+
+    See Also
+    --------
+    ggplot.to_bytes : Render a plot in this process
+    """
+    kwargs.setdefault('verbose', False)
+    if filenames is None:
+        tasks = ((plot, None) for plot in plots)
+        format = format or 'png'
+    else:
+        tasks = _pair_filenames(plots, filenames)
+
+    options: dict[str, Any] = {}
+    if max_tasks_per_child is not None and sys.version_info >= (3, 11):
+        options['max_tasks_per_child'] = max_tasks_per_child
+
+    # The plots are submitted as the earlier ones are rendered so
+    # that the pending plots (and images) do not grow with the
+    # number of plots
+    n = max_workers or os.cpu_count() or 1
+    pending: deque[Future[bytes | None]] = deque()
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_render_process,
+        **options
+    ) as executor:
+        for plot, filename in tasks:
+            pending.append(
+                executor.submit(_render, plot, filename, format, kwargs)
+            )
+            if len(pending) > 2 * n:
+                results.append(pending.popleft().result())
+        results.extend(future.result() for future in pending)
+
+    if filenames is None:
+        return results
+
+
+def _pair_filenames(
+    plots: Iterable[ggplot],
+    filenames: Iterable[str | Path]
+) -> Iterator[tuple[ggplot, str | Path]]:
+    """
+    Pair the plots with their filenames
+
+    Raises
+    ------
+    PlotnineError
+        If the number of filenames is not the number of plots.
+        When either is a generator, it is raised when the shorter
+        one is exhausted.
+    """
+    msg = "There are {} plots and {} filenames."
+    if isinstance(plots, Sized) and isinstance(filenames, Sized):
+        if len(plots) != len(filenames):
+            raise PlotnineError(msg.format(len(plots), len(filenames)))
+
+    iplots, ifilenames = iter(plots), iter(filenames)
+    n = 0
+    for n, plot in enumerate(iplots, start=1):
+        try:
+            filename = next(ifilenames)
+        except StopIteration:
+            raise PlotnineError(
+                msg.format(f'at least {n}', n-1)
+            ) from None
+        yield plot, filename
+
+    remaining = sum(1 for _ in ifilenames)
+    if remaining:
+        raise PlotnineError(msg.format(n, n + remaining))
+
+
+def _init_render_process():
+    """
+    Import the modules used to render plots in a worker process
+
+    They are imported once, when the process starts, instead of
+    when it renders the first plot.
+    """
+    import matplotlib.backends.backend_pdf  # noqa: F401
+    import matplotlib.backends.backend_svg  # noqa: F401
+    import matplotlib.font_manager  # noqa: F401
+
+    import plotnine  # noqa: F401
+
+
+def _render(
+    plot: ggplot,
+    filename: str | Path | None,
+    format: str | None,
+    kwargs: dict[str, Any]
+) -> bytes | None:
+    """
+    Render a plot to a file or to bytes
+
+    This is the task that :func:`render_plots` runs in the
+    worker processes.
+    """
+    if filename is None:
+        return plot.to_bytes(format, **kwargs)
+    plot.save(filename, format=format, **kwargs)
+
+
+def _expression_names(plot: ggplot) -> set[str]:
+    """
+    Return the names in the expressions of a plot
+
+    The expressions are those of the aesthetic mappings, the facets
+    and the string parameters of the layers (e.g. a formula). The
+    names may be of variables in the environment of the plot.
+    """
+    exprs = []
+    mappings = [plot.mapping] + [l.mapping for l in plot.layers]
+    for mapping in mappings:
+        for value in mapping.values():
+            if isinstance(value, stage):
+                exprs.extend([value.start, value.after_stat, value.after_scale])
+            else:
+                exprs.append(value)
+
+    for attr in ('vars', 'rows', 'cols'):
+        exprs.extend(getattr(plot.facet, attr, []))
+
+    for l in plot.layers:
+        exprs.extend(l.geom.params.values())
+        exprs.extend(l.stat.params.values())
+
+    return {
+        name
+        for expr in exprs if isinstance(expr, str)
+        for name in re.findall(r'[A-Za-z_]\w*', expr)
+    }
+
+
+def _data_columns(plot: ggplot) -> set[str]:
+    """
+    Return the names of the columns of the data of all the layers
+
+    The expressions look up these names in the data before the
+    environment. A layer without data uses the data of the plot.
+    """
+    def names(data: Any) -> set[str]:
+        # pandas & polars dataframes, and pyarrow tables
+        cols = getattr(data, 'columns', None)
+        if cols is None:
+            cols = getattr(data, 'column_names', ())
+        return {str(col) for col in cols}
+
+    datas = [
+        plot.data if l._data is None else l._data
+        for l in plot.layers
+    ] or [plot.data]
+    return set.intersection(*[names(data) for data in datas])
+
+
+# The matplotlib rcParams and the pandas options are global, they
+# are modified by one plot at a time.
+_plot_context_lock = threading.RLock()
 
 
 class plot_context:
@@ -882,6 +1312,12 @@ class plot_context:
     show : bool (default: False)
         Whether to show (``plt.show()``) the plot before the context
         exits.
+
+    Notes
+    -----
+    The environment is global, so plots that are drawn in
+    different threads are built and drawn one at a time. Saving
+    the drawn figures can happen concurrently.
     """
 
     def __init__(self, plot: ggplot, show: bool = False) -> None:
@@ -892,30 +1328,39 @@ class plot_context:
         """
         Enclose in matplolib & pandas environments
         """
-        self.rc_context = mpl.rc_context(self.plot.theme.rcParams)
-        # Pandas deprecated is_copy, and when we create new dataframes
-        # from slices we do not want complaints. We always uses the
-        # new frames knowing that they are separate from the original.
-        self.pd_option_context = pd.option_context(
-            'mode.chained_assignment', None
-        )
-        self.rc_context.__enter__()
-        self.pd_option_context.__enter__()
+        _plot_context_lock.acquire()
+        try:
+            self.rc_context = mpl.rc_context(self.plot.theme.rcParams)
+            # Pandas deprecated is_copy, and when we create new
+            # dataframes from slices we do not want complaints. We
+            # always uses the new frames knowing that they are
+            # separate from the original.
+            self.pd_option_context = pd.option_context(
+                'mode.chained_assignment', None
+            )
+            self.rc_context.__enter__()
+            self.pd_option_context.__enter__()
+        except BaseException:
+            _plot_context_lock.release()
+            raise
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         """
         Exit matplotlib & pandas environments
         """
-        if exc_type is None:
+        try:
+            # Only the figures to be shown are managed by pyplot
             if self.show:
-                plt.show()
-            else:
-                plt.close(self.plot.figure)
-        else:
-            # There is an exception, close any figure
-            if hasattr(self.plot, 'figure'):
-                plt.close(self.plot.figure)
-
-        self.rc_context.__exit__(exc_type, exc_value, exc_traceback)
-        self.pd_option_context.__exit__(exc_type, exc_value, exc_traceback)
+                if exc_type is None:
+                    plt.show()
+                elif hasattr(self.plot, 'figure'):
+                    # There is an exception, close the figure
+                    plt.close(self.plot.figure)
+
+            self.rc_context.__exit__(exc_type, exc_value, exc_traceback)
+            self.pd_option_context.__exit__(
+                exc_type, exc_value, exc_traceback
+            )
+        finally:
+            _plot_context_lock.release()
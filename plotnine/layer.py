@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import typing
 from copy import copy, deepcopy
-from typing import Iterable, List, overload
+from typing import Hashable, Iterable, List, overload
 
 import pandas as pd
 
 from .exceptions import PlotnineError
 from .mapping.aes import NO_GROUP, SCALED_AESTHETICS, aes
 from .mapping.evaluation import evaluate, stage
+from .profiling import record
 from .utils import array_kind, check_required_aesthetics, ninteraction
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Optional, Sequence, SupportsIndex
+    from concurrent.futures import Executor
+    from typing import Any, Callable, Optional, Sequence, SupportsIndex
 
     from patsy.eval import EvalEnvironment
 
@@ -132,7 +134,7 @@ class layer:
 
     def __deepcopy__(self, memo: dict[Any, Any]) -> layer:
         """
-        Deep copy without copying the self.data dataframe
+        Deep copy without copying the dataframes
         """
         cls = self.__class__
         result = cls.__new__(cls)
@@ -141,7 +143,7 @@ class layer:
         new = result.__dict__
 
         for key, item in old.items():
-            if key == 'data':
+            if key in ('data', '_data'):
                 new[key] = old[key]
             else:
                 new[key] = deepcopy(old[key], memo)
@@ -154,11 +156,16 @@ class layer:
 
         Give the layer access to the data, mapping and environment
         """
-        self._make_layer_data(plot.data)
         self._make_layer_mapping(plot.mapping)
+        self._make_layer_data(plot.data, plot.facet)
+        self._prune_layer_data(plot.facet)
         self._make_layer_environments(plot.environment)
 
-    def _make_layer_data(self, plot_data: DataLike | None) -> None:
+    def _make_layer_data(
+        self,
+        plot_data: DataLike | None,
+        facet: Optional[p9.facets.facet.facet] = None
+    ) -> None:
         """
         Generate data to be used by this layer
 
@@ -166,23 +173,36 @@ class layer:
         ----------
         plot_data : dataframe
             ggplot object data
-        """
-        if plot_data is None:
-            data = pd.DataFrame()
-        elif callable(plot_data):
-            data = plot_data()
-        elif hasattr(plot_data, "to_pandas"):
-            data = typing.cast("DataFrameConvertible", plot_data).to_pandas()
-        else:
-            data = typing.cast("pd.DataFrame", plot_data)
-
-        # Each layer that does not have data gets a copy of
-        # of the ggplot.data. If it has data it is replaced
-        # by copy so that we do not alter the users data
+        facet : facet
+            Facetting of the ggplot object. If given, only the
+            columns used by the layer are converted when the
+            data is not a pandas dataframe.
+        """
+        def _plot_data() -> pd.DataFrame:
+            if plot_data is None:
+                return pd.DataFrame()
+            elif callable(plot_data):
+                return plot_data()
+            elif hasattr(plot_data, "to_pandas"):
+                # The layer data function may use any column
+                return self._to_pandas(
+                    plot_data,
+                    None if callable(self._data) else facet
+                )
+            else:
+                return typing.cast("pd.DataFrame", plot_data)
+
+        # Each layer that does not have data gets a shallow copy
+        # of the ggplot.data. If it has data it is replaced by a
+        # shallow copy. The columns are not copied, so the users
+        # data is not altered only if the stages before the
+        # aesthetics are evaluated add or replace whole columns.
+        # Evaluating the aesthetics copies the columns it uses.
         if self._data is None:
+            data = _plot_data()
             try:
-                self.data = copy(data)
-            except AttributeError:
+                self.data = data.copy(deep=False)
+            except (AttributeError, TypeError):
                 _geom_name = self.geom.__class__.__name__
                 _data_name = data.__class__.__name__
                 raise PlotnineError(
@@ -190,7 +210,7 @@ class layer:
                     f"but it got {_data_name} instead."
                 )
         elif callable(self._data):
-            self.data = self._data(data)
+            self.data = self._data(_plot_data())
             if not isinstance(self.data, pd.DataFrame):
                 raise PlotnineError(
                     "Data function must return a Pandas dataframe"
@@ -198,14 +218,104 @@ class layer:
         else:
             # Recognise polars dataframes
             if hasattr(self._data, "to_pandas"):
-                self.data = (
-                    typing.cast("DataFrameConvertible", self._data).to_pandas()
-                )
+                self.data = self._to_pandas(self._data, facet)
             elif isinstance(self._data, pd.DataFrame):
-                self.data = self._data.copy()
+                self.data = self._data.copy(deep=False)
             else:
                 raise TypeError(f"Data has a bad type: {type(self.data)}")
 
+    def _to_pandas(
+        self,
+        data: DataFrameConvertible,
+        facet: Optional[p9.facets.facet.facet] = None
+    ) -> pd.DataFrame:
+        """
+        Convert data to a pandas dataframe
+
+        If the data can select its columns by name (e.g. pyarrow
+        tables and polars dataframes), only the columns used by
+        the layer are converted. Arrow backed data are converted
+        without consolidating the columns, so the numeric columns
+        without missing values are views of the arrow buffers.
+
+        Parameters
+        ----------
+        data : object
+            Object with a ``to_pandas`` method.
+        facet : facet
+            Facetting of the ggplot object. If ``None``, all the
+            columns are converted.
+        """
+        # pyarrow tables have column_names, polars dataframes columns
+        names = getattr(data, "column_names", None)
+        if names is None:
+            names = getattr(data, "columns", None)
+
+        if (
+            facet is not None
+            and hasattr(data, "select")
+            and isinstance(names, list)
+            and all(isinstance(name, str) for name in names)
+        ):
+            keep = self._used_columns(names, facet)
+            if len(keep) < len(names):
+                data = data.select(keep)  # type: ignore
+
+        if type(data).__module__.split(".")[0] in ("pyarrow", "polars"):
+            return data.to_pandas(split_blocks=True)  # type: ignore
+        return data.to_pandas()
+
+    def _used_columns(
+        self,
+        columns: Iterable[Any],
+        facet: p9.facets.facet.facet
+    ) -> list[Any]:
+        """
+        Return the columns that may be used by the layer
+
+        Until the aesthetics are evaluated, the layer data is only
+        used to evaluate the aesthetic mappings and the facetting
+        variables.
+
+        Parameters
+        ----------
+        columns : iterable
+            Column names of the data
+        facet : facet
+            Facetting of the ggplot object
+        """
+        exprs = list(self.mapping._starting.values())
+        for attr in ('vars', 'rows', 'cols'):
+            exprs.extend(getattr(facet, attr, []))
+        return [col for col in columns if _is_referenced(col, exprs)]
+
+    def _prune_layer_data(self, facet: p9.facets.facet.facet) -> None:
+        """
+        Keep only the columns of the data used by the layer
+
+        Any columns that are not used by the aesthetic mappings
+        or the facetting variables are dropped so that they are
+        not carried through the facetting. The columns that are
+        kept are not copied.
+
+        Parameters
+        ----------
+        facet : facet
+            Facetting of the ggplot object
+        """
+        data = self.data
+        columns = data.columns
+        if not len(columns) or not columns.is_unique:
+            return
+
+        keep = self._used_columns(columns, facet)
+        if len(keep) < len(columns):
+            self.data = type(data)(
+                {col: data[col] for col in keep},
+                index=data.index,
+                copy=False
+            )
+
     def _make_layer_mapping(self, plot_mapping: aes) -> None:
         """
         Create the aesthetic mappings to be used by this layer
@@ -266,7 +376,9 @@ class layer:
             evaled['PANEL'] = self.data['PANEL']
 
         data = add_group(evaled)
-        self.data = data.sort_values('PANEL', kind='mergesort')
+        if not data['PANEL'].is_monotonic_increasing:
+            data = data.sort_values('PANEL', kind='mergesort')
+        self.data = data
 
     def compute_statistic(self, layout: p9.facets.layout.Layout) -> None:
         """
@@ -282,6 +394,25 @@ class layer:
         data = self.stat.compute_layer(data, params, layout)
         self.data = data
 
+    def compute_statistic_tasks(
+        self,
+        layout: p9.facets.layout.Layout
+    ) -> list[Callable[[], pd.DataFrame]]:
+        """
+        Prepare the data & return the tasks that compute the statistics
+
+        The statistics for the layer are the concatenated results
+        of the tasks. There are no tasks if the layer has no data.
+        """
+        data = self.data
+        if not len(data):
+            return []
+
+        params = self.stat.setup_params(data)
+        data = self.stat.use_defaults(data)
+        data = self.stat.setup_data(data)
+        return self.stat.compute_layer_tasks(data, params, layout)
+
     def map_statistic(self, plot: p9.ggplot) -> None:
         """
         Mapping aesthetics to computed statistics
@@ -450,13 +581,21 @@ class Layers(List[layer]):
     def data(self) -> list[pd.DataFrame]:
         return [l.data for l in self]
 
+    def _each(self, stage: str, fn: Callable[[layer], Any]) -> None:
+        """
+        Call function on every layer & record the stage for each
+        """
+        for i, l in enumerate(self, start=1):
+            with record(stage, layer=i) as rec:
+                fn(l)
+                if rec is not None:
+                    rec.rows = len(l.data)
+
     def setup(self, plot: p9.ggplot) -> None:
-        for l in self:
-            l.setup(plot)
+        self._each('setup', lambda l: l.setup(plot))
 
     def setup_data(self) -> None:
-        for l in self:
-            l.setup_data()
+        self._each('setup_data', lambda l: l.setup_data())
 
     def draw(
         self,
@@ -466,53 +605,103 @@ class Layers(List[layer]):
         # If zorder is 0, it is left to MPL
         for i, l in enumerate(self, start=1):
             l.zorder = i
-            l.draw(layout, coord)
+            with record('draw_layer', layer=i):
+                l.draw(layout, coord)
 
     def compute_aesthetics(self, plot: p9.ggplot) -> None:
-        for l in self:
-            l.compute_aesthetics(plot)
+        self._each('compute_aesthetics', lambda l: l.compute_aesthetics(plot))
 
-    def compute_statistic(self, layout: p9.facets.layout.Layout) -> None:
-        for l in self:
-            l.compute_statistic(layout)
+    def compute_statistic(
+        self,
+        layout: p9.facets.layout.Layout,
+        executor: Executor | None = None
+    ) -> None:
+        if executor is None:
+            self._each(
+                'compute_statistic',
+                lambda l: l.compute_statistic(layout)
+            )
+            return
+
+        # The panels of all the layers are computed together, and
+        # the results are collected in the order of the tasks
+        with record('compute_statistic'):
+            layer_tasks = [l.compute_statistic_tasks(layout) for l in self]
+            tasks = [task for lst in layer_tasks for task in lst]
+            with pd.option_context('mode.chained_assignment', None):
+                results = iter(list(executor.map(_call, tasks)))
+
+            for l, lst in zip(self, layer_tasks):
+                if lst:
+                    l.data = pd.concat(
+                        [next(results) for _ in lst],
+                        axis=0,
+                        ignore_index=True,
+                        copy=False
+                    )
 
     def map_statistic(self, plot: p9.ggplot) -> None:
-        for l in self:
-            l.map_statistic(plot)
+        self._each('map_statistic', lambda l: l.map_statistic(plot))
 
     def compute_position(self, layout: p9.facets.layout.Layout) -> None:
-        for l in self:
-            l.compute_position(layout)
+        self._each('compute_position', lambda l: l.compute_position(layout))
 
     def use_defaults(
         self,
         data: pd.DataFrame | None = None,
         aes_modifiers: dict[str, Any] | None = None
     ) -> None:
-        for l in self:
-            l.use_defaults(data, aes_modifiers)
+        self._each(
+            'use_defaults',
+            lambda l: l.use_defaults(data, aes_modifiers)
+        )
 
     def transform(self, scales: p9.scales.scale.scale) -> None:
-        for l in self:
+        def fn(l):
             l.data = scales.transform_df(l.data)
+        self._each('transform', fn)
 
     def train(self, scales: p9.scales.scale.scale) -> None:
-        for l in self:
+        def fn(l):
             l.data = scales.train_df(l.data)
+        self._each('scales.train', fn)
 
     def map(self, scales: p9.scales.scale.scale) -> None:
-        for l in self:
+        def fn(l):
             l.data = scales.map_df(l.data)
+        self._each('scales.map', fn)
 
     def finish_statistics(self) -> None:
-        for l in self:
-            l.finish_statistics()
+        self._each('finish_statistics', lambda l: l.finish_statistics())
 
     def update_labels(self, plot: p9.ggplot) -> None:
         for l in self:
             plot._update_labels(l)
 
 
+def _is_referenced(col: Any, exprs: list[Any]) -> bool:
+    """
+    Return True if a column may be used by any of the expressions
+
+    A column is used by an expression that is its name or by
+    a string expression that contains the name e.g. ``'x'`` is
+    in ``'np.log(x)'`` and ``'my col'`` is in ``'Q("my col")'``.
+    The test errs on the side of keeping columns.
+    """
+    name = str(col)
+    for expr in exprs:
+        if isinstance(expr, str):
+            if name in expr:
+                return True
+        elif isinstance(expr, Hashable):
+            try:
+                if col == expr:
+                    return True
+            except (TypeError, ValueError):
+                pass
+    return False
+
+
 def add_group(data: pd.DataFrame) -> pd.DataFrame:
     """
     Add group to the dataframe
@@ -561,3 +750,12 @@ def discrete_columns(
                 continue
             lst.append(str(col))
     return lst
+
+
+def _call(fn: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Call a task
+
+    A module level function that executors can pickle
+    """
+    return fn()
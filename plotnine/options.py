@@ -20,6 +20,29 @@ dpi = 100
 #: Default figure size inches
 figure_size = (640/dpi, 480/dpi)
 
+#: Whether to profile the building and drawing of plots. If
+#: ``True``, the :class:`~plotnine.profiling.profile_report` of
+#: the last plot is available with
+#: :func:`~plotnine.profiling.last_report`. If it is a callable,
+#: it is called with the report of each plot that is drawn.
+profile = False
+
+#: A :class:`concurrent.futures.Executor` used to compute the
+#: statistics of the panels of all the layers in parallel. e.g.
+#: a :class:`~concurrent.futures.ThreadPoolExecutor` or a
+#: :class:`~concurrent.futures.ProcessPoolExecutor`. With a process
+#: pool, the data, scales & parameters of the layers must be
+#: picklable. If ``None``, the statistics are computed serially.
+executor = None
+
+#: Whether to draw the backgrounds of the facet strips as one
+#: collection (for each side of the panels) in figure coordinates,
+#: instead of a patch in each panel. It is faster for plots with many
+#: panels. The collection is drawn below the panels, so where the
+#: strips overlap the panels, e.g. along the panel border, the panels
+#: are on top.
+collect_strips = False
+
 #: Default parameters for how to tune the subplot layout
 # Choosen to match MPL 2.0 defaults
 SUBPLOTS_ADJUST = {
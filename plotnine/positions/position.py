@@ -5,19 +5,22 @@ from copy import copy
 from warnings import warn
 
 import numpy as np
+import pandas as pd
 
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..mapping.aes import X_AESTHETICS, Y_AESTHETICS
+from ..profiling import record
 from ..utils import (
     Registry,
     check_required_aesthetics,
+    group_codes,
     groupby_apply,
     is_string,
+    split_by_codes,
 )
 
 if typing.TYPE_CHECKING:
     import mizani as mz
-    import pandas as pd
 
 
 class position(metaclass=Registry):
@@ -61,8 +64,10 @@ class position(metaclass=Registry):
             # that does the real computation
             if len(pdata) == 0:
                 return pdata
-            scales = layout.get_scales(pdata['PANEL'].iat[0])
-            return cls.compute_panel(pdata, scales, params)
+            panel = pdata['PANEL'].iat[0]
+            scales = layout.get_scales(panel)
+            with record('position.compute_panel', panel=int(panel)):
+                return cls.compute_panel(pdata, scales, params)
 
         return groupby_apply(data, 'PANEL', fn)
 
@@ -158,6 +163,72 @@ class position(metaclass=Registry):
         """
         return data
 
+    @classmethod
+    def strategy_groups(cls, data, codes, params):
+        """
+        Calculate boundaries of geometry objects at all x positions
+
+        Positions for which the computation can be done for all
+        the ``xmin`` groups at once should implement this method.
+        It is used by :meth:`collide` in place of calling
+        :meth:`strategy` for each group.
+
+        Parameters
+        ----------
+        data : dataframe
+            Data for the panel, sorted by ``xmin``
+        codes : numpy.ndarray
+            Group code of each row in ``data``. The codes are
+            integers ``0, ..., n-1`` in the order of the ``xmin``
+            values, so the rows of each group are together.
+        params : dict
+            Parameters
+
+        Returns
+        -------
+        out : dataframe
+            Data with the new boundaries, in the same order.
+        """
+        msg = "{} does not implement this method."
+        raise NotImplementedError(msg.format(cls.__name__))
+
+    @classmethod
+    def _implements_strategy_groups(cls):
+        """
+        Return True if the position computes all the groups at once
+
+        A subclass that overrides :meth:`strategy` without also
+        overriding :meth:`strategy_groups` uses its own strategy.
+        """
+        for klass in cls.__mro__:
+            if 'strategy_groups' in klass.__dict__:
+                return klass is not position
+            if 'strategy' in klass.__dict__:
+                return False
+        return False
+
+    @classmethod
+    def _collide_groups(cls, data, params):
+        """
+        Apply the strategy to each ``xmin`` group of sorted data
+        """
+        codes, ngroups = group_codes(data['xmin'])
+        if cls._implements_strategy_groups():
+            keep = codes >= 0
+            if not keep.all():
+                data, codes = data.loc[keep], codes[keep]
+            data = cls.strategy_groups(data.copy(), codes, params)
+            return data.reset_index(drop=True)
+
+        # The strategy should be free to modify the groups
+        with pd.option_context('mode.chained_assignment', None):
+            lst = [cls.strategy(d, params)
+                   for d in split_by_codes(data, codes, ngroups)]
+
+        if not lst:
+            return data.iloc[:0].reset_index(drop=True)
+        return pd.concat(lst, axis=0, ignore_index=True, copy=False)
+
     @classmethod
     def _collide_setup(cls, data, params):
         xminmax = ['xmin', 'xmax']
@@ -217,10 +288,10 @@ class position(metaclass=Registry):
             warn(msg.format(cls.__name__), PlotnineWarning)
 
         if 'ymax' in data:
-            data = groupby_apply(data, 'xmin', cls.strategy, params)
+            data = cls._collide_groups(data, params)
         elif 'y' in data:
             data['ymax'] = data['y']
-            data = groupby_apply(data, 'xmin', cls.strategy, params)
+            data = cls._collide_groups(data, params)
             data['y'] = data['ymax']
         else:
             raise PlotnineError('Neither y nor ymax defined')
@@ -2,10 +2,9 @@ from contextlib import suppress
 from copy import copy
 
 import numpy as np
-import pandas as pd
 
 from ..exceptions import PlotnineError
-from ..utils import groupby_apply, match
+from ..utils import match
 from .position import position
 
 
@@ -49,15 +48,8 @@ class position_dodge(position):
         else:
             # Count at the xmin values per panel and find the highest
             # overall count
-            def max_xmin_values(gdf):
-                try:
-                    n = gdf['xmin'].value_counts().max()
-                except KeyError:
-                    n = gdf['x'].value_counts().max()
-                return pd.DataFrame({'n': [n]})
-
-            res = groupby_apply(data, 'PANEL', max_xmin_values)
-            params['n'] = res['n'].max()
+            col = 'xmin' if 'xmin' in data else 'x'
+            params['n'] = max_panel_count(data, col)
         return params
 
     @classmethod
@@ -105,3 +97,91 @@ class position_dodge(position):
         data['xmax'] = data['x'] + (d_width / n) / 2
 
         return data
+
+    @classmethod
+    def strategy_groups(cls, data, codes, params):
+        """
+        Dodge overlapping intervals at all x positions
+        """
+        if not len(data):
+            return data
+
+        width = params['width']
+        with suppress(TypeError):
+            iter(width)
+            width = np.asarray(width)
+            width = width[data.index]
+
+        # Number each group within its xmin group, 1 to the number
+        # of groups at that position.
+        groupidx, ngroups = _rank_within(codes, data['group'].to_numpy())
+
+        n = params.get('n', None)
+        if n is None:
+            n = ngroups[codes]
+        else:
+            n = np.repeat(n, len(data))
+
+        # Positions with a single group are left as they are
+        dodge = n != 1
+        if not dodge.any():
+            return data
+
+        # Widest interval at each position
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        d_width = np.fmax.reduceat(
+            (data['xmax'] - data['xmin']).to_numpy(), starts)
+        d_width = np.repeat(d_width, np.diff(starts, append=len(data)))
+
+        x = data['x'].to_numpy()
+        if not isinstance(width, np.ndarray):
+            width = np.repeat(width, len(data))
+        x = x + width * ((groupidx - 0.5) / n - 0.5)
+        half_width = (d_width / n) / 2
+        data['x'] = np.where(dodge, x, data['x'])
+        data['xmin'] = np.where(dodge, x - half_width, data['xmin'])
+        data['xmax'] = np.where(dodge, x + half_width, data['xmax'])
+        return data
+
+
+def max_panel_count(data, col):
+    """
+    Return the highest count of a value of a column in any panel
+    """
+    counts = data.groupby(['PANEL', col], observed=True).size()
+    return counts.max()
+
+
+def _rank_within(codes, values):
+    """
+    Rank the unique values within each group
+
+    Parameters
+    ----------
+    codes : array
+        Group code of each value, in sorted order
+    values : array
+        Values to rank
+
+    Returns
+    -------
+    ranks : array
+        Rank (starting at 1) of each value among the unique
+        values in its group.
+    counts : array
+        Number of unique values in each group
+    """
+    order = np.lexsort((values, codes))
+    sorted_codes = codes[order]
+    sorted_values = values[order]
+    new_code = np.diff(sorted_codes, prepend=-1) != 0
+    new_value = new_code.copy()
+    new_value[1:] |= sorted_values[1:] != sorted_values[:-1]
+    value_id = np.cumsum(new_value)
+    # Subtract the id of the first value in the group
+    group_lengths = np.diff(np.flatnonzero(new_code), append=len(codes))
+    first_id = np.repeat(value_id[new_code], group_lengths)
+    ranks = np.empty(len(codes), dtype=int)
+    ranks[order] = value_id - first_id + 1
+    counts = np.bincount(sorted_codes, weights=new_value).astype(int)
+    return ranks, counts
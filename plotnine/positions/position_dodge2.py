@@ -1,11 +1,10 @@
 from copy import copy
 
 import numpy as np
-import pandas as pd
 
 from ..exceptions import PlotnineError
-from ..utils import groupby_apply, pivot_apply
-from .position_dodge import position_dodge
+from ..utils import split_by_column
+from .position_dodge import max_panel_count, position_dodge
 
 
 class position_dodge2(position_dodge):
@@ -64,16 +63,13 @@ class position_dodge2(position_dodge):
             params['n'] = None
         elif 'x' in data:
             # point geom
-            def max_x_values(gdf):
-                n = gdf['x'].value_counts().max()
-                return pd.DataFrame({'n': [n]})
-
-            res = groupby_apply(data, 'PANEL', max_x_values)
-            params['n'] = res['n'].max()
+            params['n'] = max_panel_count(data, 'x')
         else:
             # interval geoms
-            res = groupby_apply(data, 'PANEL', find_x_overlaps)
-            params['n'] = res['n'].max()
+            params['n'] = max(
+                np.bincount(find_x_overlaps(pdata)).max()
+                for pdata in split_by_column(data, 'PANEL')
+            )
         return params
 
     @classmethod
@@ -89,73 +85,88 @@ class position_dodge2(position_dodge):
             data['xmin'] = data['x']
             data['xmax'] = data['x']
 
-        # Groups of boxes that share the same position
-        data['xid'] = find_x_overlaps(data)
+        if not len(data):
+            return data
+
+        xmin = data['xmin'].to_numpy(dtype=float)
+        xmax = data['xmax'].to_numpy(dtype=float)
+
+        # Groups of boxes that share the same position, the rows
+        # of each group are together.
+        xid = find_x_overlaps(data) - 1
+        starts = np.flatnonzero(np.diff(xid, prepend=-1))
+        counts = np.diff(starts, append=len(data))
 
         # Find newx using xid, i.e. the center of each group of
         # overlapping elements. for boxes, bars, etc. this should
         # be the same as original x, but for arbitrary rects it
         # may not be
-        res1 = pivot_apply(data, 'xmin', 'xid', np.min)
-        res2 = pivot_apply(data, 'xmax', 'xid', np.max)
-        data['newx'] = (res1 + res2)[data['xid'].values].values / 2
+        newx = (np.fmin.reduceat(xmin, starts) +
+                np.fmax.reduceat(xmax, starts)) / 2
 
         if n is None:
             # If n is None, preserve total widths of elements at
             # each position by dividing widths by the number of
             # elements at that position
-            n = data['xid'].value_counts().values
-            n = n[data.loc[:, 'xid'] - 1]
-            data['new_width'] = (data['xmax'] - data['xmin']) / n
-        else:
-            data['new_width'] = (data['xmax'] - data['xmin']) / n
-
-        # Find the total width of each group of elements
-        def sum_new_width(gdf):
-            return pd.DataFrame({'size': [gdf['new_width'].sum()],
-                                 'newx': gdf['newx'].iloc[0]})
-
-        group_sizes = groupby_apply(data, 'newx', sum_new_width)
-
-        # Starting xmin for each group of elements
-        starts = group_sizes['newx'] - (group_sizes['size']/2)
-
-        # Set the elements in place
-        for i, start in enumerate(starts, start=1):
-            bool_idx = data['xid'] == i
-            divisions = np.cumsum(
-               np.hstack([
-                   start,
-                   data.loc[bool_idx, 'new_width']
-               ])
-            )
-            data.loc[bool_idx, 'xmin'] = divisions[:-1]
-            data.loc[bool_idx, 'xmax'] = divisions[1:]
+            n = counts[xid]
+        new_width = (xmax - xmin) / n
+
+        # Find the total width of each group of elements, and
+        # the starting xmin for each group
+        size = np.bincount(xid, weights=new_width)
+        group_start = newx - size / 2
+
+        # Set the elements in place, side by side from the start
+        # of their group
+        ends = np.cumsum(new_width)
+        offset = ends - new_width
+        offset -= np.repeat(offset[starts], counts)
+        xmin = group_start[xid] + offset
+        xmax = xmin + new_width
 
         # x values get moved to between xmin and xmax
-        data['x'] = (data['xmin'] + data['xmax']) / 2
+        x = (xmin + xmax) / 2
 
         # Shrink elements to add space between them
-        if data['xid'].duplicated().any():
-            pad_width = data['new_width'] * (1 - padding)
-            data['xmin'] = data['x'] - pad_width / 2
-            data['xmax'] = data['x'] + pad_width / 2
-
-        data = data.drop(columns=['xid', 'newx', 'new_width'],
-                         errors='ignore')
+        if (counts > 1).any():
+            pad_width = new_width * (1 - padding)
+            xmin = x - pad_width / 2
+            xmax = x + pad_width / 2
+
+        data['x'] = x
+        data['xmin'] = xmin
+        data['xmax'] = xmax
         return data
 
 
 def find_x_overlaps(df):
     """
     Find overlapping regions along the x axis
+
+    An element starts a new region if it begins at or after
+    the end of all the elements before it.
+
+    Parameters
+    ----------
+    df : dataframe
+        Data with ``xmin`` and ``xmax`` columns, in the order
+        of the elements along the x axis.
+
+    Returns
+    -------
+    out : array
+        Region (starting at 1) of each element.
     """
     n = len(df)
-    overlaps = np.zeros(n, dtype=int)
+    if not n:
+        return np.zeros(0, dtype=int)
+
+    xmin = df['xmin'].to_numpy()
+    xmax = df['xmax'].to_numpy()
+    # The furthest end of the previous elements, ignoring
+    # missing values
+    end = np.fmax.accumulate(xmax[:-1])
+    overlaps = np.empty(n, dtype=int)
     overlaps[0] = 1
-    counter = 1
-    for i in range(1, n):
-        if df['xmin'].iloc[i] >= df['xmax'].iloc[i-1]:
-            counter += 1
-        overlaps[i] = counter
-    return overlaps
+    overlaps[1:] = xmin[1:] >= end
+    return np.cumsum(overlaps)
@@ -126,3 +126,42 @@ class position_stack(position):
         # similar precision
         data['y'] = ((1-vjust)*data['ymin'] + vjust*data['ymax'])
         return data
+
+    @classmethod
+    def strategy_groups(cls, data, codes, params):
+        """
+        Stack overlapping intervals at all x positions
+
+        The heights are the cumulative sums of ``y`` within
+        each ``xmin`` group.
+        """
+        if not len(data):
+            return data
+
+        vjust = params['vjust']
+
+        y = data['y'].to_numpy(copy=True)
+        y[np.isnan(y)] = 0
+        upper = pd.Series(y).groupby(codes, sort=False).cumsum().to_numpy()
+
+        # Each interval starts at the height of the one before it,
+        # the first interval of each group starts at 0
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        lower = np.empty_like(upper)
+        lower[1:] = upper[:-1]
+        lower[starts] = 0
+
+        if params['fill']:
+            ends = np.append(starts[1:], len(data)) - 1
+            totals = np.abs(upper[ends])
+            totals = np.repeat(totals, np.diff(starts, append=len(data)))
+            lower = lower / totals
+            upper = upper / totals
+
+        data['ymin'] = np.minimum(lower, upper)
+        data['ymax'] = np.maximum(lower, upper)
+        # less intuitive than (ymin + vjust(ymax-ymin)), but
+        # this way avoids subtracting numbers of potentially
+        # similar precision
+        data['y'] = ((1-vjust)*data['ymin'] + vjust*data['ymax'])
+        return data
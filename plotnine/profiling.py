@@ -0,0 +1,306 @@
+"""
+Instrumentation of the plot building and drawing pipeline
+
+The stages of :meth:`ggplot._build` and the steps of
+:meth:`ggplot.draw` are enclosed in :func:`record` blocks. When no
+:class:`profiler` is active, the blocks do nothing. When one is
+active, each block is timed and, optionally, the peak memory
+allocated within it is measured.
+"""
+from __future__ import annotations
+
+import threading
+import tracemalloc
+import typing
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter
+
+import pandas as pd
+
+from .options import get_option
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Iterator, Optional
+
+
+@dataclass
+class stage_record:
+    """
+    Measurements of a single stage of the plot pipeline
+    """
+    # Name of the stage e.g. compute_statistic, draw_layers
+    stage: str
+    # Index of the layer (starting at 1) the stage acted on
+    layer: Optional[int] = None
+    # Panel number the stage acted on
+    panel: Optional[int] = None
+    # Wall time in seconds
+    time: float = 0
+    # Number of rows in the data after the stage
+    rows: Optional[int] = None
+    # Peak memory (bytes) allocated within the stage
+    peak_memory: Optional[int] = None
+    # Nesting level of the stage
+    depth: int = 0
+
+    # Bookkeeping while the stage is in progress
+    _start_memory: int = field(default=0, repr=False)
+    _child_peak: int = field(default=0, repr=False)
+
+
+class profile_report:
+    """
+    Measurements of all the stages of a plot
+
+    Parameters
+    ----------
+    records : list
+        :class:`stage_record` for every stage in the order in
+        which the stages completed.
+    """
+
+    def __init__(self, records: list[stage_record] | None = None):
+        self.records = records if records is not None else []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[stage_record]:
+        return iter(self.records)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the measurements as a dataframe
+
+        There is a row for each stage and the columns are
+        ``stage``, ``layer``, ``panel``, ``depth``, ``time``,
+        ``rows`` & ``peak_memory``.
+        """
+        columns = [
+            'stage', 'layer', 'panel', 'depth',
+            'time', 'rows', 'peak_memory'
+        ]
+        data = [
+            [getattr(r, name) for name in columns]
+            for r in self.records
+        ]
+        return pd.DataFrame(data, columns=columns)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Return the total time spent in each stage
+
+        The stages are sorted, slowest first.
+        """
+        df = self.to_frame()
+        if not len(df):
+            return df
+
+        result = (
+            df.groupby('stage', sort=False)
+            .agg(
+                time=('time', 'sum'),
+                calls=('time', 'size'),
+                peak_memory=('peak_memory', 'max')
+            )
+            .sort_values('time', ascending=False)
+        )
+        return result
+
+    @property
+    def total_time(self) -> float:
+        """
+        Total time (in seconds) of all the top level stages
+        """
+        return sum(r.time for r in self.records if r.depth == 0)
+
+    def __str__(self) -> str:
+        return self.summary().to_string()
+
+    def __repr__(self) -> str:
+        return (
+            f'<profile_report: {len(self)} stages, '
+            f'{self.total_time:.4f}s>'
+        )
+
+
+class profiler:
+    """
+    Record the time spent in the stages of building & drawing plots
+
+    All plots drawn while the profiler is active (in the current
+    thread) are recorded in the same report.
+
+    Parameters
+    ----------
+    memory : bool
+        If ``True``, measure the peak memory allocated within each
+        stage. This uses :mod:`tracemalloc` and it slows down
+        the plotting considerably.
+
+    Examples
+    --------
+    >>> with profiler() as prof:
+    >>>     p.save('plot.png')
+    >>> print(prof.report)
+    """
+
+    def __init__(self, memory: bool = False) -> None:
+        self.memory = memory
+        self.report = profile_report()
+        self._stack: list[stage_record] = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> profiler:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        _active_profilers().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        _active_profilers().remove(self)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def record(
+        self,
+        stage: str,
+        layer: Optional[int] = None,
+        panel: Optional[int] = None
+    ) -> Iterator[stage_record]:
+        """
+        Measure the stage enclosed in the context
+
+        A stage nested within another stage inherits the layer
+        and panel of the enclosing stage.
+        """
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            layer = parent.layer if layer is None else layer
+            panel = parent.panel if panel is None else panel
+
+        rec = stage_record(
+            stage=stage,
+            layer=layer,
+            panel=panel,
+            depth=len(self._stack)
+        )
+        self._stack.append(rec)
+
+        if self.memory:
+            rec._start_memory, peak = tracemalloc.get_traced_memory()
+            # Resetting the peak discards the peak the enclosing
+            # stage has reached so far, keep it.
+            if parent is not None:
+                parent._child_peak = max(parent._child_peak, peak)
+            # Python < 3.9 cannot reset the peak, the measured peak
+            # is then that since the profiler started.
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+
+        start = perf_counter()
+        try:
+            yield rec
+        finally:
+            rec.time = perf_counter() - start
+            self._stack.pop()
+
+            if self.memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, rec._child_peak)
+                rec.peak_memory = peak - rec._start_memory
+                if parent is not None:
+                    parent._child_peak = max(parent._child_peak, peak)
+
+            self.report.records.append(rec)
+
+
+_local = threading.local()
+
+
+def _active_profilers() -> list[profiler]:
+    """
+    Return the stack of profilers active in this thread
+    """
+    try:
+        return _local.profilers
+    except AttributeError:
+        _local.profilers = []
+        return _local.profilers
+
+
+def current_profiler() -> Optional[profiler]:
+    """
+    Return the innermost active profiler (if any)
+    """
+    profilers = _active_profilers()
+    return profilers[-1] if profilers else None
+
+
+def record(
+    stage: str,
+    layer: Optional[int] = None,
+    panel: Optional[int] = None
+) -> Any:
+    """
+    Measure a stage of the plot pipeline
+
+    Parameters
+    ----------
+    stage : str
+        Name of stage
+    layer : int, optional
+        Index of the layer (starting at 1) the stage acts on.
+    panel : int, optional
+        Panel number the stage acts on.
+
+    Returns
+    -------
+    out : contextmanager
+        If no profiler is active, the context yields ``None``,
+        otherwise it yields a :class:`stage_record` whose
+        ``rows`` the caller may set.
+    """
+    prof = current_profiler()
+    if prof is None:
+        return nullcontext()
+    return prof.record(stage, layer, panel)
+
+
+@contextmanager
+def profile_plot() -> Iterator[Optional[profiler]]:
+    """
+    Profile a plot as directed by the ``profile`` option
+
+    If the option is not set or a profiler is already active,
+    this context does nothing and yields ``None``.
+    """
+    setting: bool | Callable[[profile_report], Any] = get_option('profile')
+    if not setting or current_profiler() is not None:
+        yield None
+        return
+
+    with profiler() as prof:
+        yield prof
+
+    global _last_report
+    _last_report = prof.report
+    if callable(setting):
+        setting(prof.report)
+
+
+_last_report: Optional[profile_report] = None
+
+
+def last_report() -> Optional[profile_report]:
+    """
+    Return the report of the last plot profiled via the options
+
+    The report is only available if the ``profile`` option was
+    set to ``True`` (or to a callable) when the plot was drawn.
+    """
+    return _last_report
@@ -464,36 +464,30 @@ class scale_discrete(scale):
         pal = self.palette(n)
         if isinstance(pal, dict):
             # manual palette with specific assignments
-            pal_match = []
-            for val in x:
-                try:
-                    pal_match.append(pal[val])
-                except KeyError:
-                    pal_match.append(self.na_value)
+            idx = match(x, list(pal.keys()))
+            pal = list(pal.values())
+            nomatch = self.na_value
         else:
-            if not isinstance(pal, np.ndarray):
-                pal = np.asarray(pal, dtype=object)
-            idx = np.asarray(match(x, limits))
-            try:
-                pal_match = [pal[i] if i >= 0 else None for i in idx]
-            except IndexError:
-                # Deal with missing data
-                # - Insert NaN where there is no match
-                pal = np.hstack((pal.astype(object), np.nan))
-                idx = np.clip(idx, 0, len(pal)-1)
-                pal_match = pal[idx]
+            idx = match(x, limits)
+            nomatch = None
+
+        # The palette values, the value of the data that do not
+        # match and the na_value are put in a 1D array, so that
+        # the values are taken with their indices. Assigning one
+        # at a time keeps the tuples (e.g. linetypes) whole.
+        n = len(pal)
+        lookup = np.empty(n+2, dtype=object)
+        for i, value in enumerate(pal):
+            lookup[i] = value
+        lookup[n] = nomatch
+        lookup[n+1] = self.na_value
+        idx[(idx < 0) | (idx >= n)] = n
 
         if self.na_translate:
-            bool_pal_match = pd.isnull(pal_match)
-            if len(bool_pal_match.shape) > 1:
-                # linetypes take tuples, these return 2d
-                bool_pal_match = bool_pal_match.any(axis=1)
-            bool_idx = pd.isnull(x) | bool_pal_match
-            if bool_idx.any():
-                pal_match = [x if i else self.na_value
-                             for x, i in zip(pal_match, ~bool_idx)]
+            is_null = np.array([np.any(pd.isnull(v)) for v in lookup])
+            idx[is_null[idx] | np.asarray(pd.isnull(x))] = n+1
 
-        return pal_match
+        return lookup[idx]
 
     def get_breaks(self, limits=None, strict=True):
         """
@@ -615,6 +609,18 @@ class scale_continuous(scale):
         be handled by the palette. Default is to rescale
         them onto the [0, 1] range. Scales that inherit
         from this class may have another default.
+    quantize : int, optional
+        Number of entries in a lookup table used to map the
+        data points. The palette is evaluated at ``quantize``
+        evenly spaced points in the [0, 1] range, and each
+        (rescaled) data point gets the value of the nearest
+        point, i.e. one at most ``1/(2*(quantize-1))`` away.
+        The color palettes have (matplotlib colormaps of) 256
+        colors, so with ``1024`` entries a data point gets the
+        exact color or the one next to it. This is much faster
+        when there are many unique data points. Mapped colors
+        are returned as a categorical. Default is ``None``, to
+        evaluate the palette at every unique data point.
 
     Notes
     -----
@@ -625,6 +631,7 @@ class scale_continuous(scale):
     rescaler = staticmethod(rescale)  # Used by diverging & n colour gradients
     oob = staticmethod(censor)     # what to do with out of bounds data points
     minor_breaks = waiver()
+    quantize = None                # size of the palette lookup table
     _trans = 'identity'            # transform class
 
     def __init__(self, **kwargs):
@@ -873,6 +880,9 @@ class scale_continuous(scale):
 
         x = self.oob(self.rescaler(x, _from=limits))
 
+        if self.quantize:
+            return self._map_quantized(x)
+
         uniq = np.unique(x)
         pal = np.asarray(self.palette(uniq))
         scaled = pal[match(x, uniq)]
@@ -885,6 +895,53 @@ class scale_continuous(scale):
             scaled[pd.isnull(scaled)] = self.na_value
         return scaled
 
+    def _map_quantized(self, x):
+        """
+        Map rescaled values with a lookup table of the palette
+
+        Parameters
+        ----------
+        x : array_like
+            Rescaled values. Values outside the [0, 1] range
+            and missing values get the ``na_value``.
+
+        Returns
+        -------
+        out : array_like
+            Mapped values. Categorical if the palette returns
+            strings e.g. colors.
+        """
+        n = int(self.quantize)
+        if n < 2:
+            raise PlotnineError(
+                f"quantize should be at least 2, not {self.quantize}.")
+
+        x = np.asarray(x, dtype=float)
+        lookup = np.asarray(self.palette(np.linspace(0, 1, n)))
+        idx = np.full(len(x), n, dtype=np.intp)
+        valid = (x >= 0) & (x <= 1)
+        idx[valid] = np.rint(x[valid] * (n-1))
+
+        if lookup.dtype.kind in 'UO':
+            # A categorical with a category for each distinct color
+            # and one for the missing values, if they have a color.
+            categories, codes = np.unique(
+                lookup.astype(str),
+                return_inverse=True
+            )
+            codes = np.append(codes, -1)
+            na_value = self.na_value
+            if not pd.isnull(na_value):
+                if na_value not in categories:
+                    categories = np.append(categories, na_value)
+                codes[n] = np.flatnonzero(categories == na_value)[0]
+            return pd.Categorical.from_codes(codes[idx], categories)
+
+        lookup = np.append(lookup.astype(float), np.nan)
+        scaled = lookup[idx]
+        scaled[pd.isnull(scaled)] = self.na_value
+        return scaled
+
     def get_breaks(self, limits=None, strict=False):
         """
         Generate breaks for the axis or legend
@@ -135,13 +135,17 @@ class scale_linetype_manual(_scale_manual):
     """
     _aesthetics = ['linetype']
 
-    def map(self, x, limits=None):
-        result = super().map(x, limits)
+    def palette(self, n):
+        values = super().palette(n)
+
         # Ensure that custom linetypes are tuples, so that they can
         # be properly inserted and extracted from the dataframe
-        if len(result) and hasattr(result[0], '__hash__'):
-            result = [x if isinstance(x, str) else tuple(x) for x in result]
-        return result
+        def as_linetype(x):
+            return tuple(x) if isinstance(x, (list, np.ndarray)) else x
+
+        if isinstance(values, dict):
+            return {k: as_linetype(v) for k, v in values.items()}
+        return [as_linetype(v) for v in values]
 
 
 @document
@@ -165,7 +165,9 @@ class scale_position_continuous(scale_continuous):
         if limits is None:
             limits = self.limits
         scaled = self.oob(series, limits)
-        scaled[pd.isnull(scaled)] = self.na_value
+        isnull = np.asarray(pd.isnull(scaled))
+        if isnull.any():
+            scaled[isnull] = self.na_value
         return scaled
 
 
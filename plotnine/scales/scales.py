@@ -10,7 +10,7 @@ import pandas.api.types as pdtypes
 
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..mapping.aes import aes_to_scale
-from ..utils import Registry, array_kind
+from ..utils import Registry, array_kind, group_slices
 from .scale import scale
 
 _TPL_DUPLICATE_SCALE = """\
@@ -125,11 +125,16 @@ class Scales(List[scale]):
             scales. These start at 1, so subtract 1 to
             get the true index into the scales array
         """
-        idx = np.asarray(idx)
+        slices = self._slices(idx)
         for col in vars:
-            for i, sc in enumerate(self, start=1):
-                bool_idx = (i == idx)
-                sc.train(data.loc[bool_idx, col])
+            if slices is None:
+                self[0].train(data[col])
+                continue
+
+            order, starts, ends = slices
+            x = data[col].iloc[order]
+            for sc, start, end in zip(self, starts, ends):
+                sc.train(x.iloc[start:end])
 
     def map(self, data, vars, idx):
         """
@@ -150,30 +155,46 @@ class Scales(List[scale]):
             scales. These start at 1, so subtract 1 to
             get the true index into the scales array
         """
-        idx = np.asarray(idx)
-        # discrete scales change the dtype
-        # from category to int. Use a new dataframe
-        # to collect these results.
-        # Using `type` preserves the subclass of pd.DataFrame
-        df = type(data)(index=data.index)
-        discrete_cols = []
-
-        # Loop through each variable, mapping across each scale,
-        # then joining back into the copy of the data
+        slices = self._slices(idx)
         for col in vars:
-            use_df = array_kind.discrete(data[col])
-            if use_df:
-                discrete_cols.append(col)
-            for i, sc in enumerate(self, start=1):
-                bool_idx = (i == idx)
-                results = sc.map(data.loc[bool_idx, col])
-                if use_df:
-                    df.loc[bool_idx, col] = results
-                else:
-                    data.loc[bool_idx, col] = results
-
-        for col in discrete_cols:
-            data[col] = df[col]
+            if slices is None:
+                data[col] = np.asarray(self[0].map(data[col]))
+                continue
+
+            # Map the rows of each scale then put the results
+            # back in the order of the data. Discrete scales
+            # change the dtype, so the column is replaced.
+            order, starts, ends = slices
+            x = data[col].iloc[order]
+            results = [
+                np.asarray(sc.map(x.iloc[start:end]))
+                for sc, start, end in zip(self, starts, ends)
+            ]
+            values = np.empty(len(order), dtype=np.result_type(*results))
+            values[order] = np.concatenate(results)
+            data[col] = values
+
+    def _slices(self, idx):
+        """
+        Partition the rows of the data among the scales
+
+        Parameters
+        ----------
+        idx : array-like
+            indices (starting at 1) that link the data
+            points to the scales.
+
+        Returns
+        -------
+        out : tuple | None
+            The order that sorts the rows by scale and the
+            start & end of the rows of each scale in that order.
+            None if there is a single scale for all the rows.
+        """
+        codes = np.asarray(idx, dtype=np.intp) - 1
+        if len(self) == 1 and (codes == 0).all():
+            return None
+        return group_slices(codes, len(self))
 
     def reset(self):
         """
@@ -2,21 +2,26 @@ from __future__ import annotations
 
 import typing
 from copy import deepcopy
+from functools import partial
 
+import numpy as np
 import pandas as pd
 
 from ..exceptions import PlotnineError
 from ..layer import layer
 from ..mapping import aes
+from ..profiling import record
 from ..utils import (
     Registry,
+    add_uniquecols,
     check_required_aesthetics,
     copy_keys,
     data_mapping_as_kwargs,
-    groupby_apply,
+    group_codes,
     is_string,
     remove_missing,
-    uniquecols,
+    split_by_codes,
+    split_by_column,
 )
 
 if typing.TYPE_CHECKING:
@@ -136,6 +141,21 @@ class stat(metaclass=Registry):
 
         return result
 
+    def __getstate__(self):
+        """
+        Pickle without the environment
+
+        The environment cannot be pickled and it is only
+        required in the process that builds the plot. This
+        makes it possible to compute the statistics in other
+        processes.
+
+        stats should not override this method.
+        """
+        state = self.__dict__.copy()
+        state.pop('environment', None)
+        return state
+
     @classmethod
     def aesthetics(cls):
         """
@@ -262,6 +282,40 @@ class stat(metaclass=Registry):
         layout : plotnine.layout.Layout
             Panel layout information
         """
+        tasks = cls.compute_layer_tasks(data, params, layout)
+        # The panel data are slices of the layer data, but they
+        # are free to be modified
+        with pd.option_context('mode.chained_assignment', None):
+            results = [task() for task in tasks]
+        return pd.concat(results, axis=0, ignore_index=True, copy=False)
+
+    @classmethod
+    def compute_layer_tasks(cls, data, params, layout):
+        """
+        Split the computation of the statistics into panel tasks
+
+        The tasks are independent of each other, they can be
+        called in any order and (if the data, scales & parameters
+        can be pickled) in other processes. Concatenating their
+        results in order gives the statistics for the layer.
+
+        stats should not override this method.
+
+        Parameters
+        ----------
+        data : panda.DataFrame
+            Data points for all objects in a layer.
+        params : dict
+            Stat parameters
+        layout : plotnine.layout.Layout
+            Panel layout information
+
+        Returns
+        -------
+        out : list
+            Callables that take no arguments and return the
+            statistics of a panel.
+        """
         check_required_aesthetics(
             cls.REQUIRED_AES,
             list(data.columns) + list(params.keys()),
@@ -274,19 +328,19 @@ class stat(metaclass=Registry):
             name=cls.__name__,
             finite=True)
 
-        def fn(pdata):
-            """
-            Compute function helper
-            """
-            # Given data belonging to a specific panel, grab
-            # the corresponding scales and call the method
-            # that does the real computation
-            if len(pdata) == 0:
-                return pdata
-            pscales = layout.get_scales(pdata['PANEL'].iat[0])
-            return cls.compute_panel(pdata, pscales, **params)
+        if data.empty:
+            return [partial(_compute_panel, cls, data, None, params)]
 
-        return groupby_apply(data, 'PANEL', fn)
+        tasks = []
+        for pdata in split_by_column(data, 'PANEL'):
+            # Given data belonging to a specific panel, grab
+            # the corresponding scales
+            if len(pdata):
+                pscales = layout.get_scales(pdata['PANEL'].iat[0])
+            else:
+                pscales = None
+            tasks.append(partial(_compute_panel, cls, pdata, pscales, params))
+        return tasks
 
     @classmethod
     def compute_panel(cls, data, scales, **params):
@@ -316,27 +370,67 @@ class stat(metaclass=Registry):
         if not len(data):
             return type(data)()
 
-        stats = []
-        for _, old in data.groupby('group'):
-            new = cls.compute_group(old, scales, **params)
-            unique = uniquecols(old)
-            missing = unique.columns.difference(new.columns)
-            u = unique.loc[[0]*len(new), missing].reset_index(drop=True)
-            # concat can have problems with empty dataframes that
-            # have an index
-            if u.empty and len(u):
-                u = type(data)()
-
-            df = pd.concat([new, u], axis=1)
-            stats.append(df)
-
-        stats = pd.concat(stats, axis=0, ignore_index=True)
+        codes, ngroups = group_codes(data['group'])
+        if cls._implements_compute_groups():
+            new, new_codes = cls.compute_groups(data, codes, scales, **params)
+        else:
+            stats, lengths = [], []
+            for old in split_by_codes(data, codes, ngroups):
+                new = cls.compute_group(old, scales, **params)
+                stats.append(new)
+                lengths.append(len(new))
+
+            new = pd.concat(stats, axis=0, ignore_index=True)
+            new_codes = np.repeat(np.arange(len(lengths)), lengths)
+
         # Note: If the data coming in has columns with non-unique
         # values with-in group(s), this implementation loses the
         # columns. Individual stats may want to do some preparation
         # before then fall back on this implementation or override
         # it completely.
-        return stats
+        return add_uniquecols(new, data, codes, new_codes)
+
+    @classmethod
+    def compute_groups(cls, data, codes, scales, **params):
+        """
+        Calculate statistics for all the groups in a panel
+
+        Stats for which the computation can be done for all
+        groups at once should implement this method. It is
+        used by :meth:`compute_panel` in place of calling
+        :meth:`compute_group` for each group.
+
+        Parameters
+        ----------
+        data : dataframe
+            Data for the panel
+        codes : numpy.ndarray
+            Group code of each row in ``data``. The codes are
+            integers ``0, ..., n-1`` in the order of the
+            ``group`` values.
+        scales : types.SimpleNamespace
+            x (``scales.x``) and y (``scales.y``) scale objects.
+        params : dict
+            Parameters
+
+        Returns
+        -------
+        new : dataframe
+            Computed statistics of all the groups. The rows of
+            each group must be together and the groups must be
+            in order of their codes.
+        new_codes : numpy.ndarray
+            Group code of each row in ``new``.
+        """
+        msg = "{} does not implement this method."
+        raise NotImplementedError(msg.format(cls.__name__))
+
+    @classmethod
+    def _implements_compute_groups(cls):
+        """
+        Return True if the stat computes all the groups at once
+        """
+        return cls.compute_groups.__func__ is not stat.compute_groups.__func__
 
     @classmethod
     def compute_group(cls, data, scales, **params):
@@ -392,3 +486,20 @@ class stat(metaclass=Registry):
         # Create, geom from stat, then layer from geom
         from ..geoms.geom import geom
         return layer.from_geom(geom.from_stat(self))
+
+
+def _compute_panel(stat_cls, data, scales, params):
+    """
+    Calculate the statistics for a panel
+
+    This is the task created by :meth:`stat.compute_layer_tasks`.
+    It is a module level function so that it can be pickled.
+    """
+    if len(data) == 0:
+        return data
+    panel = data['PANEL'].iat[0]
+    with record('stat.compute_panel', panel=int(panel)) as rec:
+        result = stat_cls.compute_panel(data, scales, **params)
+        if rec is not None:
+            rec.rows = len(result)
+    return result
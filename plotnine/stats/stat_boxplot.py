@@ -99,6 +99,45 @@ class stat_boxplot(stat):
         }
         return pd.DataFrame(d)
 
+    @classmethod
+    def compute_groups(cls, data, codes, scales, **params):
+        y = data['y'].to_numpy()
+        weights = data.get('weight', None)
+        if weights is not None:
+            weights = np.asarray(weights)
+        res = grouped_boxplot_stats(y, codes, weights, whis=params['coef'])
+        ngroups = len(res['q1'])
+        total_weight = res['n']
+
+        xs = data['x']
+        if pdtypes.is_categorical_dtype(xs):
+            _, first = np.unique(codes, return_index=True)
+            x = xs.array.take(first)
+        else:
+            grouped = pd.Series(xs.to_numpy()).groupby(codes)
+            xmin, xmax = grouped.min().to_numpy(), grouped.max().to_numpy()
+            x = (xmin + xmax) / 2
+
+        width = np.repeat(float(params['width']), ngroups)
+        if not pdtypes.is_categorical_dtype(xs):
+            several = xmin != xmax
+            width[several] = (xmax - xmin)[several] * 0.9
+
+        d = {
+            'ymin': res['whislo'],
+            'lower': res['q1'],
+            'middle': res['med'],
+            'upper': res['q3'],
+            'ymax': res['whishi'],
+            'outliers': res['fliers'],
+            'notchupper': res['cihi'],
+            'notchlower': res['cilo'],
+            'x': x,
+            'width': width,
+            'relvarwidth': np.sqrt(total_weight)
+        }
+        return pd.DataFrame(d), np.arange(ngroups)
+
 
 def weighted_percentile(a, q, weights=None):
     """
@@ -124,7 +163,7 @@ def weighted_percentile(a, q, weights=None):
     q = np.asarray(q)
 
     C = 1
-    idx_s = np.argsort(a)
+    idx_s = np.argsort(a, kind='stable')
     a_s = a[idx_s]
     w_n = weights[idx_s]
     S_N = np.sum(weights)
@@ -202,3 +241,98 @@ def weighted_boxplot_stats(x, weights=None, whis=1.5):
         'cihi': cihi,
     }
     return bpstats
+
+
+def grouped_boxplot_stats(x, codes, weights=None, whis=1.5):
+    """
+    Calculate weighted boxplot statistics of many groups at once
+
+    Parameters
+    ----------
+    x : array_like
+        Data
+    codes : array_like
+        Group code (``0, ..., n-1``) of each value in ``x``.
+    weights : array_like, optional
+        Weights associated with the data.
+    whis : float, optional (default: 1.5)
+        Position of the whiskers beyond the interquartile range.
+
+    Returns
+    -------
+    out : dict
+        The same statistics as :func:`weighted_boxplot_stats`,
+        with an array for each statistic holding the value of
+        each group. It also includes the (weighted) number of
+        values ``n``.
+
+    Notes
+    -----
+    The percentiles of all the groups are interpolated in a single
+    call to :func:`numpy.interp`. The group code is added to the
+    cumulative proportions of the values so that the knots of the
+    groups do not overlap.
+    """
+    x = np.asarray(x)
+    codes = np.asarray(codes)
+    if weights is None:
+        weights = np.ones(len(x))
+
+    order = np.lexsort((x, codes))
+    x_s, c_s, w_s = x[order], codes[order], weights[order]
+    sizes = np.bincount(c_s)
+    starts = np.cumsum(sizes) - sizes
+    ngroups = len(sizes)
+
+    # As in weighted_percentile, with C = 1
+    S_N = np.bincount(c_s, weights=w_s)
+    S_n = np.cumsum(w_s)
+    S_n -= np.repeat(S_n[starts] - w_s[starts], sizes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_n = (S_n - w_s) / (S_N[c_s] - w_s)
+    # Groups with a single value
+    p_n[np.isnan(p_n) & (sizes[c_s] == 1)] = 0
+
+    def percentile(q):
+        qs = q / 100.0 + 2 * np.arange(ngroups)
+        res = np.interp(qs, p_n + 2 * c_s, x_s)
+        single = sizes == 1
+        res[single] = x_s[starts[single]]
+        return res
+
+    q1, med, q3 = percentile(25), percentile(50), percentile(75)
+    n = S_N
+
+    iqr = q3 - q1
+    cilo = med - 1.58 * iqr / np.sqrt(n)
+    cihi = med + 1.58 * iqr / np.sqrt(n)
+
+    # low extreme
+    loval = (q1 - whis * iqr)[c_s]
+    lox = np.minimum.reduceat(np.where(x_s >= loval, x_s, np.inf), starts)
+    whislo = np.where(np.isinf(lox) | (lox > q1), q1, lox)
+
+    # high extreme
+    hival = (q3 + whis * iqr)[c_s]
+    hix = np.maximum.reduceat(np.where(x_s <= hival, x_s, -np.inf), starts)
+    whishi = np.where(np.isinf(hix) | (hix < q3), q3, hix)
+
+    # The outliers are in the order of the data
+    is_flier = (x < whislo[codes]) | (x > whishi[codes])
+    flier_codes = codes[is_flier]
+    fliers = x[is_flier][np.argsort(flier_codes, kind='stable')]
+    counts = np.bincount(flier_codes, minlength=ngroups)
+    fliers = np.split(fliers, np.cumsum(counts)[:-1])
+
+    return {
+        'fliers': fliers,
+        'med': med,
+        'q1': q1,
+        'q3': q3,
+        'iqr': iqr,
+        'whislo': whislo,
+        'whishi': whishi,
+        'cilo': cilo,
+        'cihi': cihi,
+        'n': n,
+    }
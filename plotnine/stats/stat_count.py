@@ -54,6 +54,12 @@ class stat_count(stat):
 
     @classmethod
     def compute_group(cls, data, scales, **params):
+        codes = np.zeros(len(data), dtype=int)
+        new, _ = cls.compute_groups(data, codes, scales, **params)
+        return new
+
+    @classmethod
+    def compute_groups(cls, data, codes, scales, **params):
         x = data['x']
         if ('y' in data) or ('y' in params):
             msg = 'stat_count() must not be used with a y aesthetic'
@@ -61,13 +67,19 @@ class stat_count(stat):
 
         weight = data.get('weight', np.ones(len(x), dtype=int))
         width = params['width']
-        df = pd.DataFrame({'weight': weight, 'x': x})
-        # weighted frequency count
-        count = df.pivot_table(
-            'weight', index=['x'], aggfunc=np.sum)['weight']
-        x = count.index
-        count = count.values
-        return pd.DataFrame({'count': count,
-                             'prop': count / np.abs(count).sum(),
-                             'x': x,
-                             'width': width})
+        df = pd.DataFrame({
+            'code': codes,
+            'weight': np.asarray(weight),
+            'x': np.asarray(x)
+        })
+        # weighted frequency count at each x in each group
+        count = df.groupby(['code', 'x'], sort=True)['weight'].sum()
+        new_codes = count.index.get_level_values('code').to_numpy()
+        x = count.index.get_level_values('x')
+        count = count.to_numpy()
+        total = np.bincount(new_codes, weights=np.abs(count))
+        new = pd.DataFrame({'count': count,
+                            'prop': count / total[new_codes],
+                            'x': x,
+                            'width': width})
+        return new, new_codes
@@ -28,9 +28,11 @@ class stat_density_2d(stat):
         Contour levels. If an integer, it specifies the maximum number
         of levels, if array_like it is the levels themselves. Default
         is 5.
-    package : str in ``['statsmodels', 'scipy', 'sklearn']``
+    package : str in ``['statsmodels', 'scipy', 'sklearn', 'fft']``
         Package whose kernel density estimation to use. Default is
-        statsmodels.
+        statsmodels. ``'fft'`` (or ``'binned'``) bins the data on
+        a grid and convolves it with a gaussian kernel, it is much
+        faster than the others for large datasets.
     kde_params : dict
         Keyword arguments to pass on to the kde class.
 
@@ -39,6 +41,7 @@ class stat_density_2d(stat):
     statsmodels.nonparametric.kde.KDEMultivariate
     scipy.stats.gaussian_kde
     sklearn.neighbors.KernelDensity
+    plotnine.stats.density.kde_fft
     """
 
     _aesthetics_doc = """
@@ -56,3 +56,45 @@ class stat_ecdf(stat):
         y = ECDF(data['x'])(x)
         res = pd.DataFrame({'x': x, 'y': y})
         return res
+
+    @classmethod
+    def compute_groups(cls, data, codes, scales, **params):
+        # Sort by group then x, the ecdf at a value is the
+        # rank (within the group) of the last occurence of
+        # the value.
+        x = data['x'].to_numpy()
+        order = np.lexsort((x, codes))
+        x, codes = x[order], codes[order]
+        sizes = np.bincount(codes)
+        starts = np.cumsum(sizes) - sizes
+
+        if params['n'] is None:
+            is_last = np.ones(len(x), dtype=bool)
+            is_last[:-1] = (codes[1:] != codes[:-1]) | (x[1:] != x[:-1])
+            rank = np.arange(1, len(x)+1) - starts[codes]
+            new_codes = codes[is_last]
+            new_x = x[is_last]
+            y = rank[is_last] / sizes[new_codes]
+        else:
+            n = params['n']
+            ngroups = len(sizes)
+            xmin = x[starts]
+            xmax = x[starts + sizes - 1]
+            new_codes = np.repeat(np.arange(ngroups), n)
+            new_x = np.linspace(xmin, xmax, n, axis=1).ravel()
+            # Sort the points with the values, within the groups,
+            # a point after the values equal to it. The ecdf at a
+            # point is the number of values before it in the group.
+            is_point = np.repeat([False, True], [len(x), len(new_x)])
+            all_codes = np.hstack([codes, new_codes])
+            all_x = np.hstack([x, new_x])
+            all_order = np.lexsort((is_point, all_x, all_codes))
+            n_before = np.cumsum(~is_point[all_order])
+            points = is_point[all_order]
+            y = np.empty(len(new_x))
+            y[all_order[points] - len(x)] = n_before[points]
+            y -= starts[new_codes]
+            y /= sizes[new_codes]
+
+        res = pd.DataFrame({'x': new_x, 'y': y})
+        return res, new_codes
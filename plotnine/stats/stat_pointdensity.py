@@ -17,9 +17,11 @@ class stat_pointdensity(stat):
     Parameters
     ----------
     {common_parameters}
-    package : str in ``['statsmodels', 'scipy', 'sklearn']``
+    package : str in ``['statsmodels', 'scipy', 'sklearn', 'fft']``
         Package whose kernel density estimation to use. Default is
-        statsmodels.
+        statsmodels. ``'fft'`` (or ``'binned'``) bins the data on
+        a grid and convolves it with a gaussian kernel, it is much
+        faster than the others for large datasets.
     kde_params : dict
         Keyword arguments to pass on to the kde class.
 
@@ -28,6 +30,7 @@ class stat_pointdensity(stat):
     statsmodels.nonparametric.kde.KDEMultivariate
     scipy.stats.gaussian_kde
     sklearn.neighbors.KernelDensity
+    plotnine.stats.density.kde_fft
     """
 
     _aesthetics_doc = """
@@ -1,7 +1,8 @@
+import numpy as np
+
 from ..doctools import document
 from ..mapping.aes import ALL_AESTHETICS
 from ..mapping.evaluation import after_stat
-from ..utils import groupby_apply
 from .stat import stat
 
 
@@ -42,25 +43,22 @@ class stat_sum(stat):
         if 'weight' not in data:
             data['weight'] = 1
 
-        def count(df):
-            """
-            Do a weighted count
-            """
-            df['n'] = df['weight'].sum()
-            return df.iloc[0:1]
-
-        def ave(df):
-            """
-            Calculate proportion values
-            """
-            df['prop'] = df['n']/df['n'].sum()
-            return df
-
         # group by all present aesthetics other than the weight,
         # then sum them (i.e no. of uniques) to get the raw count
         # 'n', and the proportions 'prop' per group
         group_by = (set(data.columns) & ALL_AESTHETICS) - {'weight'}
         group_by = list(group_by)
-        counts = groupby_apply(data, group_by, count)
-        counts = groupby_apply(counts, 'group', ave)
-        return counts
+        grouped = data.groupby(group_by, sort=True)
+
+        # The first row of each unique combination (in sorted order)
+        # carries the weighted count
+        ids = grouped.ngroup().to_numpy()
+        valid = (ids >= 0).nonzero()[0]
+        _, first = np.unique(ids[valid], return_index=True)
+        counts = data.iloc[valid[first]].copy()
+        counts['n'] = grouped['weight'].sum().to_numpy()
+        counts = counts.sort_values('group', kind='mergesort')
+        counts['prop'] = (
+            counts['n'] / counts.groupby('group')['n'].transform('sum')
+        )
+        return counts.reset_index(drop=True)
@@ -4,7 +4,7 @@ import scipy.stats
 
 from ..doctools import document
 from ..exceptions import PlotnineError
-from ..utils import get_valid_kwargs, uniquecols
+from ..utils import add_uniquecols, get_valid_kwargs, uniquecols
 from .stat import stat
 
 
@@ -125,12 +125,58 @@ def mean_se(series, mult=1):
                          'ymax': m+se})
 
 
+def _grouped_mean_cl_normal(grouped, confidence_interval=0.95):
+    """
+    :func:`mean_cl_normal` for all the groups at once
+    """
+    m = grouped.mean()
+    n = grouped.size()
+    se = grouped.std() / np.sqrt(n)
+    h = se * scipy.stats.t._ppf((1+confidence_interval)/2, n-1)
+    return pd.DataFrame({'y': m, 'ymin': m-h, 'ymax': m+h})
+
+
+def _grouped_mean_sdl(grouped, mult=2):
+    """
+    :func:`mean_sdl` for all the groups at once
+    """
+    m = grouped.mean()
+    s = grouped.std()
+    return pd.DataFrame({'y': m, 'ymin': m-mult*s, 'ymax': m+mult*s})
+
+
+def _grouped_median_hilow(grouped, confidence_interval=0.95):
+    """
+    :func:`median_hilow` for all the groups at once
+    """
+    tail = (1 - confidence_interval) / 2
+    return pd.DataFrame({'y': grouped.median(),
+                         'ymin': grouped.quantile(tail),
+                         'ymax': grouped.quantile(1 - tail)})
+
+
+def _grouped_mean_se(grouped, mult=1):
+    """
+    :func:`mean_se` for all the groups at once
+    """
+    m = grouped.mean()
+    se = mult * np.sqrt(grouped.var(ddof=0) / grouped.size())
+    return pd.DataFrame({'y': m, 'ymin': m-se, 'ymax': m+se})
+
+
 function_dict = {'mean_cl_boot': mean_cl_boot,
                  'mean_cl_normal': mean_cl_normal,
                  'mean_sdl': mean_sdl,
                  'median_hilow': median_hilow,
                  'mean_se': mean_se}
 
+# Summary functions that can compute the summaries of all
+# the groups in a panel at once
+grouped_function_dict = {'mean_cl_normal': _grouped_mean_cl_normal,
+                         'mean_sdl': _grouped_mean_sdl,
+                         'median_hilow': _grouped_median_hilow,
+                         'mean_se': _grouped_mean_se}
+
 
 def make_summary_fun(fun_data, fun_y, fun_ymin, fun_ymax, fun_args):
     """
@@ -275,6 +321,13 @@ class stat_summary(stat):
 
     @classmethod
     def compute_panel(cls, data, scales, **params):
+        fun_data = params['fun_data']
+        uses_fun_data = not any(
+            params[k] for k in ('fun_y', 'fun_ymin', 'fun_ymax')
+        )
+        if uses_fun_data and fun_data in grouped_function_dict:
+            return cls._compute_panel_grouped(data, scales, **params)
+
         func = make_summary_fun(params['fun_data'], params['fun_y'],
                                 params['fun_ymin'], params['fun_ymax'],
                                 params['fun_args'])
@@ -295,3 +348,24 @@ class stat_summary(stat):
 
         new_data = pd.concat(summaries, axis=0, ignore_index=True)
         return new_data
+
+    @classmethod
+    def _compute_panel_grouped(cls, data, scales, **params):
+        """
+        Summarise all the pieces with a single grouped computation
+        """
+        func = grouped_function_dict[params['fun_data']]
+        kwargs = get_valid_kwargs(func, params['fun_args'])
+        grouped = data.groupby(['group', 'x'], sort=True)
+        summary = func(grouped['y'], **kwargs)
+        keys = summary.index
+        summary = summary.reset_index(drop=True)
+        summary['x'] = keys.get_level_values('x')
+        summary['group'] = keys.get_level_values('group')
+        codes = grouped.ngroup().to_numpy()
+        return add_uniquecols(
+            summary,
+            data.drop('y', axis=1),
+            codes,
+            np.arange(len(summary))
+        )
@@ -202,7 +202,7 @@ class theme:
         axes after plot has completed. Subclasses that override this
         method should make sure that the base class method is called.
         """
-        for th in self.themeables.values():
+        for th in self.themeables.resolve():
             th.apply_figure(figure)
             for ax in axs:
                 th.apply(ax)
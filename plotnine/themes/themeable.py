@@ -225,8 +225,31 @@ class Themeables(dict):
     Collection of themeables
 
     The key is the name of the class.
+
+    The sorted themeables, the values of the properties and the
+    resolved themeables are computed once and reused until the
+    collection is modified.
     """
 
+    def __setitem__(self, key, value):
+        self._clear_cache()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._clear_cache()
+        super().__delitem__(key)
+
+    def _clear_cache(self):
+        self.__dict__.pop('_cache', None)
+
+    @property
+    def _cache(self):
+        try:
+            return self.__dict__['_cache']
+        except KeyError:
+            cache = self.__dict__['_cache'] = {}
+            return cache
+
     def update(self, other):
         """
         Update themeables with those from `other`
@@ -239,6 +262,8 @@ class Themeables(dict):
         of type :class:`text` can be added to override an
         existing specific one of type :class:`axis_text_x`.
         """
+        # Merging modifies the properties of the themeables
+        self._clear_cache()
         for new in other.values():
             new_key = new.__class__.__name__
 
@@ -272,7 +297,76 @@ class Themeables(dict):
         def key(th):
             return len(th.__class__.__mro__)
 
-        return sorted(dict.values(self), key=key, reverse=True)
+        try:
+            values = self._cache['values']
+        except KeyError:
+            values = sorted(dict.values(self), key=key, reverse=True)
+            self._cache['values'] = values
+        return list(values)
+
+    def resolve(self):
+        """
+        Return the themeables that carry out the theming
+
+        Applying a themeable applies each themeable class in its
+        hierarchy that implements the theming, with its properties.
+        e.g. :class:`axis_text` applies :class:`axis_text_x` and
+        :class:`axis_text_y`. When the themeables are applied in
+        order, the properties of each class are set as many times
+        as there are themeables that include it.
+
+        The resolved themeables set them once. They are of the
+        classes that implement the theming, with the properties of
+        all the themeables that include the class merged in order.
+        A blank themeable is not merged, it interrupts the merging.
+        Each resolved themeable takes the place of the last themeable
+        merged into it, so that themeables that theme the same
+        artists (e.g. :class:`panel_background` and
+        :class:`panel_border`) are applied in the same order.
+
+        Returns
+        -------
+        out : list
+            Themeables, one for each class that implements the
+            theming, and one more for every blank that interrupts
+            the merging of its properties.
+
+        Notes
+        -----
+        This relies on the classes that implement the theming
+        inheriting directly (and only) from :class:`themeable`.
+        """
+        try:
+            return self._cache['resolve']
+        except KeyError:
+            pass
+
+        # Each op is [position, is_blank, theme_element, properties]
+        ops = {}
+        for i, th in enumerate(self.values()):
+            blank = th.is_blank()
+            klasses = reversed(th.__class__.__mro__)
+            for j, klass in enumerate(klasses):
+                if not _implements_theming(klass):
+                    continue
+                lst = ops.setdefault(klass, [])
+                if blank or not lst or lst[-1][1]:
+                    lst.append([(i, j), blank, th.theme_element, {}])
+                else:
+                    lst[-1][0] = (i, j)
+                    lst[-1][2] = th.theme_element
+                lst[-1][3].update(th.properties)
+
+        lst = [(op, klass) for klass, _ops in ops.items() for op in _ops]
+        lst.sort(key=lambda item: item[0][0])
+        resolved = []
+        for (_, _, theme_element, properties), klass in lst:
+            th = klass(theme_element)
+            th.properties = properties
+            resolved.append(th)
+
+        self._cache['resolve'] = resolved
+        return resolved
 
     def property(self, name, key='value'):
         """
@@ -300,12 +394,19 @@ class Themeables(dict):
         KeyError
             If key is in not in any of themeables
         """
+        cache = self._cache.setdefault('property', {})
+        try:
+            return cache[name, key]
+        except KeyError:
+            pass
+
         hlist = themeable._hierarchy[name]
         scalar = key == 'value'
         for th in hlist:
             with suppress(KeyError):
                 value = self[th].properties[key]
                 if not scalar or value is not None:
+                    cache[name, key] = value
                     return value
 
         msg = "'{}' is not in the properties of {} "
@@ -333,6 +434,20 @@ class Themeables(dict):
         return False
 
 
+def _implements_theming(klass):
+    """
+    Return True if the themeable class applies any theming
+    """
+    return (
+        issubclass(klass, themeable)
+        and klass is not themeable
+        and any(
+            name in klass.__dict__
+            for name in ('apply', 'blank', 'apply_figure', 'blank_figure')
+        )
+    )
+
+
 def _blankout_rect(rect):
     """
     Make rect invisible
@@ -9,7 +9,7 @@ import itertools
 import typing
 import warnings
 from contextlib import suppress
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from warnings import warn
 from weakref import WeakValueDictionary
 
@@ -137,28 +137,47 @@ def match(
         is assigned the nomatch value.
     start: int
         type of indexing to use. Most likely 0 or 1
+
+    Notes
+    -----
+    ``NaN`` matches ``NaN`` and ``None`` matches ``None``.
     """
     # NOTE: This function gets called a lot. If it can
     # be optimised, it should.
-    lookup = {}
-    for i, x in enumerate(v2):
-        if x not in lookup:
-            lookup[x] = i
+    if pdtypes.is_categorical_dtype(v1):
+        # Match the categories & the missing value, and take
+        # the result of each value with its code
+        cat = pd.Categorical(v1)
+        values = cat.categories.insert(len(cat.categories), np.nan)
+        res = match(values, v2, nomatch, incomparables, start)
+        return res[cat.codes]
+
+    lookup = pd.Index(v2, tupleize_cols=False)
+    positions = None
+    if not lookup.is_unique:
+        first = ~lookup.duplicated()
+        positions = np.flatnonzero(first)
+        lookup = lookup[first]
+
+    target = pd.Index(v1, tupleize_cols=False)
+    idx = lookup.get_indexer(target)
+    nomatched = idx == -1
+    if lookup.hasnans:
+        # None and NaN do not match each other
+        check = np.flatnonzero(~nomatched & lookup.isna()[idx])
+        if len(check):
+            is_none1 = np.array([x is None for x in target[check]])
+            is_none2 = np.array([x is None for x in lookup[idx[check]]])
+            nomatched[check[is_none1 != is_none2]] = True
+    if positions is not None:
+        idx = positions[idx]
 
     if incomparables:
-        skip = set(incomparables) if incomparables else set()
-        lst = [
-            lookup[x]+start
-            if x not in skip and x in lookup else nomatch
-            for x in v1
-        ]
-    else:
-        lst = [
-            lookup[x]+start
-            if x in lookup else nomatch
-            for x in v1
-        ]
-    return np.array(lst)
+        nomatched |= target.isin(incomparables)
+
+    res = np.asarray(idx + start, dtype=np.int64)
+    res[nomatched] = nomatch
+    return res
 
 
 def _margins(vars, margins=True):
@@ -270,7 +289,10 @@ def add_margins(
     return merged
 
 
-def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
+def ninteraction(
+    df: pd.DataFrame,
+    drop: bool = False
+) -> npt.NDArray[np.int64]:
     """
     Compute a unique numeric id for each unique row in
     a data frame. The ids start at 1 -- in the spirit
@@ -286,7 +308,7 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
 
     Returns
     -------
-    out : list
+    out : numpy.array
         Row asssignments.
 
     Notes
@@ -295,38 +317,37 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
     of categorical variables.
     """
     if len(df) == 0:
-        return []
+        return np.array([], dtype=np.int64)
 
     # Special case for single variable
     if len(df.columns) == 1:
-        return _id_var(df[df.columns[0]], drop)
-
-    # Calculate individual ids
-    ids = df.apply(_id_var, axis=0)
-    ids = ids.reindex(columns=list(reversed(ids.columns)))
-
-    # Calculate dimensions
-    def len_unique(x):
-        return len(np.unique(x))
-    ndistinct = ids.apply(len_unique, axis=0).values
-
-    combs = np.array(
-        np.hstack([1, np.cumprod(ndistinct[:-1])])
-    )
-    mat = np.array(ids)
-    res = (mat - 1) @ combs.T + 1
-    res = np.array(res).flatten().tolist()
-
+        return _id_var(df.iloc[:, 0], drop)
+
+    # Combine the ids of the variables, the first variable
+    # varies the slowest. When dropping, the combined ids are
+    # renumbered before they can get too large.
+    res = np.zeros(len(df), dtype=np.int64)
+    n = 1
+    for i in range(len(df.columns)):
+        ids = _id_var(df.iloc[:, i])
+        ndistinct = ids.max()
+        if drop and n * ndistinct > 2**31:
+            res = _id_var(res) - 1
+            n = res.max() + 1
+        res = res * ndistinct + (ids - 1)
+        n *= ndistinct
+
+    res += 1
     if drop:
         return _id_var(res, drop)
     else:
-        return list(res)
+        return res
 
 
 def _id_var(
-    x: pd.Series[Any],
+    x: pd.Series[Any] | npt.ArrayLike,
     drop: bool = False
-) -> list[int]:
+) -> npt.NDArray[np.int64]:
     """
     Assign ids to items in x. If two items
     are the same, they get the same id.
@@ -337,36 +358,40 @@ def _id_var(
         items to associate ids with
     drop : bool
         Whether to drop unused factor levels
+
+    Notes
+    -----
+    The ids start at 1 and are in the sorted order of the
+    items (the order of the levels for categoricals). Missing
+    values get the largest id, except for categoricals with
+    dropped levels, where they get 0.
     """
     if len(x) == 0:
-        return []
-
-    categorical = pdtypes.is_categorical_dtype(x)
+        return np.array([], dtype=np.int64)
 
-    if categorical:
+    if pdtypes.is_categorical_dtype(x):
         if drop:
             x = x.cat.remove_unused_categories()
-            lst = list(x.cat.codes + 1)
-        else:
-            has_nan = any(np.isnan(i) for i in x if isinstance(i, float))
-            if has_nan:
-                # NaNs are -1, we give them the highest code
-                nan_code = -1
-                new_nan_code = np.max(x.cat.codes) + 1
-                lst = [val if val != nan_code else new_nan_code for val in x]
-            else:
-                lst = list(x.cat.codes + 1)
-    else:
-        try:
-            levels = sorted(set(x))
-        except TypeError:
-            # x probably has NANs
-            levels = multitype_sort(set(x))
+        codes = np.asarray(x.cat.codes, dtype=np.int64) + 1
+        if not drop:
+            # NaNs are 0, we give them the highest id
+            nan = codes == 0
+            if nan.any():
+                codes[nan] = codes.max() + 1
+        return codes
 
-        lst = match(x, levels)  # type: ignore
-        lst = [item + 1 for item in lst]
+    try:
+        codes, uniques = pd.factorize(x, sort=True)
+    except TypeError:
+        # x probably has items of different types
+        codes, uniques = pd.factorize(x)
+        order = match(multitype_sort(uniques), uniques)
+        codes = np.where(codes == -1, -1, np.argsort(order)[codes])
 
-    return lst
+    codes = np.asarray(codes, dtype=np.int64)
+    # NaNs are -1, we give them the highest id
+    codes[codes == -1] = len(uniques)
+    return codes + 1
 
 
 def join_keys(x, y, by=None):
@@ -398,7 +423,6 @@ def join_keys(x, y, by=None):
 
     joint = pd.concat([x[by], y[by]], ignore_index=True)
     keys = ninteraction(joint, drop=True)
-    keys = np.asarray(keys)
     nx, ny = len(x), len(y)
     return {'x': keys[np.arange(nx)],
             'y': keys[nx + np.arange(ny)]}
@@ -425,6 +449,94 @@ def uniquecols(df):
     return df
 
 
+def add_uniquecols(new, df, codes, new_codes):
+    """
+    Add the columns that are constant within groups
+
+    This is a vectorised equivalent of adding the
+    :func:`uniquecols` of each group in ``df`` to the
+    rows of the corresponding group in ``new``.
+
+    Parameters
+    ----------
+    new : dataframe
+        Computed data to which columns will be added. It is
+        modified inplace.
+    df : dataframe
+        Data from which to take the columns.
+    codes : array_like
+        Group code (starting at 0) of each row in ``df``.
+    new_codes : array_like
+        Group code of each row in ``new``.
+
+    Returns
+    -------
+    out : dataframe
+        ``new`` with columns missing from it but constant
+        within a group in ``df``. If a column is only constant
+        in some of the groups, the other groups get ``NaN``
+        values.
+    """
+    codes = np.asarray(codes)
+    new_codes = np.asarray(new_codes)
+    if not len(df) or not len(new):
+        return new
+
+    # Each value is compared with the first value of its group.
+    # The order and the first rows of the groups are computed
+    # once for all the columns.
+    ngroups = codes.max() + 1
+    order, starts, ends = group_slices(codes, ngroups)
+    sorted_codes = codes[order]
+    first = order[starts[sorted_codes]]
+    take = order[starts[new_codes]]
+
+    for col in df.columns.difference(new.columns):
+        s = df[col]
+        try:
+            is_unique = _is_constant(s.array, order, first, sorted_codes,
+                                     ngroups)
+        except (TypeError, ValueError):
+            # Values that cannot be compared
+            continue
+
+        if not is_unique.any():
+            continue
+
+        values = pd.Series(s.array.take(take), index=new.index)
+        if not is_unique.all():
+            values = values.where(is_unique[new_codes])
+        new[col] = values
+
+    return new
+
+
+def _is_constant(arr, order, first, sorted_codes, ngroups):
+    """
+    Return whether the values are constant within each group
+
+    Helper for :func:`add_uniquecols`. Missing values are equal
+    to each other.
+    """
+    values = arr.take(order)
+    first_values = arr.take(first)
+    with warnings.catch_warnings():
+        # Elementwise comparison of arrays of arrays
+        warnings.simplefilter('ignore', DeprecationWarning)
+        warnings.simplefilter('ignore', FutureWarning)
+        equal = values == first_values
+
+    if not isinstance(equal, (np.ndarray, pd.api.extensions.ExtensionArray)):
+        raise TypeError("Values cannot be compared")
+    elif equal.dtype != bool:
+        # Nullable booleans or an array of objects
+        equal = pd.array(equal, dtype='boolean').fillna(False).to_numpy(bool)
+
+    equal |= pd.isna(values) & pd.isna(first_values)
+    mismatches = np.bincount(sorted_codes[~equal], minlength=ngroups)
+    return mismatches == 0
+
+
 def jitter(x, factor=1, amount=None, random_state=None):
     """
     Add a small amount of noise to values in an array_like
@@ -559,6 +671,10 @@ def to_rgba(colors, alpha):
     make plots with continuous alpha values innefficient.
     However :), the colors can be rgba hex values or
     list-likes and the alpha dimension will be respected.
+
+    See Also
+    --------
+    rgba_array : For many colors, the rgba values as an array.
     """
     def is_iterable(var):
         return np.iterable(var) and not is_string(var)
@@ -611,6 +727,61 @@ def to_rgba(colors, alpha):
             return to_rgba_hex(colors, alpha)
 
 
+def rgba_array(colors, alpha):
+    """
+    Convert colors to an array of rgba values
+
+    Parameters
+    ----------
+    colors : iterable | str | tuple
+        color(s) to convert
+    alpha : iterable | float
+        alpha value(s). They are not applied to colors
+        that have an alpha channel.
+
+    Returns
+    -------
+    out : ndarray
+        Array of shape ``(n, 4)``. Missing colors i.e.
+        ``None``, ``''`` and ``'none'`` are transparent.
+
+    Notes
+    -----
+    This is the numerical counterpart of :func:`to_rgba`.
+    Each unique color is converted only once.
+    """
+    if is_string(colors) or colors is None or mcolors.is_color_like(colors):
+        n = len(alpha) if np.iterable(alpha) else 1
+        colors = [colors] * n
+
+    if isinstance(colors, pd.Categorical):
+        # e.g. colors mapped with a lookup table
+        colors = pd.Series(colors)
+    elif not isinstance(colors, pd.Series):
+        colors = pd.Series(list(colors), dtype=object)
+
+    codes, uniques = pd.factorize(colors)
+
+    # The last row is for the missing colors, i.e code -1
+    lookup = np.zeros((len(uniques)+1, 4))
+    keep_alpha = np.ones(len(uniques)+1, dtype=bool)
+    for i, c in enumerate(uniques):
+        if c == '' or (isinstance(c, str) and c.lower() == 'none'):
+            continue
+        lookup[i] = mcolors.to_rgba(c)
+        keep_alpha[i] = (
+            (isinstance(c, tuple) and len(c) == 4) or
+            (isinstance(c, str) and c[0] == '#' and len(c) == 9)
+        )
+
+    rgba = lookup[codes]
+    apply_alpha = ~keep_alpha[codes]
+    if np.iterable(alpha):
+        alpha = np.asarray(alpha, dtype=float)[apply_alpha]
+    rgba[apply_alpha, 3] = alpha
+    return rgba
+
+
 def groupby_apply(df, cols, func, *args, **kwargs):
     """
     Groupby cols and call the function fn on each grouped dataframe.
@@ -629,6 +800,13 @@ def groupby_apply(df, cols, func, *args, **kwargs):
     This is meant to avoid pandas df.groupby('col').apply(fn, *args),
     as it calls fn twice on the first dataframe. If the nested code also
     does the same thing, it can be very expensive
+
+    The data is sorted once and each group is a slice of the sorted
+    data. If there is only one group, the data is not split at all.
+    When the function returns frames with the same columns and the
+    same number of rows as the groups, the columns of the result
+    are written into preallocated arrays instead of concatenating
+    the frames.
     """
     if df.empty:
         return df.copy()
@@ -638,12 +816,234 @@ def groupby_apply(df, cols, func, *args, **kwargs):
     except KeyError:
         axis = 0
 
-    lst = []
-    for _, d in df.groupby(cols):
-        # function fn should be free to modify dataframe d, therefore
-        # do not mark d as a slice of df i.e no SettingWithCopyWarning
-        lst.append(func(d, *args, **kwargs))
-    return pd.concat(lst, axis=axis, ignore_index=True)
+    if isinstance(cols, str) or len(cols) == 1:
+        col = cols if isinstance(cols, str) else cols[0]
+        codes, ngroups = group_codes(df[col])
+    else:
+        # Rows with missing values are in no group
+        grouped = df.groupby(cols)
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        ngroups = grouped.ngroups
+    groups = list(split_by_codes(df, codes, ngroups))
+
+    # function fn should be free to modify dataframe d, therefore
+    # do not mark d as a slice of df i.e no SettingWithCopyWarning
+    with pd.option_context('mode.chained_assignment', None):
+        lst = [func(d, *args, **kwargs) for d in groups]
+
+    if axis == 0:
+        result = _combine_same_length(lst, [len(d) for d in groups])
+        if result is not None:
+            return result
+
+    # The results are new objects, no need to copy them
+    return pd.concat(lst, axis=axis, ignore_index=True, copy=False)
+
+
+def _combine_same_length(
+    lst: list[pd.DataFrame],
+    lengths: list[int]
+) -> pd.DataFrame | None:
+    """
+    Combine the frames computed from the groups without concat
+
+    Parameters
+    ----------
+    lst : list
+        Dataframes computed from the groups
+    lengths : list
+        Number of rows in each group
+
+    Returns
+    -------
+    out : dataframe | None
+        Rows of the frames, one after the other. ``None`` if the
+        frames do not have the same number of rows as the groups,
+        do not all have the same columns, or have a column that
+        is not of the same type in all the frames.
+    """
+    if len(lst) < 2 or not all(isinstance(d, pd.DataFrame) for d in lst):
+        return None
+
+    columns = lst[0].columns
+    if not columns.is_unique:
+        return None
+
+    for d, n in zip(lst, lengths):
+        if len(d) != n or not (d.columns is columns or
+                               d.columns.equals(columns)):
+            return None
+
+    data = {}
+    total = sum(lengths)
+    for j, name in enumerate(columns):
+        arrays = [d._get_column_array(j) for d in lst]
+        dtype = arrays[0].dtype
+        if any(a.dtype != dtype for a in arrays):
+            return None
+        elif isinstance(dtype, np.dtype):
+            data[name] = np.concatenate(arrays, out=np.empty(total, dtype))
+        elif isinstance(dtype, pd.CategoricalDtype):
+            codes = np.concatenate(
+                [a.codes for a in arrays],
+                out=np.empty(total, arrays[0].codes.dtype)
+            )
+            data[name] = pd.Categorical.from_codes(codes, dtype=dtype)
+        else:
+            data[name] = type(arrays[0])._concat_same_type(arrays)
+
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+def group_slices(
+    codes: npt.ArrayLike,
+    ngroups: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """
+    Compute the order & boundaries that partition the data into groups
+
+    Parameters
+    ----------
+    codes : array_like
+        Group code of each row, ``0, ..., ngroups-1``. Rows with
+        a code of ``-1`` do not belong to any group.
+    ngroups : int
+        Number of groups. Groups without any rows get empty
+        slices.
+
+    Returns
+    -------
+    order : array
+        Indices that sort the rows by group. The rows within a
+        group keep their relative order and the rows that do not
+        belong to any group are left out.
+    starts : array
+        Start (in the sorted rows) of each group
+    ends : array
+        End (in the sorted rows) of each group
+    """
+    codes = np.asarray(codes)
+    if len(codes) and codes[0] >= 0 and (codes[1:] >= codes[:-1]).all():
+        # The rows are already sorted e.g. the layer data is sorted
+        # by PANEL and the statistics are computed in group order.
+        order = np.arange(len(codes))
+        counts = np.bincount(codes, minlength=ngroups)
+        ends = np.cumsum(counts)
+        return order, ends - counts, ends
+
+    order = np.argsort(codes, kind='stable')
+    missing = np.count_nonzero(codes < 0)
+    order = order[missing:]
+    counts = np.bincount(codes[codes >= 0], minlength=ngroups)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    return order, starts, ends
+
+
+def split_by_column(df: pd.DataFrame, col: str) -> Iterator[pd.DataFrame]:
+    """
+    Split dataframe into groups of the values in a column
+
+    The groups are yielded in the same order as those of
+    :meth:`pandas.DataFrame.groupby`; sorted with missing values
+    left out, and with a group (possibly empty) for every category
+    of a categorical column.
+
+    Parameters
+    ----------
+    df : dataframe
+        Data
+    col : str
+        Column with the grouping values
+
+    Yields
+    ------
+    out : dataframe
+        Rows of a group. Modifying it does not affect ``df``.
+    """
+    codes, ngroups = group_codes(df[col])
+    return split_by_codes(df, codes, ngroups)
+
+
+def split_by_codes(
+    df: pd.DataFrame,
+    codes: npt.NDArray[np.intp],
+    ngroups: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Split dataframe into groups given the group codes of the rows
+
+    Parameters
+    ----------
+    df : dataframe
+        Data
+    codes : array
+        Group code of each row, ``0, ..., ngroups-1``. Rows with
+        a code of ``-1`` do not belong to any group.
+    ngroups : int
+        Number of groups
+
+    Yields
+    ------
+    out : dataframe
+        Rows of a group, in order of the codes. Modifying it
+        does not affect ``df``.
+    """
+    if ngroups == 1 and len(codes) and codes[0] == 0 and (codes == 0).all():
+        yield df.copy()
+        return
+
+    order, starts, ends = group_slices(codes, ngroups)
+    sorted_df = df.take(order)
+    for start, end in zip(starts, ends):
+        group = sorted_df.iloc[start:end]
+        # The slice is of a frame that is not shared, modifying it
+        # should not warn about setting values on a copy
+        group._is_copy = None
+        yield group
+
+
+def group_codes(x: pd.Series) -> tuple[npt.NDArray[np.intp], int]:
+    """
+    Return the group codes of the values in a column
+
+    The codes number the sorted unique values, and missing values
+    have a code of ``-1``. Every category of a categorical column
+    is a group.
+
+    Parameters
+    ----------
+    x : pandas.Series
+        Grouping values
+
+    Returns
+    -------
+    codes : array
+        Group code of each value
+    ngroups : int
+        Number of groups
+    """
+    if pdtypes.is_categorical_dtype(x):
+        return x.cat.codes.to_numpy(), len(x.cat.categories)
+
+    values = x.to_numpy()
+    if (
+        values.dtype.kind in 'biuf'
+        and x.is_monotonic_increasing
+        and not x.hasnans
+    ):
+        # Sorted values (e.g. PANEL & group after the statistics),
+        # a group starts where the value changes.
+        if not len(values):
+            return np.zeros(0, dtype=np.intp), 0
+        changes = np.empty(len(values), dtype=bool)
+        changes[0] = False
+        np.not_equal(values[1:], values[:-1], out=changes[1:])
+        codes = np.cumsum(changes, dtype=np.intp)
+        return codes, int(codes[-1]) + 1
+
+    codes, uniques = pd.factorize(x, sort=True)
+    return codes, len(uniques)
 
 
 def pivot_apply(df, column, index, func, *args, **kwargs):
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 from plotnine import labs, lims, qplot, theme, theme_minimal
-from plotnine.animation import PlotnineAnimation
+from plotnine.animation import PlotnineAnimation, PlotnineFuncAnimation
 from plotnine.exceptions import PlotnineError
 
 plt.switch_backend('Agg')  # TravisCI needs this
@@ -91,3 +94,47 @@ def test_animation_different_scales():
     plots = [plot(i) for i in range(3)]
     with pytest.raises(PlotnineError):
         _PlotnineAnimation(plots, interval=100, repeat_delay=500)
+
+
+def test_func_animation():
+    def plot(i):
+        return (qplot(x, [v*(i+1) for v in y], color=colors[i],
+                      xlab='x', ylab='y')
+                + lims(color=(1, 7), y=(0, 15))
+                + labs(color='color')
+                + theme_minimal()
+                + _theme
+                )
+
+    with ThreadPoolExecutor(1) as executor:
+        anim = PlotnineFuncAnimation(plot, 3, executor=executor)
+        ax = anim._fig.axes[0]
+        points = ax.collections[0]
+        n_children = len(ax.get_children())
+        anim.to_jshtml()
+
+    # The artists of the first frame are updated in place
+    # with the data of the last frame
+    assert ax.collections[0] is points
+    assert len(ax.get_children()) == n_children
+    assert np.allclose(points.get_offsets()[:, 1], [v*3 for v in y])
+
+    expected = plot(2).draw().axes[0].collections[0]
+    assert np.allclose(points.get_facecolors(), expected.get_facecolors())
+
+
+def test_func_animation_different_scale_limits():
+    def plot(i):
+        if i == 2:
+            _lims = lims(color=(3, 7))
+        else:
+            _lims = lims(color=(1, 7))
+        return (qplot(x, y, color=colors[i], xlab='x', ylab='y')
+                + _lims
+                + labs(color='color')
+                + theme_minimal()
+                + _theme
+                )
+
+    with pytest.raises(PlotnineError):
+        PlotnineFuncAnimation(plot, 3).to_jshtml()
@@ -1,19 +1,26 @@
+import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
+from matplotlib.colors import to_hex
+from matplotlib.patches import FancyBboxPatch
 
 from plotnine import (
     aes,
     annotate,
+    element_rect,
     facet_grid,
     facet_wrap,
     geom_abline,
     geom_path,
     geom_point,
     ggplot,
+    options,
+    theme,
 )
 from plotnine.data import mpg, mtcars
 from plotnine.exceptions import PlotnineWarning
+from plotnine.facets.strips import StripBackgrounds
 
 n = 10
 df = pd.DataFrame({'x': range(n),
@@ -191,3 +198,43 @@ def test_array_mapping_and_evaluation():
          + facet_wrap('~g')
          )
     assert p == 'array_mapping_and_evaluation'
+
+
+def test_collect_strips():
+    def draw(p):
+        old = options.set_option('collect_strips', True)
+        try:
+            figure = p.draw()
+        finally:
+            options.set_option('collect_strips', old)
+        return figure
+
+    p = (g
+         + facet_grid('var1 ~ var2')
+         + theme(strip_background_x=element_rect(fill='red'))
+         )
+    figure = draw(p)
+    collections = [a for a in figure.artists
+                   if isinstance(a, StripBackgrounds)]
+    top, right = collections
+    assert len(top._boxes) == 2
+    assert len(right._boxes) == 5
+    assert to_hex(top.get_facecolor()[0]) == '#ff0000'
+
+    # The boxes are drawn along the panels
+    renderer = figure.canvas.get_renderer()
+    bbox = top.get_window_extent(renderer)
+    assert bbox.y0 >= figure.axes[0].bbox.y1 - 1
+    assert bbox.x0 <= figure.axes[0].bbox.x0 + 1
+    plt.close(figure)
+
+    # Fancy properties cannot be set on a collection
+    p += theme(strip_background_y=element_rect(boxstyle='round'))
+    figure = draw(p)
+    collections = [a for a in figure.artists
+                   if isinstance(a, StripBackgrounds)]
+    patches = [a for ax in figure.axes for a in ax.patches
+               if isinstance(a, FancyBboxPatch)]
+    assert len(collections) == 1
+    assert len(patches) == 5
+    plt.close(figure)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from plotnine import (
@@ -42,3 +43,40 @@ def test_points():
 def test_polygon():
     p = p0 + stat_density_2d(aes(fill=after_stat('level')), geom='polygon')
     assert p == 'polygon'
+
+
+def test_kde_fft():
+    from scipy.stats import gaussian_kde
+
+    from plotnine.stats.density import kde
+
+    rng = np.random.default_rng(123)
+    data = rng.normal(size=(2000, 2))
+    data[:, 1] += data[:, 0]
+    X, Y = np.meshgrid(np.linspace(-4, 4, 32), np.linspace(-6, 6, 32))
+    grid = np.array([X.flatten(), Y.flatten()]).T
+
+    expected = gaussian_kde(data.T).evaluate(grid.T)
+    for package in ('fft', 'binned'):
+        result = kde(data, grid, package)
+        assert np.allclose(result, expected, atol=1e-3 * expected.max())
+
+    # Different bandwidth and points that are far from the data
+    expected = gaussian_kde(data.T, bw_method=.5).evaluate(grid.T)
+    result = kde(data, grid, 'fft', bw_method=.5)
+    assert np.allclose(result, expected, atol=1e-3 * expected.max())
+    assert kde(data, np.array([[100, 100]]), 'fft')[0] == 0
+
+
+def test_density_fft():
+    rng = np.random.default_rng(123)
+    data = pd.DataFrame({'x': rng.normal(size=500), 'y': rng.normal(size=500)})
+    p = (ggplot(data, aes('x', 'y'))
+         + stat_density_2d(n=16, contour=False, package='scipy'))
+    p_fft = (ggplot(data, aes('x', 'y'))
+             + stat_density_2d(n=16, contour=False, package='fft'))
+    p._build()
+    p_fft._build()
+    expected = p.layers[0].data['density']
+    result = p_fft.layers[0].data['density']
+    assert np.allclose(result, expected, atol=1e-3 * expected.max())
@@ -127,3 +127,34 @@ def test_groups_less_that_two_points():
          + geom_line(aes(x='A', y='C', group='B', color='D'), size=2)
          )
     p.draw_test()
+
+
+def test_constant_paths_in_collections():
+    n = 20
+    data = pd.DataFrame({
+        'x': np.tile([1, 2, 3], n),
+        'y': np.arange(3*n) % 7,
+        'g': np.repeat(np.arange(n), 3),
+        'lt': np.repeat(['solid', 'dashed', 'dotted', 'solid'], 3*n//4),
+    })
+
+    # The linetypes are solid, dashed & dashdot. Only the solid
+    # and dashed lines get the join & cap styles of the parameters
+    p = (ggplot(data, aes('x', 'y', group='g', linetype='lt'))
+         + geom_path(linejoin='round', lineend='square'))
+    ax = p.draw().axes[0]
+    assert len(ax.lines) == 0
+    assert len(ax.collections) == 2
+    assert sum(len(c.get_paths()) for c in ax.collections) == n
+    styles = {(c.get_joinstyle(), c.get_capstyle()) for c in ax.collections}
+    assert ('round', 'projecting') in styles
+
+    # Parameters that vary along a path, one segment
+    # between consecutive points
+    p = (ggplot(data, aes('x', 'y', group='g', color='y'))
+         + geom_path())
+    ax = p.draw().axes[0]
+    assert len(ax.collections) == 1
+    segments = ax.collections[0].get_segments()
+    assert len(segments) == 2*n
+    assert np.array_equal(segments[1], [[2, 1], [3, 2]])
@@ -115,3 +115,32 @@ def test_custom_shapes():
          + coord_equal()
          )
     assert p == 'custom_shapes'
+
+
+def test_aggregate_threshold():
+    n = 1000
+    prg = np.random.RandomState(123)
+    df = pd.DataFrame({
+        'x': prg.normal(size=n),
+        'y': prg.normal(size=n),
+        'z': prg.choice(list('ab'), n),
+    })
+    p = ggplot(df, aes('x', 'y', color='z'))
+
+    fig = (p + geom_point(aggregate_threshold=n)).draw()
+    ax = fig.axes[0]
+    assert len(ax.collections) == 1
+    assert len(ax.images) == 0
+
+    fig = (p + geom_point(alpha=.5, aggregate_threshold=n-1)).draw()
+    ax = fig.axes[0]
+    assert len(ax.collections) == 0
+    assert len(ax.images) == 1
+
+    # Empty cells are transparent, the others have the
+    # opacity of the stacked points
+    X = ax.images[0].get_array()
+    alpha = X[..., 3]
+    assert (alpha[alpha > 0] >= .5).all()
+    assert (alpha < 1).all()
+    assert (alpha == 0).any()
@@ -36,3 +36,30 @@ def test_points():
          + scale_size_radius(range=(10, 20)))
 
     assert p == 'points'
+
+
+def test_kde_count():
+    from plotnine.stats.density import kde
+
+    def brute_force(data, grid, r):
+        count = [np.sum(np.linalg.norm(data - g, axis=1) < r) for g in grid]
+        return np.array(count) / len(data)
+
+    rng = np.random.default_rng(123)
+    data = rng.normal(size=(1000, 2))
+    grid = rng.normal(size=(200, 2))
+    r = np.ptp(data) / 10
+
+    # Fewer grid points than data points
+    result = kde(data, grid, 'count')
+    assert np.array_equal(result, brute_force(data, grid, r))
+
+    # At the data points and with a radius
+    result = kde(data, data, 'count', radius=.25)
+    assert np.array_equal(result, brute_force(data, data, .25))
+
+    # Points at exactly the radius are not counted
+    data = np.array([[0, 0], [1, 0], [2, 0], [0, 1]])
+    result = kde(data, data, 'count', radius=1)
+    assert np.array_equal(result, brute_force(data, data, 1))
+
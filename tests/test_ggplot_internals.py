@@ -10,6 +10,7 @@ from plotnine import (
     after_stat,
     annotate,
     coord_trans,
+    facet_grid,
     facet_null,
     geom_bar,
     geom_histogram,
@@ -127,6 +128,58 @@ def test_deepcopy():
     assert p.environment is p2.environment
 
 
+def test_data_not_copied_or_modified():
+    data = pd.DataFrame({
+        'x': np.arange(10.),
+        'y': np.arange(10.),
+        'g': list('ab') * 5,
+        'unused': np.arange(10.),
+    })
+    layer_data = data.copy()
+    expected = data.copy()
+    p = (ggplot(data, aes('x', 'y'))
+         + geom_point()
+         + geom_line(layer_data)
+         + facet_grid('g ~ .', margins=True))
+
+    # The layers share the columns of the dataframes
+    p2 = deepcopy(p)
+    assert p2.layers[1]._data is layer_data
+    for l in p2.layers:
+        l.setup(p2)
+    assert np.shares_memory(p2.layers[0].data['x'], data['x'])
+    assert np.shares_memory(p2.layers[1].data['x'], layer_data['x'])
+
+    # And the dataframes are not modified by the build
+    p.draw_test()
+    pd.testing.assert_frame_equal(data, expected)
+    pd.testing.assert_frame_equal(layer_data, expected)
+
+
+def test_unused_columns_dropped():
+    data = pd.DataFrame({
+        'x': np.arange(6.),
+        'y': np.arange(6.),
+        'my col': np.arange(6.),
+        'g': list('ab') * 3,
+        'k': list('uvw') * 2,
+        'unused': np.arange(6.),
+        'unused2': list('abcdef'),
+    })
+    p = (ggplot(data, aes('x', 'np.log1p(y)', color='my col'))
+         + geom_point(aes(shape=stage('k', after_scale='shape')))
+         + geom_line(aes('x', 'x', group='g'), inherit_aes=False)
+         + facet_grid('g ~ .'))
+
+    p2 = deepcopy(p)
+    for l in p2.layers:
+        l.setup(p2)
+    assert list(p2.layers[0].data.columns) == ['x', 'y', 'my col', 'g', 'k']
+    assert list(p2.layers[1].data.columns) == ['x', 'g']
+    assert np.shares_memory(p2.layers[0].data['x'], data['x'])
+    p.draw_test()
+
+
 def test_aes():
     result = aes('weight', 'hp', color='qsec')
     expected = {'x': 'weight', 'y': 'hp', 'color': 'qsec'}
@@ -363,6 +416,40 @@ def test_to_pandas():
     assert p2 == 'to_pandas'
 
 
+def test_to_pandas_selects_used_columns():
+    class SomeTable:
+        def __init__(self, data):
+            self.data = data
+            self.selected = []
+
+        @property
+        def columns(self):
+            return list(self.data.columns)
+
+        def select(self, columns):
+            self.selected.append(columns)
+            return SomeTable(self.data[columns])
+
+        def to_pandas(self):
+            return self.data
+
+    data = SomeTable(pd.DataFrame({
+        'x': [1, 2, 3],
+        'y': [1, 2, 3],
+        'g': list('aab'),
+        'unused': [0, 0, 0],
+    }))
+    layer_data = SomeTable(data.data.copy())
+    p = (ggplot(data, aes('x', 'y'))
+         + geom_point()
+         + geom_point(layer_data, aes(y='y*2'))
+         + geom_point(lambda d: d.assign(y=d['unused']))
+         + facet_grid('g ~ .'))
+    p.draw_test()
+    assert data.selected == [['x', 'y', 'g']]
+    assert layer_data.selected == [['x', 'y', 'g']]
+
+
 def test_callable_as_data():
     def _fn():
         return pd.DataFrame({'x': [1, 2], 'y': [1, 2]})
@@ -1,7 +1,12 @@
+import pickle
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np  # noqa: F401
 import pandas as pd
 import pytest
 
@@ -12,6 +17,9 @@ from plotnine import (
     geom_text,
     ggplot,
     ggsave,
+    ggtitle,
+    render_plots,
+    theme,
     theme_xkcd,
 )
 from plotnine.data import mtcars
@@ -118,6 +126,85 @@ class TestArguments:
         assert_exist_and_clean(fn2, "Saving with theme_xkcd and dpi (2)")
 
 
+class TestToBytes:
+    def test_formats(self):
+        assert p.to_bytes().startswith(b'\x89PNG')
+        assert p.to_bytes('svg').startswith(b'<?xml')
+        assert p.to_bytes('pdf', width=4, height=3).startswith(b'%PDF')
+        assert plt.get_fignums() == []
+
+    def test_threads(self):
+        # Plots with different rcParams rendered concurrently
+        # are the same as those rendered one at a time, and
+        # the global rcParams are left alone
+        plots = [
+            p + theme(dpi=50),
+            p + theme(dpi=60, figure_size=(4, 3)),
+            p + theme_xkcd(),
+        ] * 4
+        def rcparams():
+            # backend is resolved lazily by pyplot
+            return {k: v for k, v in mpl.rcParams.items() if k != 'backend'}
+
+        before = rcparams()
+        expected = [plot.to_bytes() for plot in plots]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(executor.map(lambda plot: plot.to_bytes(), plots))
+
+        assert result == expected
+        assert rcparams() == before
+        assert plt.get_fignums() == []
+
+
+class TestRenderPlots:
+    def test_bytes(self):
+        # A variable and a module of this environment
+        k = 2  # noqa: F841
+        base = (ggplot(mtcars, aes('np.log(wt)', 'mpg*k'))
+                + geom_point()
+                + facet_wrap('am'))
+        plots = [base + ggtitle(str(i)) for i in range(5)]
+        result = render_plots(iter(plots), max_workers=2)
+        assert result == [plot.to_bytes() for plot in plots]
+
+        result = render_plots(plots[:2], format='svg', max_workers=1)
+        assert all(r.startswith(b'<?xml') for r in result)
+
+    def test_filenames(self, tmp_path):
+        filenames = [tmp_path / f'plot-{i}.pdf' for i in range(3)]
+        plots = [p + ggtitle(str(i)) for i in range(3)]
+        assert render_plots(plots, filenames, max_workers=2) is None
+        assert all(fn.exists() for fn in filenames)
+
+    def test_unpicklable_variables(self):
+        # Variables with the names of columns are not used, and
+        # variables that cannot be pickled are left out
+        wt = threading.Lock()  # noqa: F841
+        lock = threading.Lock()  # noqa: F841
+        plot = (ggplot(mtcars, aes('wt', 'mpg'))
+                + geom_point(aes(color="'lock'")))
+        pickle.dumps(plot)
+        result = render_plots([plot], max_workers=1)
+        assert result == [plot.to_bytes()]
+
+    def test_filenames_mismatch(self, tmp_path):
+        filenames = [tmp_path / f'plot-{i}.png' for i in range(3)]
+        plots = [p + ggtitle(str(i)) for i in range(2)]
+
+        with pytest.raises(PlotnineError):
+            render_plots(plots, filenames, max_workers=1)
+
+        with pytest.raises(PlotnineError):
+            render_plots(plots + plots, filenames, max_workers=1)
+
+        # Generators are checked as they are consumed
+        with pytest.raises(PlotnineError):
+            render_plots(plots, iter(filenames), max_workers=1)
+
+        with pytest.raises(PlotnineError):
+            render_plots(iter(plots + plots), filenames, max_workers=1)
+
+
 class TestExceptions:
     def test_unknown_format(self):
         with pytest.raises(Exception):
@@ -1,10 +1,20 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from plotnine import aes, geom_path, geom_point, ggplot
+from plotnine import (
+    aes,
+    facet_wrap,
+    geom_boxplot,
+    geom_path,
+    geom_point,
+    ggplot,
+    stat_density_2d,
+)
 from plotnine.exceptions import PlotnineError, PlotnineWarning
 from plotnine.layer import Layers, layer
 
@@ -133,3 +143,30 @@ class TestRasterizing:
         p1 = self.p + geom_path()
         p2 = self.p + geom_path(raster=True)
         self._assert_raster_smaller(p1, p2)
+
+
+@pytest.mark.parametrize(
+    'executor_class',
+    [ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_compute_statistic_executor(executor_class):
+    data = df_large.assign(
+        g=np.repeat(list('abcd'), n // 4),
+        f=np.tile(list('abc'), n)[:n],
+    )
+    p = (ggplot(data, aes('x', 'y'))
+         + stat_density_2d(n=20)
+         + geom_boxplot(aes(group='g'))
+         + facet_wrap('f'))
+
+    def build(**kwargs):
+        p1 = deepcopy(p)
+        p1._build(**kwargs)
+        return [l.data for l in p1.layers]
+
+    expected = build()
+    with executor_class(max_workers=2) as executor:
+        result = build(executor=executor)
+
+    for res, exp in zip(result, expected):
+        pd.testing.assert_frame_equal(res, exp)
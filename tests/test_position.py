@@ -1,8 +1,11 @@
 import string
+from itertools import product
+from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
 import pytest
+from mizani.transforms import identity_trans
 
 from plotnine import (
     aes,
@@ -17,6 +20,7 @@ from plotnine import (
     ggplot,
     position_dodge,
     position_dodge2,
+    position_fill,
     position_jitter,
     position_jitterdodge,
     position_nudge,
@@ -26,6 +30,7 @@ from plotnine import (
 )
 from plotnine.exceptions import PlotnineError
 from plotnine.positions.position import position
+from plotnine.positions.position_dodge2 import find_x_overlaps
 
 n = 6
 m = 10
@@ -152,6 +157,97 @@ def test_dodge2_varwidth():
     assert p + _theme == 'dodge2_varwidth'
 
 
+def test_find_x_overlaps():
+    df = pd.DataFrame({
+        'xmin': [0, 1, 2, 3, 4, 7],
+        'xmax': [1, 2, 6, 4, 5, 8],
+    })
+    # The element at 3-4 is within the one at 2-6
+    assert list(find_x_overlaps(df)) == [1, 2, 3, 3, 3, 4]
+
+
+def test_dodge2_unequal_groups():
+    # 3 boxes at x=1 and 1 box at x=2
+    data = pd.DataFrame({
+        'x': [1., 1, 1, 2],
+        'xmin': [.5, .5, .5, 1.5],
+        'xmax': [1.5, 1.5, 1.5, 2.5],
+        'group': [1, 2, 3, 1],
+        'PANEL': pd.Categorical([1, 1, 1, 1]),
+    })
+    pos = position_dodge2(padding=0)
+    params = pos.setup_params(data)
+    result = pos.compute_panel(data, None, params)
+    assert np.allclose(result['xmin'], [.5, 5/6, 7/6, 1.5])
+    assert np.allclose(result['xmax'], [5/6, 7/6, 1.5, 2.5])
+
+
+def test_dodge_strategy_groups():
+    # Dodging all the positions at once is the same as dodging
+    # each position in turn
+    data = pd.DataFrame({
+        'x': [1., 1, 2, 2, 2, 3],
+        'y': [1, 2, 3, 4, 5, 6],
+        'group': [1, 3, 1, 2, 3, 2],
+        'PANEL': pd.Categorical([1] * 6),
+    })
+
+    class position_dodge_each(position_dodge):
+        strategy = staticmethod(position_dodge.strategy)
+
+    assert position_dodge._implements_strategy_groups()
+    assert not position_dodge_each._implements_strategy_groups()
+
+    for preserve in ('total', 'single'):
+        pos = position_dodge(width=.9, preserve=preserve)
+        params = pos.setup_params(data)
+        result = position_dodge.compute_panel(data.copy(), None, params)
+        expected = position_dodge_each.compute_panel(
+            data.copy(), None, params)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_stack_strategy_groups():
+    # Stacking all the positions at once is the same as stacking
+    # each position in turn
+    random_state = np.random.RandomState(123)
+    size = 60
+    data = pd.DataFrame({
+        'x': random_state.randint(0, 5, size).astype(float),
+        'y': random_state.normal(0, 10, size),
+        'group': random_state.randint(1, 5, size),
+        'PANEL': pd.Categorical([1] * size),
+    })
+    scales = SimpleNamespace(y=SimpleNamespace(trans=identity_trans()))
+
+    class position_stack_each(position_stack):
+        strategy = staticmethod(position_stack.strategy)
+
+    class position_fill_each(position_fill):
+        strategy = staticmethod(position_fill.strategy)
+
+    assert position_stack._implements_strategy_groups()
+    assert position_fill._implements_strategy_groups()
+    assert not position_stack_each._implements_strategy_groups()
+
+    classes = [
+        (position_stack, position_stack_each),
+        (position_fill, position_fill_each),
+    ]
+    for (klass, klass_each), kwargs in product(
+        classes,
+        [{}, {'vjust': 0.5}, {'reverse': True}]
+    ):
+        pos = klass(**kwargs)
+        params = pos.setup_params(data)
+        d = pos.setup_data(data.copy(), params)
+        # As when the layer computes the positions
+        with pd.option_context('mode.chained_assignment', None):
+            result = klass.compute_panel(d.copy(), scales, params)
+            expected = klass_each.compute_panel(d.copy(), scales, params)
+        pd.testing.assert_frame_equal(result, expected)
+
+
 def test_jitterdodge():
     df = pd.DataFrame({
         'x': np.ones(n*2),
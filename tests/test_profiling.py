@@ -0,0 +1,84 @@
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, ggplot, options
+from plotnine.profiling import last_report, profiler
+
+df = pd.DataFrame({
+    'x': range(6),
+    'y': range(6),
+    'g': list('aabbcc')
+})
+
+p = (ggplot(df, aes('x', 'y'))
+     + geom_point()
+     + geom_point(aes(color='g'))
+     + facet_wrap('g'))
+
+
+def test_profile():
+    report = p.profile()
+    result = report.to_frame()
+    stages = set(result['stage'])
+    assert {'build', 'compute_statistic', 'draw_layers',
+            'apply_theme', 'stat.compute_panel', 'draw_panel'} <= stages
+
+    # Layer and panel breakdown
+    stat_panels = result[result['stage'] == 'stat.compute_panel']
+    assert len(stat_panels) == 6
+    assert set(stat_panels['layer']) == {1, 2}
+    assert set(stat_panels['panel']) == {1, 2, 3}
+    assert (stat_panels['rows'] == 2).all()
+
+    # Only the top level stages add up to the total
+    assert report.total_time <= result['time'].sum()
+    assert result['peak_memory'].isnull().all()
+
+    summary = report.summary()
+    assert summary['time'].is_monotonic_decreasing
+    assert summary.loc['stat.compute_panel', 'calls'] == 6
+
+
+def test_profile_memory():
+    report = p.profile(memory=True)
+    result = report.to_frame()
+    assert (result['peak_memory'] >= 0).all()
+
+
+def test_profile_memory_nested():
+    # The peak of a stage includes what it allocated before
+    # a stage nested in it
+    size = 10 * 2**20
+    with profiler(memory=True) as prof:
+        with prof.record('outer'):
+            data = bytearray(size)
+            del data
+            with prof.record('inner'):
+                pass
+
+    result = prof.report.to_frame().set_index('stage')
+    assert result.loc['outer', 'peak_memory'] > size // 2
+    assert result.loc['inner', 'peak_memory'] < size // 2
+
+
+def test_profiler_context():
+    # No profiling, no records
+    p.draw_test()
+
+    with profiler() as prof:
+        p.draw_test()
+        p.draw_test()
+
+    result = prof.report.to_frame()
+    assert (result['stage'] == 'build').sum() == 2
+
+
+def test_profile_option():
+    reports = []
+    old = options.set_option('profile', reports.append)
+    try:
+        p.draw_test()
+    finally:
+        options.set_option('profile', old)
+
+    assert len(reports) == 1
+    assert last_report() is reports[0]
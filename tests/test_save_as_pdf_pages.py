@@ -1,4 +1,6 @@
+import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -56,6 +58,9 @@ class TestArguments:
                for item in record)
         assert any(res)
 
+        res = ('pages/s' in str(item.message) for item in record)
+        assert any(res)
+
         # verbose
         fn = next(filename_gen)
         with warnings.catch_warnings(record=True) as record:
@@ -73,6 +78,16 @@ class TestArguments:
             save_as_pdf_pages(p(), fn, path='.')
         assert_exist_and_clean(fn, "fn, plot and path")
 
+    def test_executor(self):
+        fn = next(filename_gen)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            save_as_pdf_pages(
+                p(5), fn, verbose=False, executor=executor, prerender=1
+            )
+        n_pages = len(re.findall(rb'/Type /Page\b', fn.read_bytes()))
+        assert n_pages == 5
+        assert_exist_and_clean(fn, "executor")
+
     @pytest.mark.skip("Results of this test can only be confirmed by"
                       "inspecting the generated PDF.")
     def test_height_width(self):
@@ -52,7 +52,8 @@ from plotnine.scales.scale_xy import (
     scale_y_continuous,
     scale_y_discrete,
 )
-from plotnine.scales.scales import make_scale
+from plotnine.scales.scales import Scales, make_scale
+from plotnine.utils import rgba_array
 
 _theme = theme(subplots_adjust={'right': 0.85})
 
@@ -285,8 +286,8 @@ def test_scale_manual():
         breaks=[True, False],
         values=['red', 'blue']
     )
-    assert sc1.map([True, False, True, False]) == ['blue', 'red'] * 2
-    assert sc2.map([True, False, True, False]) == ['red', 'blue'] * 2
+    assert list(sc1.map([True, False, True, False])) == ['blue', 'red'] * 2
+    assert list(sc2.map([True, False, True, False])) == ['red', 'blue'] * 2
 
 
 def test_alpha_palette():
@@ -808,3 +809,101 @@ def test_discrete_scale_for_empty_layer():
          )
 
     p.draw_test()
+
+
+def test_train_map_panel_scales():
+    df = pd.DataFrame({
+        'x': [5, 1, 30, 2, 10, 20],
+        'xend': [6, 1, 40, 2, 11, 21],
+        'z': list('bacbda'),
+        'idx': [3, 1, 2, 1, 3, 2],
+    })
+
+    # Continuous
+    scales = Scales([scale_x_continuous() for _ in range(3)])
+    scales.train(df, ['x', 'xend'], df['idx'])
+    assert scales[0].limits == (1, 2)
+    assert scales[1].limits == (20, 40)
+    assert scales[2].limits == (5, 11)
+
+    data = df.copy()
+    scales[0].limits = (1, 1)
+    scales.map(data, ['x'], data['idx'])
+    assert data['x'].isnull().tolist() == [
+        False, False, False, True, False, False]
+    assert data['x'].iloc[[0, 1, 2, 4, 5]].tolist() == [5, 1, 30, 10, 20]
+
+    # Discrete
+    scales = Scales([scale_x_discrete() for _ in range(3)])
+    scales.train(df, ['z'], df['idx'])
+    assert list(scales[2].limits) == ['b', 'd']
+
+    data = df.copy()
+    scales.map(data, ['z'], data['idx'])
+    assert data['z'].tolist() == [1, 1, 2, 2, 2, 1]
+
+
+def test_quantized_continuous_scale():
+    x = np.array([0, 1.2, 2.5, 5, 7.77, 10, np.nan])
+    for klass in (scale_color.scale_color_cmap,
+                  scale_color.scale_fill_gradient2):
+        exact = klass()
+        quantized = klass(quantize=1024)
+        exact.train(x)
+        quantized.train(x)
+        result = quantized.map(x)
+        assert isinstance(result, pd.Categorical)
+
+        # At most the color next to the exact one
+        expected = exact.map(x)
+        diff = np.abs(rgba_array(result, 1) - rgba_array(expected, 1))
+        assert diff.max() <= 3/255
+        assert result[-1] == expected[-1] == exact.na_value
+
+    sc = scale_size_continuous(quantize=3, range=(1, 3))
+    sc.train(x)
+    expected = sc.palette(np.array([0, 0, 0, .5, 1, 1]))
+    npt.assert_array_equal(sc.map(x)[:-1], expected)
+    assert np.isnan(sc.map(x)[-1])
+
+    with pytest.raises(PlotnineError):
+        sc = scale_size_continuous(quantize=1)
+        sc.train(x)
+        sc.map(x)
+
+    df = pd.DataFrame({'x': x, 'y': x})
+    p = (ggplot(df, aes('x', 'y', color='x'))
+         + geom_point()
+         + scale_color.scale_color_gradient(quantize=256))
+    p.draw_test()
+
+
+def test_discrete_scale_map():
+    x = pd.Series(['b', 'a', None, 'c', 'z', 'a'])
+    values = {'a': 'red', 'b': 'blue', 'c': 'green'}
+    sc1 = scale_color_manual(values=values, na_value='grey')
+    sc2 = scale_color.scale_color_hue(limits=['a', 'b', 'c'], na_value='grey')
+    sc3 = scale_manual.scale_linetype_manual(
+        values=[[0, (1, 1)], (0, (2, 2)), 'solid']
+    )
+    sc1.train(x)
+    sc3.train(x)
+
+    expected = ['blue', 'red', 'grey', 'green', 'grey', 'red']
+    assert list(sc1.map(x)) == expected
+    assert list(sc1.map(x.astype('category'))) == expected
+
+    result = list(sc2.map(x))
+    assert result[2] == result[4] == 'grey'
+    assert result[1] == result[5]
+    assert list(sc2.map(x.astype('category'))) == result
+
+    sc2.na_translate = False
+    assert sc2.map(x)[2] is None
+
+    # Linetypes are whole tuples
+    result = sc3.map(x)
+    assert result.shape == (6,)
+    assert result[0] == (0, (2, 2))
+    assert result[1] == (0, (1, 1))
+    assert result[3] == 'solid'
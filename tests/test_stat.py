@@ -1,10 +1,12 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from plotnine import aes, geom_bar, ggplot
 from plotnine.data import mtcars
 from plotnine.exceptions import PlotnineError, PlotnineWarning
 from plotnine.geoms.geom import geom
+from plotnine.stats import stat_boxplot, stat_count, stat_ecdf
 from plotnine.stats.stat import stat
 
 
@@ -87,3 +89,42 @@ def test_removes_infinite_values():
         return False
 
     assert removed_2_row_with_infinites(record)
+
+
+@pytest.mark.parametrize('klass, params', [
+    (stat_count, {'width': 0.9}),
+    (stat_ecdf, {'n': None}),
+    (stat_ecdf, {'n': 5}),
+    (stat_ecdf, {'n': 4}),  # The points are the values of x
+    (stat_ecdf, {'n': 1}),
+    (stat_boxplot, {'coef': 1.5, 'width': 0.75}),
+])
+def test_compute_groups(klass, params):
+    # Computing all the groups at once gives the same result
+    # as computing each group
+    rs = np.random.RandomState(123)
+    n = 200
+    data = pd.DataFrame({
+        'x': rs.randint(0, 4, n).astype(float),
+        'y': np.round(rs.normal(size=n), 1),
+        'group': rs.randint(1, 8, n),
+        'PANEL': 1,
+    })
+    if klass is stat_count:
+        del data['y']
+
+    class stat_loop(klass):
+        @classmethod
+        def _implements_compute_groups(cls):
+            return False
+
+    result = klass.compute_panel(data, None, **params)
+    expected = stat_loop.compute_panel(data, None, **params)
+
+    assert list(result.columns) == list(expected.columns)
+    for col in result:
+        if col == 'outliers':
+            for a, b in zip(result[col], expected[col]):
+                assert np.array_equal(a, b)
+        else:
+            assert np.allclose(result[col], expected[col])
@@ -113,6 +113,40 @@ def test_add_element_blank():
     assert th3.apply.__name__ == 'apply'
 
 
+def test_resolved_themeables():
+    theme1 = theme_gray() + theme(
+        axis_text=element_text(color='red'),
+        axis_text_x=element_text(size=20),
+        axis_ticks_minor=blank,
+    )
+    resolved = theme1.themeables.resolve()
+    names = [type(th).__name__ for th in resolved]
+
+    # The general themeables are applied by their descendants,
+    # with the properties merged in order
+    assert 'axis_text' not in names
+    th = resolved[names.index('axis_text_x')]
+    assert th.properties['color'] == 'red'
+    assert th.properties['size'] == 20
+    th = resolved[names.index('axis_text_y')]
+    assert th.properties['color'] == 'red'
+    assert th.properties['size'] != 20
+
+    # A blank is applied after the properties it follows
+    lst = [th for th in resolved if type(th).__name__ == 'axis_ticks_minor_x']
+    assert [th.apply.__name__ for th in lst] == ['apply', 'blank']
+
+    # Changes to the themeables are not hidden by the cache
+    assert theme1.themeables.resolve() is resolved
+    theme2 = theme1 + theme(axis_text_x=element_text(color='blue'))
+    assert theme2.themeables.property('axis_text_x', 'color') == 'blue'
+    assert theme1.themeables.property('axis_text_x', 'color') == 'red'
+    th = [th for th in theme2.themeables.resolve()
+          if type(th).__name__ == 'axis_text_x'][0]
+    assert th.properties['color'] == 'blue'
+    assert th.properties['size'] == 20
+
+
 def test_element_line_dashed_capstyle():
     p = (
         ggplot(mtcars, aes(x="wt", y="mpg"))
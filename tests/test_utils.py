@@ -10,11 +10,15 @@ from plotnine.data import mtcars
 from plotnine.utils import (
     _margins,
     add_margins,
+    add_uniquecols,
+    groupby_apply,
     join_keys,
     match,
     ninteraction,
     pivot_apply,
     remove_missing,
+    rgba_array,
+    split_by_column,
     uniquecols,
 )
 
@@ -105,7 +109,7 @@ def test_ninteraction():
         rank = df.rank(method='min')
         rank = rank[0].astype(int).tolist()
         rank_df = ninteraction(df)
-        assert rank == rank_df
+        assert rank == list(rank_df)
 
     # duplicates are numbered sequentially
     # df                    ids
@@ -115,23 +119,37 @@ def test_ninteraction():
         rank = rank[0].astype(int).repeat(2).tolist()
         rank_df = ninteraction(
             pd.DataFrame(np.array(case).repeat(2)))
-        assert rank == rank_df
+        assert rank == list(rank_df)
 
     # grids are correctly ranked
     df = pd.DataFrame(list(itertools.product([1, 2], range(1, 11))))
-    assert ninteraction(df) == list(range(1, len(df)+1))
-    assert ninteraction(df, drop=True) == list(range(1, len(df)+1))
+    assert list(ninteraction(df)) == list(range(1, len(df)+1))
+    assert list(ninteraction(df, drop=True)) == list(range(1, len(df)+1))
 
     # zero length dataframe
     df = pd.DataFrame()
-    assert ninteraction(df) == []
+    assert list(ninteraction(df)) == []
 
     # dataframe with single variable
     df = pd.DataFrame({'a': ['a']})
-    assert ninteraction(df) == [1]
+    assert list(ninteraction(df)) == [1]
 
     df = pd.DataFrame({'a': ['b']})
-    assert ninteraction(df) == [1]
+    assert list(ninteraction(df)) == [1]
+
+    # missing values get the largest id
+    df = pd.DataFrame({
+        'x': [2, np.nan, 1, 2, np.nan],
+        'y': pd.Categorical(['b', 'a', None, 'b', 'a'], list('abc')),
+    })
+    assert list(ninteraction(df[['x']])) == [2, 3, 1, 2, 3]
+    assert list(ninteraction(df[['y']])) == [2, 1, 3, 2, 1]
+    assert list(ninteraction(df[['y']], drop=True)) == [2, 1, 0, 2, 1]
+    assert list(ninteraction(df, drop=True)) == [2, 3, 1, 2, 3]
+
+    # items of different types
+    df = pd.DataFrame({'a': ['b', 1, 'a', 1, 2.5]})
+    assert list(ninteraction(df)) == [4, 1, 3, 1, 2]
 
 
 def test_ninteraction_datetime_series():
@@ -148,7 +166,7 @@ def test_ninteraction_datetime_series():
         'date_list': pd.to_datetime(lst * 3),
     })
 
-    assert ninteraction(df1) == ninteraction(df2)
+    assert list(ninteraction(df1)) == list(ninteraction(df2))
 
 
 def test_join_keys():
@@ -182,6 +200,12 @@ def test_match():
     assert list(match(v1, v2, incomparables=c)) == [-1, -1, 1, 1, 2, 2]
     assert list(match(v1, v3)) == [1, 1, 2, 2, -1, -1]
 
+    # first matches, start & missing values
+    v4 = ['b', 'a', 'b', None, 'a']
+    assert list(match(['a', 'b', 'c'], v4, start=1)) == [2, 1, -1]
+    assert list(match([None, np.nan, 'b'], v4)) == [3, -1, 0]
+    assert list(match([np.nan, 1], [1.0, np.nan])) == [1, 0]
+
 
 def test_uniquecols():
     df = pd.DataFrame({'x': [1, 2, 3, 4],
@@ -194,6 +218,99 @@ def test_uniquecols():
     assert result.equals(df2)
 
 
+def test_add_uniquecols():
+    df = pd.DataFrame({'x': [1, 2, 3, 4],
+                       'y': ['a', 'a', 'b', 'c'],
+                       'z': [8] * 4,
+                       'cat': pd.Categorical(['u', 'u', 'v', 'v'])})
+    codes = np.array([0, 0, 1, 1])
+    new = pd.DataFrame({'x': [10, 20, 30]})
+    new_codes = np.array([0, 1, 1])
+    result = add_uniquecols(new, df, codes, new_codes)
+
+    # x is in new, y is only constant in the first group
+    assert result['x'].tolist() == [10, 20, 30]
+    assert result['y'].tolist()[0] == 'a'
+    assert result['y'].isnull().tolist() == [False, True, True]
+    assert result['z'].tolist() == [8, 8, 8]
+    assert result['cat'].tolist() == ['u', 'v', 'v']
+    assert isinstance(result['cat'].dtype, pd.CategoricalDtype)
+
+
+def test_groupby_apply():
+    df = pd.DataFrame({
+        'x': [1, 2, 3, 4, 5, 6],
+        'g': [2, 1, np.nan, 2, 1, 3],
+        'cat': pd.Categorical(list('bbaabb'), categories=list('abc')),
+    })
+
+    def func(d):
+        d['n'] = len(d)
+        return d
+
+    def expected(cols):
+        lst = [func(d) for _, d in df.groupby(cols)]
+        return pd.concat(lst, axis=0, ignore_index=True)
+
+    for cols in ['g', 'cat', ['cat', 'g'], 'x']:
+        result = groupby_apply(df, cols, func)
+        pd.testing.assert_frame_equal(result, expected(cols))
+
+    # Results with the same rows as the groups are combined
+    # without concatenating them, the outcome is the same
+    df2 = pd.DataFrame({
+        'x': np.arange(8.0),
+        'g': [3, 1, 1, 2, np.nan, 3, 2, 1],
+        'h': [1, 1, 2, 2, 1, 1, 2, 2],
+    })
+
+    def scale(d):
+        d['x'] = d['x'] / len(d)
+        return d
+
+    def count(d):
+        # int for some groups and float for others
+        d['n'] = len(d) if len(d) > 2 else float(len(d))
+        return d
+
+    for f, cols in itertools.product([scale, count], ['g', ['g', 'h']]):
+        lst = [f(d.copy()) for _, d in df2.groupby(cols)]
+        expected = pd.concat(lst, axis=0, ignore_index=True)
+        result = groupby_apply(df2, cols, f)
+        pd.testing.assert_frame_equal(result, expected)
+
+    # Single group, the input is not modified
+    df['one'] = 1
+    result = groupby_apply(df, 'one', func)
+    assert result['n'].tolist() == [6] * 6
+    assert 'n' not in df
+
+
+def test_split_by_column():
+    df = pd.DataFrame({
+        'x': range(8),
+        'g': [3, 1, 1, 2, np.nan, 3, 2, 1],
+        'cat': pd.Categorical(list('bbaabbbb'), categories=list('abc')),
+    })
+    sorted_df = df.dropna().sort_values('g', kind='mergesort')
+
+    for data in (df, sorted_df):
+        for col in ('g', 'cat'):
+            result = list(split_by_column(data, col))
+            expected = [d for _, d in data.groupby(col)]
+            assert len(result) == len(expected)
+            for r, e in zip(result, expected):
+                pd.testing.assert_frame_equal(r, e)
+
+    # The groups do not share memory with the data, and modifying
+    # them does not warn
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', pd.errors.SettingWithCopyWarning)
+        for d in split_by_column(sorted_df, 'g'):
+            d['x'] = -1
+    assert (sorted_df['x'] >= 0).all()
+
+
 def test_remove_missing():
     df = pd.DataFrame({'a': [1.0, np.NaN, 3, np.inf],
                        'b': [1, 2, 3, 4]})
@@ -227,3 +344,26 @@ def test_pivot_apply():
     assert res1.index.tolist() == list('abc')
     assert res1.index.name == 'id'
     assert (res1 + res2 == [12, 24, 36]).all()
+
+
+def test_rgba_array():
+    colors = ['red', '#00ff0080', None, 'none', (0, 0, 1), 'red']
+    alpha = [.1, .2, .3, .4, .5, .6]
+    result = rgba_array(colors, alpha)
+    expected = [
+        (1, 0, 0, .1),
+        (0, 1, 0, 128/255),  # has alpha
+        (0, 0, 0, 0),
+        (0, 0, 0, 0),
+        (0, 0, 1, .5),
+        (1, 0, 0, .6),
+    ]
+    assert result.shape == (6, 4)
+    assert np.allclose(result, expected)
+
+    # Single color
+    assert np.allclose(rgba_array('red', .5), [(1, 0, 0, .5)])
+    assert np.allclose(
+        rgba_array((1, 0, 0), [.1, .2]),
+        [(1, 0, 0, .1), (1, 0, 0, .2)]
+    )
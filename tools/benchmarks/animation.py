@@ -0,0 +1,90 @@
+"""
+Benchmark making the frames of an animation
+
+Compares :class:`~plotnine.animation.PlotnineAnimation`, which draws
+all the frames before the animation is saved, to
+:class:`~plotnine.animation.PlotnineFuncAnimation`, which makes each
+frame as it is saved. The frames are rendered to a writer that
+discards them, and the time and the peak memory of the python
+allocations are reported.
+
+Usage::
+
+    python tools/benchmarks/animation.py
+"""
+import io
+import time
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.animation import AbstractMovieWriter
+
+from plotnine import aes, geom_line, geom_point, ggplot, lims, theme
+from plotnine.animation import PlotnineAnimation, PlotnineFuncAnimation
+
+N_FRAMES = [25, 100]
+N_POINTS = 1000
+
+
+class NullWriter(AbstractMovieWriter):
+    """
+    Writer that renders the frames and discards them
+    """
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+
+    def grab_frame(self, **savefig_kwargs):
+        self.fig.savefig(io.BytesIO(), format='png', dpi=self.dpi)
+
+    def finish(self):
+        pass
+
+
+def plot_frame(i):
+    x = np.linspace(0, 1, N_POINTS)
+    df = pd.DataFrame({
+        'x': x,
+        'y': np.sin(8*x + i/10),
+        'c': np.cos(8*x - i/10),
+    })
+    return (ggplot(df, aes('x', 'y', color='c'))
+            + geom_point()
+            + geom_line()
+            + lims(y=(-1, 1), color=(-1, 1))
+            + theme(subplots_adjust={'right': 0.8}))
+
+
+def save(make_animation, n_frames):
+    tracemalloc.start()
+    start = time.perf_counter()
+    anim = make_animation(n_frames)
+    anim.save('unused', writer=NullWriter(fps=10), dpi=50)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    plt.close('all')
+    return duration, peak / 2**20
+
+
+def main():
+    animations = {
+        'PlotnineAnimation': lambda n: PlotnineAnimation(
+            [plot_frame(i) for i in range(n)]),
+        'PlotnineFuncAnimation': lambda n: PlotnineFuncAnimation(
+            plot_frame, n),
+    }
+    header = (f"{'frames':>7} {'animation':<22} {'time (s)':>9} "
+              f"{'peak memory (MiB)':>18}")
+    print(header)
+    print('-' * len(header))
+    for n_frames in N_FRAMES:
+        for name, make_animation in animations.items():
+            duration, peak = save(make_animation, n_frames)
+            print(f'{n_frames:>7} {name:<22} {duration:>9.2f} '
+                  f'{peak:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark the peak memory used to build a plot of a large dataframe
+
+Builds a plot with several layers (one of them with its own data)
+of a wide dataframe, and reports the peak memory allocated while
+adding the layers and while building the plot, relative to the
+size of the dataframe. The plot is facetted with ``facet_wrap``
+and with ``facet_grid`` with margins, which duplicates the data.
+
+Usage::
+
+    python tools/benchmarks/build_memory.py
+"""
+import timeit
+import tracemalloc
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+from plotnine import (
+    aes,
+    facet_grid,
+    facet_wrap,
+    geom_blank,
+    geom_line,
+    geom_point,
+    geom_rug,
+    geom_step,
+    ggplot,
+)
+
+N_ROWS = 200_000
+N_COLUMNS = [5, 50, 300]
+
+
+def make_data(n_columns, seed=123):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        rng.normal(size=(N_ROWS, n_columns)),
+        columns=[f'c{i}' for i in range(n_columns)],
+    )
+    df['x'] = np.arange(N_ROWS)
+    df['g'] = rng.choice(list('abcd'), N_ROWS)
+    return df
+
+
+def build(p):
+    p = deepcopy(p)
+    p._build()
+    return p
+
+
+def main():
+    facets = {
+        'wrap': facet_wrap('g'),
+        'margins': facet_grid('g ~ .', margins=True),
+    }
+    header = (f"{'rows':>8} {'columns':>8} {'facet':>8} {'data (MB)':>10} "
+              f"{'add peak':>9} {'build peak':>11} {'build (s)':>10}")
+    print(header)
+    print('-' * len(header))
+    for n_columns in N_COLUMNS:
+        df = make_data(n_columns)
+        size = df.memory_usage(deep=True).sum()
+
+        for name, facet in facets.items():
+            tracemalloc.start()
+            p = (ggplot(df, aes('x', 'c0'))
+                 + geom_point()
+                 + geom_line(aes(y='c1'))
+                 + geom_step(aes(y='c2'))
+                 + geom_rug(sides='b')
+                 + geom_blank(df, aes(y='c3'))
+                 + facet)
+            _, add_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            start = timeit.default_timer()
+            build(p)
+            duration = timeit.default_timer() - start
+            _, build_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f'{N_ROWS:>8} {df.shape[1]:>8} {name:>8} '
+                  f'{size/2**20:>10.1f} {add_peak/size:>8.1f}x '
+                  f'{build_peak/size:>10.1f}x {duration:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark mapping continuous values to colors
+
+Times the mapping of continuous values by color scales, with and
+without a lookup table (the ``quantize`` parameter), and the
+conversion of the mapped colors to RGBA values as the geoms do it.
+Reports the largest difference between the RGBA values of the two
+mappings.
+
+Usage::
+
+    python tools/benchmarks/color_map.py
+"""
+import timeit
+
+import numpy as np
+
+from plotnine import scale_color_cmap, scale_color_gradient2
+from plotnine.utils import rgba_array
+
+N_VALUES = [100_000, 1_000_000, 10_000_000]
+QUANTIZE = 1024
+# Evaluating the palette at each value takes too long beyond this
+MAX_VALUES_EXACT = 1_000_000
+
+
+def make_scale(klass, x, **kwargs):
+    sc = klass(**kwargs)
+    sc.train(x)
+    return sc
+
+
+def timed(func):
+    start = timeit.default_timer()
+    result = func()
+    return result, timeit.default_timer() - start
+
+
+def main():
+    rng = np.random.default_rng(123)
+    header = (f"{'scale':<24} {'values':>10} {'exact (s)':>10} "
+              f"{'lut (s)':>8} {'rgba exact':>11} {'rgba lut':>9} "
+              f"{'max diff':>9}")
+    print(header)
+    print('-' * len(header))
+    for klass in (scale_color_cmap, scale_color_gradient2):
+        for n in N_VALUES:
+            x = rng.normal(size=n)
+            exact = make_scale(klass, x)
+            lut = make_scale(klass, x, quantize=QUANTIZE)
+
+            colors, t_lut = timed(lambda: lut.map(x))
+            rgba, t_rgba_lut = timed(lambda: rgba_array(colors, 1))
+
+            if n <= MAX_VALUES_EXACT:
+                colors, t_exact = timed(lambda: exact.map(x))
+                rgba_exact, t_rgba_exact = timed(
+                    lambda: rgba_array(colors, 1))
+                diff = f'{np.abs(rgba - rgba_exact).max()*255:>9.2f}'
+                t_exact = f'{t_exact:>10.3f}'
+                t_rgba_exact = f'{t_rgba_exact:>11.3f}'
+            else:
+                diff = f"{'-':>9}"
+                t_exact = f"{'-':>10}"
+                t_rgba_exact = f"{'-':>11}"
+
+            print(f'{klass.__name__:<24} {n:>10} {t_exact} {t_lut:>8.3f} '
+                  f'{t_rgba_exact} {t_rgba_lut:>9.3f} {diff}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark converting the colors of the data to rgba values
+
+Compares converting every color to an rgba hex string
+(plotnine.utils.to_rgba) with converting the unique colors to an
+array of rgba values (plotnine.utils.rgba_array).
+
+Usage::
+
+    python tools/benchmarks/colors.py
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine.utils import rgba_array, to_rgba
+
+N_COLORS = [1_000, 100_000, 1_000_000]
+PALETTE = ['#F8766D', '#7CAE00', '#00BFC4', '#C77CFF', 'black', 'none']
+
+
+def main():
+    header = (f"{'colors':>9} {'alpha':>7} {'to_rgba (s)':>12} "
+              f"{'rgba_array (s)':>15} {'speedup':>8}")
+    print(header)
+    print('-' * len(header))
+    rng = np.random.default_rng(123)
+    for n in N_COLORS:
+        colors = pd.Series(rng.choice(PALETTE, n))
+        for kind, alpha in [('scalar', 0.5), ('array', rng.random(n))]:
+            repeat = 1 if n >= 1_000_000 else 3
+            t0 = min(timeit.repeat(
+                lambda: to_rgba(colors, alpha), number=1, repeat=repeat))
+            t1 = min(timeit.repeat(
+                lambda: rgba_array(colors, alpha), number=1, repeat=repeat))
+            print(f'{n:>9} {kind:>7} {t0:>12.4f} {t1:>15.4f} '
+                  f'{t0/t1:>7.0f}x')
+
+
+if __name__ == '__main__':
+    main()
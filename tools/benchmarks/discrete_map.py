@@ -0,0 +1,56 @@
+"""
+Benchmark mapping discrete values with the discrete scales
+
+Times the mapping of values with a manual (dictionary) palette, a
+color palette and a linetype palette (of tuples), when the values
+are strings and when they are categorical.
+
+Usage::
+
+    python tools/benchmarks/discrete_map.py
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine import (
+    scale_color_discrete,
+    scale_color_manual,
+    scale_linetype_manual,
+)
+
+N_ROWS = 5_000_000
+LEVELS = list('abcdefgh')
+
+
+def make_scales():
+    colors = dict(zip(LEVELS, ['red', 'blue', 'green', 'orange',
+                               'purple', 'black', 'grey', 'pink']))
+    linetypes = [(0, (i+1, 2)) for i in range(len(LEVELS))]
+    return {
+        'manual (dict)': scale_color_manual(values=colors),
+        'hue': scale_color_discrete(),
+        'linetype (tuples)': scale_linetype_manual(values=linetypes),
+    }
+
+
+def main():
+    rng = np.random.default_rng(123)
+    x = pd.Series(rng.choice(LEVELS + [None], N_ROWS), dtype=object)
+    data = {'str': x, 'categorical': x.astype('category')}
+
+    print(f'{N_ROWS} rows, {len(LEVELS)} levels and missing values')
+    header = f"{'scale':<20} {'values':<12} {'time (s)':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, sc in make_scales().items():
+        sc.train(x)
+        for kind, values in data.items():
+            duration = min(timeit.repeat(
+                lambda: sc.map(values), number=1, repeat=3))
+            print(f'{name:<20} {kind:<12} {duration:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
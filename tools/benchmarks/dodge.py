@@ -0,0 +1,67 @@
+"""
+Benchmark dodging the data of a panel with many x positions
+
+Compares :class:`~plotnine.positions.position_dodge` dodging each
+x position in turn (with ``strategy``), to dodging all of them at
+once (with ``strategy_groups``). It also reports the time of
+:class:`~plotnine.positions.position_dodge2`.
+
+Usage::
+
+    python tools/benchmarks/dodge.py
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine.positions import position_dodge, position_dodge2
+
+N_POSITIONS = [100, 1000, 10000, 50000]
+N_GROUPS = 3
+
+
+class position_dodge_each(position_dodge):
+    """
+    Dodge that applies the strategy to each x position
+    """
+    strategy = staticmethod(position_dodge.strategy)
+
+
+def make_data(n_positions):
+    x = np.repeat(np.arange(n_positions, dtype=float), N_GROUPS)
+    return pd.DataFrame({
+        'x': x,
+        'xmin': x - 0.45,
+        'xmax': x + 0.45,
+        'ymin': 0,
+        'ymax': np.random.RandomState(123).uniform(1, 2, len(x)),
+        'group': np.tile(np.arange(1, N_GROUPS+1), n_positions),
+        'PANEL': pd.Categorical(np.ones(len(x), dtype=int)),
+    })
+
+
+def run(klass, data):
+    pos = klass()
+    params = pos.setup_params(data)
+    return min(timeit.repeat(
+        lambda: klass.compute_panel(data.copy(), None, params.copy()),
+        number=1, repeat=3))
+
+
+def main():
+    header = (f"{'positions':>10} {'dodge each (s)':>15} "
+              f"{'dodge (s)':>10} {'speedup':>8} {'dodge2 (s)':>11}")
+    print(header)
+    print('-' * len(header))
+    for n_positions in N_POSITIONS:
+        data = make_data(n_positions)
+        t0 = run(position_dodge_each, data)
+        t1 = run(position_dodge, data)
+        t2 = run(position_dodge2, data)
+        print(f'{n_positions:>10} {t0:>15.4f} {t1:>10.4f} '
+              f'{t0/t1:>7.1f}x {t2:>11.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark training and mapping the position scales of free-scale facets
+
+Compares Scales.train & Scales.map with selecting the rows of each
+panel using a boolean mask, and reports the time spent training and
+mapping the positions when building a facet_wrap(scales='free') plot.
+
+Usage::
+
+    python tools/benchmarks/free_scales.py
+"""
+import timeit
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, ggplot
+from plotnine.profiling import profiler
+from plotnine.scales import scale_x_continuous
+from plotnine.scales.scales import Scales
+
+N_ROWS = 200_000
+N_PANELS = [1, 25, 100, 400]
+
+
+def make_data(n_panels, seed=123):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'x': rng.normal(size=N_ROWS),
+        'y': rng.normal(size=N_ROWS),
+        'PANEL': rng.integers(1, n_panels+1, N_ROWS),
+    })
+
+
+def masked_train_map(scales, data, vars, idx):
+    idx = np.asarray(idx)
+    for col in vars:
+        for i, sc in enumerate(scales, start=1):
+            sc.train(data.loc[i == idx, col])
+
+    for col in vars:
+        for i, sc in enumerate(scales, start=1):
+            bool_idx = i == idx
+            data.loc[bool_idx, col] = sc.map(data.loc[bool_idx, col])
+
+
+def train_map(scales, data, vars, idx):
+    scales.train(data, vars, idx)
+    scales.map(data, vars, idx)
+
+
+def build_time(df):
+    df = df.rename(columns={'PANEL': 'f'})
+    p = (ggplot(df, aes('x', 'y'))
+         + geom_point()
+         + facet_wrap('f', scales='free'))
+    with profiler() as prof:
+        deepcopy(p)._build()
+    summary = prof.report.summary()
+    stages = ['layout.train_position', 'layout.map_position']
+    return summary.loc[stages, 'time'].sum()
+
+
+def main():
+    header = (f"{'panels':>8} {'masked (s)':>12} {'plotnine (s)':>13} "
+              f"{'speedup':>8} {'in build (s)':>13}")
+    print(header)
+    print('-' * len(header))
+    for n_panels in N_PANELS:
+        df = make_data(n_panels)
+
+        def run(fn):
+            scales = Scales([scale_x_continuous() for _ in range(n_panels)])
+            fn(scales, df.copy(), ['x', 'y'], df['PANEL'])
+
+        t0 = min(timeit.repeat(lambda: run(masked_train_map),
+                               number=1, repeat=3))
+        t1 = min(timeit.repeat(lambda: run(train_map),
+                               number=1, repeat=3))
+        t2 = build_time(df)
+        print(f'{n_panels:>8} {t0:>12.4f} {t1:>13.4f} '
+              f'{t0/t1:>7.1f}x {t2:>13.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark drawing & saving many paths with geom_line
+
+Paths with the same characteristics along their length are drawn
+together (constant), and paths whose color changes along the path
+are drawn as segments (varying).
+
+Usage::
+
+    python tools/benchmarks/geom_path.py [output_directory]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_line, ggplot
+
+N_SERIES = [100, 2_000, 20_000]
+N_POINTS = 50
+
+
+def make_data(n_series, seed=123):
+    rng = np.random.default_rng(seed)
+    n = n_series * N_POINTS
+    return pd.DataFrame({
+        'x': np.tile(np.arange(N_POINTS), n_series),
+        'y': rng.normal(size=n).reshape(n_series, -1).cumsum(axis=1).ravel(),
+        'series': np.repeat(np.arange(n_series), N_POINTS),
+        'kind': np.repeat(rng.choice(list('abc'), n_series), N_POINTS),
+        'value': rng.normal(size=n),
+    })
+
+
+def main(directory):
+    header = f"{'series':>8} {'paths':>9} {'time (s)':>9}"
+    print(header)
+    print('-' * len(header))
+    filename = os.path.join(directory, 'lines.png')
+    for n_series in N_SERIES:
+        df = make_data(n_series)
+        plots = {
+            'constant': (ggplot(df, aes('x', 'y', group='series',
+                                        color='kind'))
+                         + geom_line(alpha=0.2)),
+            'varying': (ggplot(df, aes('x', 'y', group='series',
+                                       color='value'))
+                        + geom_line(alpha=0.2)),
+        }
+        for kind, p in plots.items():
+            t = time.perf_counter()
+            p.save(filename, verbose=False)
+            t = time.perf_counter() - t
+            print(f'{n_series:>8} {kind:>9} {t:>9.2f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            main(directory)
@@ -0,0 +1,60 @@
+"""
+Benchmark drawing & saving large scatter plots with geom_point
+
+Compares drawing every point with drawing an aggregate image
+of the points (the ``aggregate_threshold`` parameter).
+
+Usage::
+
+    python tools/benchmarks/geom_point.py [output_directory]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_point, ggplot
+
+N_POINTS = [10_000, 100_000, 1_000_000, 5_000_000]
+FORMATS = ['png', 'pdf']
+
+
+def make_data(n, seed=123):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'g': rng.choice(list('abcd'), n),
+    })
+
+
+def main(directory):
+    header = (f"{'points':>9} {'mode':>10} {'format':>7} "
+              f"{'time (s)':>9} {'size (kB)':>10}")
+    print(header)
+    print('-' * len(header))
+    for n in N_POINTS:
+        df = make_data(n)
+        for mode, threshold in [('points', None), ('aggregate', 0)]:
+            if mode == 'points' and n > 1_000_000:
+                continue
+            p = (ggplot(df, aes('x', 'y', color='g'))
+                 + geom_point(alpha=0.1, aggregate_threshold=threshold))
+            for fmt in FORMATS:
+                filename = os.path.join(directory, f'scatter.{fmt}')
+                t = time.perf_counter()
+                p.save(filename, verbose=False)
+                t = time.perf_counter() - t
+                size = os.path.getsize(filename) / 1024
+                print(f'{n:>9} {mode:>10} {fmt:>7} {t:>9.2f} {size:>10.0f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            main(directory)
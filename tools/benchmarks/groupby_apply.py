@@ -0,0 +1,70 @@
+"""
+Benchmark the split-apply-combine of plotnine.utils.groupby_apply
+
+Compares it with iterating over a pandas groupby for increasing
+numbers of groups.
+
+Usage::
+
+    python tools/benchmarks/groupby_apply.py
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine.utils import groupby_apply
+
+N_ROWS = 300_000
+N_GROUPS = [1, 10, 1_000, 10_000, 100_000]
+
+
+def pandas_groupby_apply(df, cols, func):
+    lst = [func(d) for _, d in df.groupby(cols)]
+    return pd.concat(lst, axis=0, ignore_index=True)
+
+
+def identity(d):
+    return d
+
+
+def summarise(d):
+    return pd.DataFrame({'n': [len(d)], 'y': [d['y'].mean()]})
+
+
+def make_data(n_groups, seed=123):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'x': rng.normal(size=N_ROWS),
+        'y': rng.normal(size=N_ROWS),
+        'PANEL': pd.Categorical(rng.integers(1, n_groups+1, N_ROWS)),
+        'group': rng.integers(1, n_groups+1, N_ROWS),
+    })
+
+
+def best_time(fn, number=1, repeat=3):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main():
+    header = (f"{'groups':>8} {'func':>10} {'column':>8} "
+              f"{'pandas (s)':>12} {'plotnine (s)':>13} {'speedup':>8}")
+    print(header)
+    print('-' * len(header))
+    for n_groups in N_GROUPS:
+        df = make_data(n_groups)
+        repeat = 1 if n_groups >= 10_000 else 3
+        for func in (identity, summarise):
+            for col in ('PANEL', 'group'):
+                t0 = best_time(
+                    lambda: pandas_groupby_apply(df, col, func),
+                    repeat=repeat)
+                t1 = best_time(
+                    lambda: groupby_apply(df, col, func),
+                    repeat=repeat)
+                print(f'{n_groups:>8} {func.__name__:>10} {col:>8} '
+                      f'{t0:>12.4f} {t1:>13.4f} {t0/t1:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark splitting the layer data into panels and groups
+
+Times the build of plots of 1M rows with 5k groups in 4 panels, with
+the identity stat and with a stat that computes all the groups at
+once. Then times the splitting of the data by PANEL and group, when
+the data is sorted (as it is after a stat) and when it is not.
+
+Usage::
+
+    python tools/benchmarks/groups.py
+"""
+import timeit
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, ggplot, stat_ecdf
+from plotnine.utils import split_by_column
+
+N_ROWS = 1_000_000
+N_GROUPS = 5_000
+N_PANELS = 4
+
+
+def make_data(seed=123):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'x': rng.normal(size=N_ROWS),
+        'y': rng.normal(size=N_ROWS),
+        'g': rng.integers(N_GROUPS, size=N_ROWS),
+        'p': rng.integers(N_PANELS, size=N_ROWS),
+    })
+
+
+def time_build(p, number=1):
+    def build():
+        deepcopy(p)._build()
+    return min(timeit.repeat(build, number=number, repeat=3)) / number
+
+
+def time_split(df, col):
+    def split():
+        for _ in split_by_column(df, col):
+            pass
+    return min(timeit.repeat(split, number=1, repeat=3))
+
+
+def main():
+    df = make_data()
+    plots = {
+        'identity': (ggplot(df, aes('x', 'y', group='g'))
+                     + geom_point()
+                     + facet_wrap('p')),
+        'ecdf': (ggplot(df, aes('x', group='g'))
+                 + stat_ecdf()
+                 + facet_wrap('p')),
+    }
+
+    print(f'{N_ROWS} rows, {N_GROUPS} groups, {N_PANELS} panels')
+    header = f"{'':<24} {'time (s)':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, p in plots.items():
+        print(f'{"build " + name:<24} {time_build(p):>10.3f}')
+
+    # The layer data as it is after a stat, sorted by PANEL & group
+    p = deepcopy(plots['identity'])
+    p._build()
+    data = p.layers[0].data.sort_values(['PANEL', 'group'])
+    data = data.reset_index(drop=True)
+    shuffled = data.sample(frac=1, random_state=1)
+    for col in ('PANEL', 'group'):
+        print(f'{"split " + col + " (sorted)":<24} '
+              f'{time_split(data, col):>10.3f}')
+        print(f'{"split " + col + " (unsorted)":<24} '
+              f'{time_split(shuffled, col):>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark the id and lookup functions of plotnine.utils
+
+Times match, ninteraction (used to create the groups, panels and
+join keys) and compares match with a lookup in a dictionary of the
+values, for increasing numbers of rows.
+
+Usage::
+
+    python tools/benchmarks/ids.py
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine.utils import match, ninteraction
+
+N_ROWS = [100_000, 1_000_000, 10_000_000]
+N_LEVELS = 100
+# The dictionary lookup takes too long beyond this many rows
+MAX_ROWS_DICT = 1_000_000
+
+
+def dict_match(v1, v2, nomatch=-1):
+    lookup = {}
+    for i, x in enumerate(v2):
+        if x not in lookup:
+            lookup[x] = i
+    return np.array([lookup.get(x, nomatch) for x in v1])
+
+
+def best_time(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    header = (f"{'rows':>10} {'function':>28} {'time (s)':>10}")
+    print(header)
+    print('-' * len(header))
+    rng = np.random.default_rng(123)
+    levels = [f'level-{i}' for i in range(N_LEVELS)]
+    for n in N_ROWS:
+        df = pd.DataFrame({
+            'a': rng.choice(levels, n),
+            'b': rng.integers(0, 10, n),
+            'c': pd.Categorical(rng.choice(list('abcde'), n)),
+        })
+        repeat = 1 if n >= 10_000_000 else 3
+        cases = [
+            ('match (strings)', lambda: match(df['a'], levels)),
+            ('match (integers)', lambda: match(df['b'], range(10))),
+            ('ninteraction (1 column)',
+             lambda: ninteraction(df[['a']], drop=True)),
+            ('ninteraction (3 columns)',
+             lambda: ninteraction(df, drop=True)),
+        ]
+        if n <= MAX_ROWS_DICT:
+            cases.insert(
+                1, ('dict lookup (strings)',
+                    lambda: dict_match(df['a'], levels)))
+        for name, fn in cases:
+            print(f'{n:>10} {name:>28} {best_time(fn, repeat):>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
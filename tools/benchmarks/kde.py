@@ -0,0 +1,66 @@
+"""
+Benchmark the 2D kernel density estimation backends
+
+Times the computation of stat_density_2d (density on a grid) and
+stat_pointdensity (density at each point) with the kde packages,
+and reports the largest error relative to scipy.
+
+Usage::
+
+    python tools/benchmarks/kde.py
+"""
+import timeit
+
+import numpy as np
+
+from plotnine.stats.density import kde
+
+N_POINTS = [1_000, 10_000, 100_000]
+PACKAGES = ['scipy', 'statsmodels-m', 'fft']
+# Skip the slow packages when the number of data points times
+# the number of evaluation points is larger than these
+MAX_WORK = {'scipy': 1e9, 'statsmodels-m': 1e8}
+GRID_SIZE = 64
+
+
+def make_grid(data, n):
+    x = np.linspace(data[:, 0].min(), data[:, 0].max(), n)
+    y = np.linspace(data[:, 1].min(), data[:, 1].max(), n)
+    X, Y = np.meshgrid(x, y)
+    return np.array([X.flatten(), Y.flatten()]).T
+
+
+def main():
+    header = (f"{'points':>8} {'eval':>6} {'package':>14} "
+              f"{'time (s)':>10} {'rel. error':>11}")
+    print(header)
+    print('-' * len(header))
+    rng = np.random.default_rng(123)
+    for n in N_POINTS:
+        data = rng.normal(size=(n, 2))
+        data[:, 1] += data[:, 0]
+        for kind, grid in [('grid', make_grid(data, GRID_SIZE)),
+                           ('points', data)]:
+            expected = None
+            for package in PACKAGES:
+                if n * len(grid) > MAX_WORK.get(package, np.inf):
+                    continue
+                kwargs = {}
+                if package == 'statsmodels-m':
+                    kwargs = {'var_type': 'cc'}
+                start = timeit.default_timer()
+                result = kde(data, grid, package, **kwargs)
+                t = timeit.default_timer() - start
+                if package == 'scipy':
+                    expected = result
+                if expected is None:
+                    error = ''
+                else:
+                    diff = np.abs(result - expected).max()
+                    error = f'{diff / expected.max():.1e}'
+                print(f'{n:>8} {kind:>6} {package:>14} '
+                      f'{t:>10.4f} {error:>11}')
+
+
+if __name__ == '__main__':
+    main()
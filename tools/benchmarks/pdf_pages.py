@@ -0,0 +1,68 @@
+"""
+Benchmark saving many plots as the pages of a PDF file
+
+Saves increasing numbers of pages with save_as_pdf_pages, drawing
+the plots in this thread and ahead in a pool of threads, and
+reports the pages per second and the peak memory. The peak memory
+should not grow with the number of pages.
+
+Usage::
+
+    python tools/benchmarks/pdf_pages.py
+"""
+import os
+import resource
+import tempfile
+import timeit
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_point, ggplot, ggtitle
+from plotnine.ggplot import save_as_pdf_pages
+
+N_PAGES = [50, 200, 800]
+
+
+def make_plots(n, seed=123):
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        df = pd.DataFrame({
+            'x': rng.normal(size=500),
+            'y': rng.normal(size=500),
+        })
+        yield ggplot(df, aes('x', 'y')) + geom_point() + ggtitle(f'{i}')
+
+
+def peak_memory_mb():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    header = (f"{'pages':>6} {'mode':>10} {'pages/s':>8} "
+              f"{'peak memory (MB)':>17}")
+    print(header)
+    print('-' * len(header))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'pages.pdf')
+        for n in N_PAGES:
+            for mode in ['serial', 'threads']:
+                executor = ThreadPoolExecutor(2) if mode == 'threads' else None
+                start = timeit.default_timer()
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    save_as_pdf_pages(
+                        make_plots(n), filename, executor=executor
+                    )
+                duration = timeit.default_timer() - start
+                if executor:
+                    executor.shutdown()
+                print(f'{n:>6} {mode:>10} {n/duration:>8.1f} '
+                      f'{peak_memory_mb():>17.1f}')
+
+
+if __name__ == '__main__':
+    main()
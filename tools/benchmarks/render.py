@@ -0,0 +1,73 @@
+"""
+Benchmark rendering plots to bytes, as a server would
+
+Renders plots to PNG & SVG in memory with ggplot.to_bytes, one at
+a time and from a pool of threads, and reports the throughput and
+the peak memory after each batch. The peak memory should not keep
+growing, the figures are released after they are saved.
+
+Usage::
+
+    python tools/benchmarks/render.py
+"""
+import os
+import resource
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, geom_smooth, ggplot
+
+N_BATCHES = 4
+BATCH_SIZE = 20
+N_THREADS = os.cpu_count() or 1
+
+
+def make_plot(seed):
+    rng = np.random.default_rng(seed)
+    n = 2_000
+    df = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'y': rng.normal(size=n),
+        'g': rng.choice(list('abcd'), n),
+    })
+    return (ggplot(df, aes('x', 'y', color='g'))
+            + geom_point()
+            + geom_smooth(method='lm')
+            + facet_wrap('g'))
+
+
+def peak_memory_mb():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    plots = [make_plot(i) for i in range(BATCH_SIZE)]
+    header = (f"{'format':>6} {'mode':>12} {'batch':>6} "
+              f"{'plots/s':>8} {'peak memory (MB)':>17}")
+    print(header)
+    print('-' * len(header))
+    for fmt in ['png', 'svg']:
+        def render(plot):
+            return plot.to_bytes(fmt, dpi=100)
+
+        for mode, threads in [('serial', 0), ('threads', N_THREADS)]:
+            for batch in range(N_BATCHES):
+                start = timeit.default_timer()
+                if threads:
+                    with ThreadPoolExecutor(threads) as executor:
+                        list(executor.map(render, plots))
+                else:
+                    list(map(render, plots))
+                duration = timeit.default_timer() - start
+                name = f'{mode}({threads})' if threads else mode
+                print(f'{fmt:>6} {name:>12} {batch:>6} '
+                      f'{len(plots)/duration:>8.1f} '
+                      f'{peak_memory_mb():>17.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark rendering many small plots with plotnine.render_plots
+
+Compares rendering the plots to PNG one after the other in this
+process (ggplot.to_bytes in a loop) with rendering them in a pool
+of worker processes, and reports the throughput.
+
+Usage::
+
+    python tools/benchmarks/render_plots.py
+"""
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_col, geom_line, ggplot, ggtitle, render_plots
+
+N_PLOTS = [20, 100]
+WORKERS = sorted({1, 2, os.cpu_count() or 1})
+
+
+def make_plots(n, seed=123):
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        df = pd.DataFrame({
+            'x': np.arange(24),
+            'y': rng.normal(size=24).cumsum(),
+        })
+        yield (ggplot(df, aes('x', 'y'))
+               + geom_col(alpha=.3)
+               + geom_line()
+               + ggtitle(f'Report {i}'))
+
+
+def main():
+    header = (f"{'plots':>6} {'mode':>12} {'time (s)':>10} {'plots/s':>8}")
+    print(header)
+    print('-' * len(header))
+    for n in N_PLOTS:
+        start = timeit.default_timer()
+        for plot in make_plots(n):
+            plot.to_bytes(dpi=72)
+        duration = timeit.default_timer() - start
+        print(f'{n:>6} {"loop":>12} {duration:>10.2f} {n/duration:>8.1f}')
+
+        for workers in WORKERS:
+            start = timeit.default_timer()
+            render_plots(make_plots(n), max_workers=workers, dpi=72)
+            duration = timeit.default_timer() - start
+            mode = f'workers({workers})'
+            print(f'{n:>6} {mode:>12} {duration:>10.2f} {n/duration:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark stacking the data of a panel with many x positions
+
+Compares :class:`~plotnine.positions.position_stack` stacking each
+x position in turn (with ``strategy``), to stacking all of them at
+once (with ``strategy_groups``), for an area chart of several
+series.
+
+Usage::
+
+    python tools/benchmarks/stack.py
+"""
+import timeit
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from mizani.transforms import identity_trans
+
+from plotnine.positions import position_stack
+
+N_POSITIONS = [100, 1000, 10000]
+N_SERIES = 20
+
+
+class position_stack_each(position_stack):
+    """
+    Stack that applies the strategy to each x position
+    """
+    strategy = staticmethod(position_stack.strategy)
+
+
+def make_data(n_positions):
+    x = np.repeat(np.arange(n_positions, dtype=float), N_SERIES)
+    random_state = np.random.RandomState(123)
+    return pd.DataFrame({
+        'x': x,
+        'y': random_state.normal(0, 1, len(x)),
+        'group': np.tile(np.arange(1, N_SERIES+1), n_positions),
+        'PANEL': pd.Categorical(np.ones(len(x), dtype=int)),
+    })
+
+
+def run(klass, data):
+    scales = SimpleNamespace(y=SimpleNamespace(trans=identity_trans()))
+    pos = klass()
+    params = pos.setup_params(data)
+    data = pos.setup_data(data.copy(), params)
+    # As when the layer computes the positions
+    with pd.option_context('mode.chained_assignment', None):
+        return min(timeit.repeat(
+            lambda: klass.compute_panel(data.copy(), scales, params),
+            number=1, repeat=3))
+
+
+def main():
+    header = (f"{'positions':>10} {'stack each (s)':>15} "
+              f"{'stack (s)':>10} {'speedup':>8}")
+    print(header)
+    print('-' * len(header))
+    for n_positions in N_POSITIONS:
+        data = make_data(n_positions)
+        t0 = run(position_stack_each, data)
+        t1 = run(position_stack, data)
+        print(f'{n_positions:>10} {t0:>15.4f} {t1:>10.4f} '
+              f'{t0/t1:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
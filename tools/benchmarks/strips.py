@@ -0,0 +1,76 @@
+"""
+Benchmark drawing the strips of plots with many panels
+
+Compares drawing the background of each strip as a patch in its
+panel, to drawing the backgrounds as one collection (the
+``collect_strips`` option). It reports the time to render the
+strip artists (backgrounds and labels) of the figure, and the
+number of strip artists.
+
+Usage::
+
+    python tools/benchmarks/strips.py
+"""
+import timeit
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, ggplot, options, theme
+
+N_PANELS = [25, 100, 400]
+STRIP_THEMEABLES = ('strip_background_x', 'strip_text_x')
+
+
+def make_plot(n_panels):
+    df = pd.DataFrame({
+        'x': np.arange(n_panels),
+        'y': np.arange(n_panels),
+        'f': np.arange(n_panels),
+    })
+    return (ggplot(df, aes('x', 'y'))
+            + geom_point()
+            + facet_wrap('f')
+            + theme(figure_size=(16, 16)))
+
+
+def render_strips(figure, artists):
+    renderer = figure.canvas.get_renderer()
+    for artist in artists:
+        artist.draw(renderer)
+
+
+def run(p, collect):
+    old = options.set_option('collect_strips', collect)
+    try:
+        figure = p.draw()
+    finally:
+        options.set_option('collect_strips', old)
+
+    artists = [
+        artist
+        for name in STRIP_THEMEABLES
+        for artist in figure._themeable[name]
+    ]
+    duration = min(timeit.repeat(
+        lambda: render_strips(figure, artists), number=1, repeat=3))
+    plt.close(figure)
+    return duration, len(artists)
+
+
+def main():
+    header = (f"{'panels':>8} {'strips':>10} {'render (s)':>11} "
+              f"{'artists':>9}")
+    print(header)
+    print('-' * len(header))
+    for n_panels in N_PANELS:
+        p = make_plot(n_panels)
+        for collect, name in ((False, 'patches'), (True, 'collected')):
+            duration, n_artists = run(p, collect)
+            print(f'{n_panels:>8} {name:>10} {duration:>11.4f} '
+                  f'{n_artists:>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark applying the theme to the panels of a plot
+
+Compares applying each themeable in turn, to applying the
+resolved themeables (see ``Themeables.resolve``), for plots
+with an increasing number of panels. It also reports the time
+of the ``apply_theme`` stage when drawing the plot.
+
+Usage::
+
+    python tools/benchmarks/theme_apply.py
+"""
+import timeit
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, facet_wrap, geom_point, ggplot, theme_gray
+
+N_PANELS = [1, 16, 100, 400]
+
+
+def make_plot(n_panels):
+    df = pd.DataFrame({
+        'x': np.arange(n_panels),
+        'y': np.arange(n_panels),
+        'f': np.arange(n_panels),
+    })
+    return (ggplot(df, aes('x', 'y'))
+            + geom_point()
+            + facet_wrap('f')
+            + theme_gray())
+
+
+def apply_each(theme, figure, axs):
+    for th in theme.themeables.values():
+        th.apply_figure(figure)
+        for ax in axs:
+            th.apply(ax)
+
+
+def main():
+    header = (f"{'panels':>8} {'each (s)':>10} {'resolved (s)':>13} "
+              f"{'speedup':>8} {'in draw (s)':>12}")
+    print(header)
+    print('-' * len(header))
+    for n_panels in N_PANELS:
+        p = make_plot(n_panels)
+        report = p.profile()
+        t2 = report.summary().loc['apply_theme', 'time']
+        plt.close('all')
+
+        figure = p.draw()
+        axs = figure.axes
+        t0 = min(timeit.repeat(lambda: apply_each(p.theme, figure, axs),
+                               number=1, repeat=3))
+        t1 = min(timeit.repeat(lambda: p.theme.apply(figure, axs),
+                               number=1, repeat=3))
+        plt.close(figure)
+        print(f'{n_panels:>8} {t0:>10.4f} {t1:>13.4f} '
+              f'{t0/t1:>7.1f}x {t2:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()